@@ -1,27 +1,247 @@
-"""Redis cache utilities."""
+"""Redis cache utilities.
+
+Hot namespaces are served from a size-bounded, in-process L1 layer in
+front of Redis (L2). Writes and deletes publish the key on a Redis pub/sub
+channel so other workers drop their stale L1 copies. Values are stored in
+Redis in the binary format of app.core.cache_codec.
+
+Redis calls go through a circuit breaker with tight timeouts. While Redis
+is failing, reads fall back to L1 and writes only update L1, so an
+outage costs milliseconds instead of failing requests.
+
+Expensive misses go through cache_compute_once, which coalesces
+concurrent computations of the same key within a worker (shared future)
+and across workers (Redis SET NX lease). cache_get_or_compute adds
+stale-while-revalidate on top for slow, LLM-derived values.
+
+bump_namespace invalidates a whole namespace in O(1) by incrementing its
+generation (see app.core.cache_keys); workers learn about new generations
+over the same pub/sub channel.
+
+Outcomes, payload sizes and Redis latencies are recorded per namespace in
+app.core.cache_metrics.
+"""
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import Any, Optional
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional, TypeVar
 
 import redis.asyncio as redis
 
+from .cache_codec import CacheCodecError, get_codec
+from .cache_keys import get_namespace_generation, key_namespace, set_namespace_generations
+from .cache_metrics import get_cache_metrics
 from .config import get_settings
 
 settings = get_settings()
 
+T = TypeVar("T")
+
 # Redis client singleton
 _redis_client: Optional[redis.Redis] = None
 
 
+@dataclass(frozen=True)
+class L1Policy:
+    """In-process cache policy for one key namespace."""
+
+    max_entries: int
+    ttl: float  # seconds; bounds staleness if an invalidation is missed
+
+
+# Namespaces (key prefix before the first ":") cached in-process
+L1_POLICIES: dict[str, L1Policy] = {
+    "word_info": L1Policy(max_entries=10000, ttl=600),
+    "translate": L1Policy(max_entries=5000, ttl=300),
+    "explain": L1Policy(max_entries=1000, ttl=600),
+    "answer": L1Policy(max_entries=1000, ttl=600),
+    "tokens": L1Policy(max_entries=5000, ttl=600),
+}
+
+# Identifies this worker's own invalidation messages
+WORKER_ID = uuid.uuid4().hex
+
+
+class LocalCache:
+    """Per-namespace LRU caches with a TTL, holding decoded values.
+
+    Cached values are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, policies: dict[str, L1Policy]):
+        self.policies = policies
+        self._entries: dict[str, OrderedDict[str, tuple[float, Any]]] = {
+            namespace: OrderedDict() for namespace in policies
+        }
+
+    def _namespace(self, key: str) -> Optional[OrderedDict[str, tuple[float, Any]]]:
+        return self._entries.get(key_namespace(key))
+
+    def handles(self, key: str) -> bool:
+        """Check whether key belongs to an L1-cached namespace."""
+        return self._namespace(key) is not None
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Get (found, value) for key."""
+        entries = self._namespace(key)
+        if entries is None:
+            return False, None
+        entry = entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del entries[key]
+            return False, None
+        entries.move_to_end(key)
+        return True, value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value, evicting the least recently used entries if full."""
+        namespace = key_namespace(key)
+        entries = self._entries.get(namespace)
+        if entries is None:
+            return
+        policy = self.policies[namespace]
+        lifetime = policy.ttl if ttl is None else min(ttl, policy.ttl)
+        entries[key] = (time.monotonic() + lifetime, value)
+        entries.move_to_end(key)
+        while len(entries) > policy.max_entries:
+            entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Drop key if cached."""
+        entries = self._namespace(key)
+        if entries is not None:
+            entries.pop(key, None)
+
+    def clear_namespace(self, namespace: str) -> None:
+        """Drop every entry of one namespace."""
+        entries = self._entries.get(namespace)
+        if entries is not None:
+            entries.clear()
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        for entries in self._entries.values():
+            entries.clear()
+
+
+class CacheUnavailableError(Exception):
+    """Raised when Redis is unreachable, slow, or the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Stop calling a failing dependency and probe it before resuming.
+
+    Closed: calls pass through; consecutive failures are counted.
+    Open: calls fail fast until reset_seconds have passed.
+    Half-open: a single probe call is let through; success closes the
+    breaker, failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int, reset_seconds: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+
+    def allow(self) -> bool:
+        """Check whether a call may be attempted now."""
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_seconds:
+                return False
+            self.state = self.HALF_OPEN
+        # Half-open: one probe at a time
+        if self._probing:
+            return False
+        self._probing = True
+        return True
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        if self.state != self.CLOSED:
+            print(f"{self.name} circuit breaker closed")
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self, error: BaseException) -> None:
+        """Record a failed call."""
+        self._probing = False
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                print(f"{self.name} circuit breaker opened: {error!r}")
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+
+_local_cache = LocalCache(L1_POLICIES if settings.enable_l1_cache else {})
+
+_breaker = CircuitBreaker(
+    "Redis",
+    failure_threshold=settings.redis_breaker_failure_threshold,
+    reset_seconds=settings.redis_breaker_reset_seconds,
+)
+
+# Redis hash of namespace -> generation (never expires)
+GENERATIONS_KEY = "cache_generations"
+
+# Background pub/sub listener
+_invalidation_task: Optional[asyncio.Task] = None
+
+_metrics = get_cache_metrics()
+
+# In-flight single-flight computations in this worker, by cache key
+_inflight: dict[str, asyncio.Future] = {}
+
+# How often followers poll for a value computed by another worker
+LEASE_POLL_SECONDS = 0.05
+
+# Keys per pipelined round trip when sampling key sizes
+SAMPLE_BATCH_SIZE = 50
+
+# Marks values stored by cache_get_or_compute with a freshness deadline
+SWR_MARKER = "__swr__"
+
+# Keys being refreshed in the background by this worker, and their tasks
+_refreshing: set[str] = set()
+_background_tasks: set[asyncio.Task] = set()
+
+# Delete a lock/lease only if we still hold it (it may have expired and moved on)
+_RELEASE_LEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
 async def get_redis() -> redis.Redis:
     """Get Redis client instance."""
     global _redis_client
     if _redis_client is None:
+        # Values are binary (see cache_codec), so responses stay as bytes
         _redis_client = redis.from_url(
             settings.redis_url,
             encoding="utf-8",
-            decode_responses=True,
+            decode_responses=False,
+            socket_connect_timeout=settings.redis_connect_timeout_seconds,
         )
     return _redis_client
 
@@ -34,30 +254,810 @@ async def close_redis() -> None:
         _redis_client = None
 
 
-async def cache_get(key: str) -> Optional[Any]:
-    """Get value from cache."""
-    client = await get_redis()
-    value = await client.get(key)
+def get_local_cache() -> LocalCache:
+    """Get the in-process (L1) cache."""
+    return _local_cache
+
+
+def get_breaker() -> CircuitBreaker:
+    """Get the Redis circuit breaker."""
+    return _breaker
+
+
+async def _call(operation: Callable[[redis.Redis], Awaitable[T]]) -> T:
+    """
+    Run a Redis operation through the circuit breaker with a timeout.
+
+    Raises:
+        CacheUnavailableError: If the breaker is open or the call fails
+    """
+    if not _breaker.allow():
+        raise CacheUnavailableError("Redis circuit breaker is open")
+    try:
+        client = await get_redis()
+        result = await asyncio.wait_for(
+            operation(client), timeout=settings.redis_op_timeout_seconds
+        )
+    except asyncio.CancelledError:
+        _breaker._probing = False
+        raise
+    except Exception as e:
+        _breaker.record_failure(e)
+        raise CacheUnavailableError(str(e) or type(e).__name__) from e
+    _breaker.record_success()
+    return result
+
+
+def get_cache_stats() -> dict[str, dict[str, Any]]:
+    """
+    Get cache_get hit rates per namespace for this worker.
+
+    Returns:
+        {namespace: {"l1_hits", "hits", "misses", "hit_rate"}}, where hits
+        includes L1 hits
+    """
+    stats = {}
+    for namespace, counts in _metrics.counters.items():
+        hits = counts["l1_hits"] + counts["hits"]
+        total = hits + counts["misses"]
+        stats[namespace] = {
+            "l1_hits": counts["l1_hits"],
+            "hits": hits,
+            "misses": counts["misses"],
+            "hit_rate": hits / total if total else 0.0,
+        }
+    return stats
+
+
+async def _publish_invalidation(keys: list[str]) -> None:
+    """Tell other workers to drop keys from their L1 caches."""
+    keys = [key for key in keys if _local_cache.handles(key)]
+    if not keys:
+        return
+    message = json.dumps({"origin": WORKER_ID, "keys": keys})
+    await _call(lambda client: client.publish(settings.cache_invalidation_channel, message))
+
+
+def _apply_generations(generations: dict[str, int]) -> None:
+    """Adopt newer namespace generations and drop L1 entries they invalidate."""
+    changed = [
+        namespace
+        for namespace, generation in generations.items()
+        if generation > get_namespace_generation(namespace)
+    ]
+    set_namespace_generations(generations)
+    for namespace in changed:
+        _local_cache.clear_namespace(namespace)
+
+
+async def refresh_namespace_generations() -> dict[str, int]:
+    """
+    Load namespace generations from Redis.
+
+    Returns:
+        {namespace: generation} as stored in Redis
+
+    Raises:
+        CacheUnavailableError: If Redis is unavailable
+    """
+    stored = await _call(lambda client: client.hgetall(GENERATIONS_KEY))
+    generations = {
+        namespace.decode("utf-8"): int(generation) for namespace, generation in stored.items()
+    }
+    _apply_generations(generations)
+    return generations
+
+
+async def bump_namespace(namespace: str) -> int:
+    """
+    Invalidate every key of a namespace by moving it to a new generation.
+
+    Old keys are left to expire on their TTLs. Other workers switch to the
+    new generation when the invalidation message reaches them.
+
+    Args:
+        namespace: Key namespace, e.g. "word_info"
+
+    Returns:
+        The new generation
+
+    Raises:
+        CacheUnavailableError: If Redis is unavailable
+    """
+    generation = await _call(lambda client: client.hincrby(GENERATIONS_KEY, namespace, 1))
+    known = get_namespace_generation(namespace)
+    if generation <= known:
+        # The hash was lost (flush/eviction); never reuse a generation
+        generation = known + 1
+        await _call(lambda client: client.hset(GENERATIONS_KEY, namespace, generation))
+    _apply_generations({namespace: generation})
+    message = json.dumps({"origin": WORKER_ID, "generations": {namespace: generation}})
+    await _call(lambda client: client.publish(settings.cache_invalidation_channel, message))
+    return generation
+
+
+async def _listen_for_invalidations() -> None:
+    """Apply invalidations published by other workers, reconnecting on errors."""
+    while True:
+        pubsub = None
+        try:
+            client = await get_redis()
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            await pubsub.subscribe(settings.cache_invalidation_channel)
+            # Entries cached while unsubscribed may have missed invalidations
+            _local_cache.clear()
+            await refresh_namespace_generations()
+            async for message in pubsub.listen():
+                try:
+                    data = json.loads(message["data"])
+                except (TypeError, ValueError):
+                    continue
+                if data.get("origin") == WORKER_ID:
+                    continue
+                for key in data.get("keys", []):
+                    _local_cache.delete(key)
+                if data.get("generations"):
+                    _apply_generations(data["generations"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Cache invalidation listener error: {e}")
+            await asyncio.sleep(1)
+        finally:
+            if pubsub is not None:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+
+def start_invalidation_listener() -> None:
+    """Start listening for cross-worker L1 and namespace invalidations."""
+    global _invalidation_task
+    if _invalidation_task is None:
+        _invalidation_task = asyncio.get_running_loop().create_task(
+            _listen_for_invalidations()
+        )
+
+
+async def stop_invalidation_listener() -> None:
+    """Stop the invalidation listener."""
+    global _invalidation_task
+    if _invalidation_task is not None:
+        _invalidation_task.cancel()
+        try:
+            await _invalidation_task
+        except asyncio.CancelledError:
+            pass
+        _invalidation_task = None
+
+
+async def _get(key: str, record: bool) -> Optional[Any]:
+    found, value = _local_cache.get(key)
+    if found:
+        if record:
+            _metrics.incr(key, "l1_hits")
+        return value
+
+    started = time.perf_counter()
+    try:
+        value = await _call(lambda client: client.get(key))
+        _metrics.observe(key, "get", time.perf_counter() - started)
+    except CacheUnavailableError:
+        _metrics.incr(key, "errors")
+        value = None  # Degrade to a miss; L1 was already checked
+    decoded = None
     if value:
-        return json.loads(value)
-    return None
+        _metrics.incr(key, "bytes_read", len(value))
+        try:
+            decoded = get_codec().decode(value)
+        except CacheCodecError as e:
+            _metrics.incr(key, "errors")
+            print(f"Cache decode error for {key}: {e}")
+    if decoded is None:
+        if record:
+            _metrics.incr(key, "misses")
+        return None
+    if record:
+        _metrics.incr(key, "hits")
+    _local_cache.set(key, decoded)
+    return decoded
+
+
+async def cache_get(key: str) -> Optional[Any]:
+    """Get value from cache (L1, then Redis)."""
+    return await _get(key, record=True)
 
 
 async def cache_set(key: str, value: Any, ttl: Optional[int] = None) -> None:
-    """Set value in cache with optional TTL."""
-    client = await get_redis()
+    """
+    Set value in cache with optional TTL.
+
+    If Redis is unavailable only the in-process copy is updated.
+    """
     if ttl is None:
         ttl = settings.cache_ttl
-    await client.setex(key, ttl, json.dumps(value))
+    _local_cache.set(key, value, ttl)
+    data = get_codec().encode(value)
+    started = time.perf_counter()
+    try:
+        await _call(lambda client: client.setex(key, ttl, data))
+        _metrics.observe(key, "set", time.perf_counter() - started)
+        _metrics.incr(key, "sets")
+        _metrics.incr(key, "bytes_written", len(data))
+        await _publish_invalidation([key])
+    except CacheUnavailableError:
+        _metrics.incr(key, "errors")
+
+
+async def cache_get_many(keys: list[str]) -> list[Optional[Any]]:
+    """
+    Get several values at once (L1, then a single Redis MGET).
+
+    Returns:
+        Values aligned with keys, None for misses
+    """
+    values: list[Optional[Any]] = [None] * len(keys)
+    remote: list[int] = []
+    for i, key in enumerate(keys):
+        found, value = _local_cache.get(key)
+        if found:
+            _metrics.incr(key, "l1_hits")
+            values[i] = value
+        else:
+            remote.append(i)
+    if not remote:
+        return values
+
+    remote_keys = [keys[i] for i in remote]
+    started = time.perf_counter()
+    try:
+        raw = await _call(lambda client: client.mget(remote_keys))
+        # One round trip, one observation (under the first key's namespace)
+        _metrics.observe(remote_keys[0], "mget", time.perf_counter() - started)
+    except CacheUnavailableError:
+        for key in remote_keys:
+            _metrics.incr(key, "errors")
+        raw = [None] * len(remote)
+
+    codec = get_codec()
+    for i, data in zip(remote, raw):
+        key = keys[i]
+        if data:
+            _metrics.incr(key, "bytes_read", len(data))
+            try:
+                values[i] = codec.decode(data)
+            except CacheCodecError as e:
+                _metrics.incr(key, "errors")
+                print(f"Cache decode error for {key}: {e}")
+        if values[i] is None:
+            _metrics.incr(key, "misses")
+        else:
+            _metrics.incr(key, "hits")
+            _local_cache.set(key, values[i])
+    return values
+
+
+async def cache_set_many(items: dict[str, Any], ttl: Optional[int] = None) -> None:
+    """Set several values with the same TTL in one pipelined round trip."""
+    if not items:
+        return
+    if ttl is None:
+        ttl = settings.cache_ttl
+    codec = get_codec()
+    encoded = {key: codec.encode(value) for key, value in items.items()}
+    for key, value in items.items():
+        _local_cache.set(key, value, ttl)
+
+    async def set_all(client: redis.Redis) -> None:
+        async with client.pipeline(transaction=False) as pipe:
+            for key, data in encoded.items():
+                pipe.setex(key, ttl, data)
+            await pipe.execute()
+
+    started = time.perf_counter()
+    try:
+        await _call(set_all)
+        elapsed = time.perf_counter() - started
+        for key, data in encoded.items():
+            _metrics.observe(key, "set", elapsed)
+            _metrics.incr(key, "sets")
+            _metrics.incr(key, "bytes_written", len(data))
+        await _publish_invalidation(list(encoded))
+    except CacheUnavailableError:
+        for key in encoded:
+            _metrics.incr(key, "errors")
 
 
 async def cache_delete(key: str) -> None:
-    """Delete value from cache."""
-    client = await get_redis()
-    await client.delete(key)
+    """Delete value from cache (in-process copy only if Redis is unavailable)."""
+    _local_cache.delete(key)
+    try:
+        await _call(lambda client: client.delete(key))
+        await _publish_invalidation([key])
+    except CacheUnavailableError as e:
+        _metrics.incr(key, "errors")
+        print(f"Cache delete of {key} not applied to Redis: {e}")
 
 
 async def cache_exists(key: str) -> bool:
-    """Check if key exists in cache."""
-    client = await get_redis()
-    return await client.exists(key) > 0
+    """
+    Check if key exists in cache.
+
+    Raises:
+        CacheUnavailableError: If Redis is unavailable and the key is not in L1
+    """
+    found, _ = _local_cache.get(key)
+    if found:
+        return True
+    return await _call(lambda client: client.exists(key)) > 0
+
+
+async def cache_incr(key: str, ttl: Optional[int] = None) -> int:
+    """
+    Increment a counter, refreshing its TTL, and return the new value.
+
+    Raises:
+        CacheUnavailableError: If Redis is unavailable
+    """
+    if ttl is None:
+        ttl = settings.cache_ttl
+
+    async def incr(client: redis.Redis) -> int:
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.incr(key)
+            pipe.expire(key, ttl)
+            value, _ = await pipe.execute()
+        return int(value)
+
+    return await _call(incr)
+
+
+async def cache_list_set(key: str, values: list[Any], ttl: Optional[int] = None) -> None:
+    """Replace a cached list with the given values."""
+    if ttl is None:
+        ttl = settings.cache_ttl
+    codec = get_codec()
+    encoded = [codec.encode(v) for v in values]
+
+    async def replace(client: redis.Redis) -> None:
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            if encoded:
+                pipe.rpush(key, *encoded)
+                pipe.expire(key, ttl)
+            await pipe.execute()
+
+    await _call(replace)
+
+
+async def cache_list_append(
+    key: str, value: Any, max_length: int, ttl: Optional[int] = None
+) -> None:
+    """
+    Append to a cached list, keeping only the last max_length items.
+
+    Does nothing if the list is not cached, so a partial list is never
+    created; readers rebuild it from the source of truth instead.
+    """
+    if ttl is None:
+        ttl = settings.cache_ttl
+    encoded = get_codec().encode(value)
+
+    async def append(client: redis.Redis) -> None:
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.rpushx(key, encoded)
+            pipe.ltrim(key, -max_length, -1)
+            pipe.expire(key, ttl)
+            await pipe.execute()
+
+    await _call(append)
+
+
+async def cache_list_get(key: str) -> Optional[list[Any]]:
+    """Get a cached list, or None if it is not cached."""
+    started = time.perf_counter()
+    values = await _call(lambda client: client.lrange(key, 0, -1))
+    _metrics.observe(key, "lrange", time.perf_counter() - started)
+    if not values:
+        _metrics.incr(key, "misses")
+        return None
+    _metrics.incr(key, "bytes_read", sum(len(v) for v in values))
+    codec = get_codec()
+    try:
+        decoded = [codec.decode(v) for v in values]
+    except CacheCodecError as e:
+        # Treat as a miss so the caller rebuilds the list
+        _metrics.incr(key, "errors")
+        _metrics.incr(key, "misses")
+        print(f"Cache decode error for {key}: {e}")
+        return None
+    _metrics.incr(key, "hits")
+    return decoded
+
+
+async def cache_zincr(
+    key: str, member: str, amount: float = 1, ttl: Optional[int] = None
+) -> None:
+    """Increment a member's score in a sorted set, refreshing its TTL."""
+    if ttl is None:
+        ttl = settings.cache_ttl
+
+    async def incr(client: redis.Redis) -> None:
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.zincrby(key, amount, member)
+            pipe.expire(key, ttl)
+            await pipe.execute()
+
+    await _call(incr)
+
+
+async def cache_ztop(key: str, limit: int) -> list[tuple[str, float]]:
+    """Get the highest-scored members of a sorted set, highest first."""
+    entries = await _call(lambda client: client.zrevrange(key, 0, limit - 1, withscores=True))
+    return [(member.decode("utf-8"), score) for member, score in entries]
+
+
+async def _random_keys(client: redis.Redis, count: int) -> list[Optional[bytes]]:
+    async with client.pipeline(transaction=False) as pipe:
+        for _ in range(count):
+            pipe.randomkey()
+        return await pipe.execute()
+
+
+async def _memory_usage(client: redis.Redis, keys: list[bytes]) -> list[Optional[int]]:
+    async with client.pipeline(transaction=False) as pipe:
+        for key in keys:
+            pipe.memory_usage(key)
+        return await pipe.execute()
+
+
+async def sample_key_sizes(samples: int = 200, top: int = 20) -> dict[str, Any]:
+    """
+    Estimate key sizes from a random sample of Redis keys.
+
+    Uses RANDOMKEY and MEMORY USAGE in small pipelined batches, so it is
+    cheap enough to run against production.
+
+    Args:
+        samples: Number of random keys to draw (duplicates are dropped)
+        top: Number of largest sampled keys to list
+
+    Returns:
+        {"sampled", "namespaces": {namespace: {"keys", "avg_bytes",
+        "max_bytes", "oversized"}}, "largest": [{"key", "bytes"}]}
+
+    Raises:
+        CacheUnavailableError: If Redis is unavailable
+    """
+    keys: set[bytes] = set()
+    for start in range(0, samples, SAMPLE_BATCH_SIZE):
+        count = min(SAMPLE_BATCH_SIZE, samples - start)
+        drawn = await _call(lambda client: _random_keys(client, count))
+        keys.update(key for key in drawn if key is not None)
+
+    sizes: list[tuple[str, int]] = []
+    ordered = list(keys)
+    for start in range(0, len(ordered), SAMPLE_BATCH_SIZE):
+        batch = ordered[start : start + SAMPLE_BATCH_SIZE]
+        measured = await _call(lambda client: _memory_usage(client, batch))
+        for key, size in zip(batch, measured):
+            if size is not None:
+                sizes.append((key.decode("utf-8", errors="replace"), int(size)))
+
+    namespaces: dict[str, dict[str, Any]] = {}
+    for key, size in sizes:
+        entry = namespaces.setdefault(
+            _metrics.namespace(key), {"keys": 0, "total_bytes": 0, "max_bytes": 0, "oversized": 0}
+        )
+        entry["keys"] += 1
+        entry["total_bytes"] += size
+        entry["max_bytes"] = max(entry["max_bytes"], size)
+        if size >= settings.cache_oversized_key_bytes:
+            entry["oversized"] += 1
+    for entry in namespaces.values():
+        entry["avg_bytes"] = entry.pop("total_bytes") / entry["keys"]
+
+    largest = sorted(sizes, key=lambda item: item[1], reverse=True)[:top]
+    return {
+        "sampled": len(sizes),
+        "namespaces": namespaces,
+        "largest": [{"key": key, "bytes": size} for key, size in largest],
+    }
+
+
+async def _compute_and_store(
+    key: str,
+    compute: Callable[[], Awaitable[Any]],
+    ttl: Optional[int],
+) -> Any:
+    value = await compute()
+    if value is not None:
+        await cache_set(key, value, ttl)
+    return value
+
+
+async def cache_acquire_lock(name: str, ttl: int) -> Optional[str]:
+    """
+    Take a Redis lock that expires after ttl seconds.
+
+    Returns:
+        Token to release the lock with, or None if it is held elsewhere
+
+    Raises:
+        CacheUnavailableError: If Redis is unreachable or the breaker is open
+    """
+    token = uuid.uuid4().hex
+    acquired = await _call(lambda client: client.set(name, token, nx=True, ex=ttl))
+    return token if acquired else None
+
+
+async def cache_release_lock(name: str, token: str) -> None:
+    """Release a lock taken with cache_acquire_lock, if it is still held with token."""
+    try:
+        await _call(lambda client: client.eval(_RELEASE_LEASE_SCRIPT, 1, name, token))
+    except CacheUnavailableError as e:
+        print(f"Cache lock release error for {name}: {e}")
+
+
+async def _acquire_lease(key: str) -> Optional[str]:
+    """Try to take the compute lease of key; returns the lease token if acquired."""
+    return await cache_acquire_lock(f"lease:{key}", settings.single_flight_lease_seconds)
+
+
+async def _release_lease(key: str, token: str) -> None:
+    """Release the compute lease of key if still held with token."""
+    await cache_release_lock(f"lease:{key}", token)
+
+
+async def _compute_under_lease(
+    key: str,
+    compute: Callable[[], Awaitable[Any]],
+    ttl: Optional[int],
+) -> Any:
+    """Compute key on at most one worker at a time, sharing the result via Redis."""
+    lease_key = f"lease:{key}"
+    deadline = time.monotonic() + settings.single_flight_wait_seconds
+
+    while time.monotonic() < deadline:
+        try:
+            token = await _acquire_lease(key)
+        except CacheUnavailableError:
+            break  # Redis is down: compute without coordination
+
+        if token:
+            try:
+                # The previous holder may have stored the value just before releasing
+                cached = await _get(key, record=False)
+                if cached is not None:
+                    return cached
+                return await _compute_and_store(key, compute, ttl)
+            finally:
+                await _release_lease(key, token)
+
+        # Another worker is computing: wait for its value or for the lease to go
+        while time.monotonic() < deadline:
+            await asyncio.sleep(LEASE_POLL_SECONDS)
+            try:
+                cached = await _get(key, record=False)
+                if cached is not None:
+                    return cached
+                if not await _call(lambda client: client.exists(lease_key)):
+                    break  # Holder finished without caching (or died): retry
+            except CacheUnavailableError:
+                break
+
+    return await _compute_and_store(key, compute, ttl)
+
+
+async def cache_compute_once(
+    key: str,
+    compute: Callable[[], Awaitable[Any]],
+    ttl: Optional[int] = None,
+) -> Any:
+    """
+    Compute and cache the value of a missed key once across concurrent callers.
+
+    Callers in this worker await a shared future; across workers a Redis
+    lease lets one worker compute while the others poll for the cached
+    result. If the holder finishes without a value (compute returned None
+    or raised) or the wait times out, waiting callers compute themselves.
+
+    Args:
+        key: Cache key that was missed
+        compute: Coroutine function producing a JSON-serializable value,
+            or None for results that must not be cached
+        ttl: TTL for the cached value
+
+    Returns:
+        The computed (or concurrently cached) value
+    """
+    while (future := _inflight.get(key)) is not None:
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+            # The computing request was cancelled: take over
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        value = await _compute_under_lease(key, compute, ttl)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # Mark retrieved when nobody else is waiting
+        raise
+    else:
+        future.set_result(value)
+        return value
+    finally:
+        _inflight.pop(key, None)
+
+
+def _is_fresh(envelope: dict) -> bool:
+    return envelope["fresh_until"] > time.time()
+
+
+def _wrap(value: Any, soft_ttl: int) -> Optional[dict]:
+    if value is None:
+        return None
+    return {SWR_MARKER: 1, "value": value, "fresh_until": time.time() + soft_ttl}
+
+
+async def _refresh_in_background(
+    key: str,
+    compute: Callable[[], Awaitable[Any]],
+    soft_ttl: int,
+    hard_ttl: int,
+) -> None:
+    """Recompute a stale entry; only the worker holding the lease does the work."""
+    try:
+        token = await _acquire_lease(key)
+        if not token:
+            return  # Another worker is already refreshing
+        try:
+            envelope = _wrap(await compute(), soft_ttl)
+            if envelope is not None:
+                await cache_set(key, envelope, hard_ttl)
+        finally:
+            await _release_lease(key, token)
+    except Exception as e:
+        print(f"Background cache refresh failed for {key}: {e}")
+    finally:
+        _refreshing.discard(key)
+
+
+async def cache_get_swr(key: str) -> Optional[Any]:
+    """Get a value stored by cache_get_or_compute, fresh or stale, without refreshing it."""
+    cached = await cache_get(key)
+    if isinstance(cached, dict) and SWR_MARKER in cached:
+        return cached["value"]
+    return None
+
+
+async def cache_set_swr(key: str, value: Any, soft_ttl: int, hard_ttl: int) -> None:
+    """Store a value for cache_get_or_compute readers (e.g. one produced by streaming)."""
+    envelope = _wrap(value, soft_ttl)
+    if envelope is not None:
+        await cache_set(key, envelope, hard_ttl)
+
+
+async def cache_get_or_compute(
+    key: str,
+    compute: Callable[[], Awaitable[Any]],
+    soft_ttl: int,
+    hard_ttl: int,
+) -> Any:
+    """
+    Get a value with stale-while-revalidate semantics.
+
+    Within soft_ttl the cached value is returned as is. Between soft_ttl
+    and hard_ttl it is still returned immediately, and one background
+    task (one worker, via the compute lease) recomputes it. Past hard_ttl
+    the entry is gone and callers compute it through cache_compute_once.
+
+    Args:
+        key: Cache key
+        compute: Coroutine function producing a JSON-serializable value,
+            or None for results that must not be cached
+        soft_ttl: Seconds the value is served without refreshing
+        hard_ttl: Seconds the value is kept at all
+
+    Returns:
+        The cached or computed value
+    """
+    cached = await cache_get(key)
+    if isinstance(cached, dict) and SWR_MARKER in cached:
+        if not _is_fresh(cached) and key not in _refreshing:
+            _refreshing.add(key)
+            task = asyncio.get_running_loop().create_task(
+                _refresh_in_background(key, compute, soft_ttl, hard_ttl)
+            )
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
+        return cached["value"]
+
+    async def compute_envelope() -> Optional[dict]:
+        return _wrap(await compute(), soft_ttl)
+
+    envelope = await cache_compute_once(key, compute_envelope, hard_ttl)
+    return envelope["value"] if envelope is not None else None
+
+
+async def _refresh_many_in_background(
+    keys: list[str],
+    compute_many: Callable[[list[str]], Awaitable[list[Any]]],
+    soft_ttl: int,
+    hard_ttl: int,
+) -> None:
+    """Recompute stale batch entries in one call (no cross-worker lease)."""
+    try:
+        values = await compute_many(keys)
+        envelopes = {
+            key: _wrap(value, soft_ttl) for key, value in zip(keys, values) if value is not None
+        }
+        await cache_set_many(envelopes, hard_ttl)
+    except Exception as e:
+        print(f"Background cache refresh failed for {len(keys)} keys: {e}")
+    finally:
+        _refreshing.difference_update(keys)
+
+
+async def cache_get_or_compute_many(
+    keys: list[str],
+    compute_many: Callable[[list[str]], Awaitable[list[Any]]],
+    soft_ttl: int,
+    hard_ttl: int,
+) -> list[Any]:
+    """
+    Batch version of cache_get_or_compute.
+
+    Hits are read with one MGET and all misses are computed with a single
+    compute_many call, so a backend with a batch API is called once. Stale
+    hits are served and refreshed together in the background. Unlike the
+    single-key path, misses are not coalesced with concurrent callers.
+
+    Args:
+        keys: Distinct cache keys
+        compute_many: Coroutine function taking the missed keys and
+            returning their values in order (None for values that must
+            not be cached)
+        soft_ttl: Seconds values are served without refreshing
+        hard_ttl: Seconds values are kept at all
+
+    Returns:
+        Values aligned with keys
+    """
+    cached = await cache_get_many(keys)
+    values: list[Any] = [None] * len(keys)
+    missing: list[int] = []
+    stale: list[str] = []
+    for i, (key, entry) in enumerate(zip(keys, cached)):
+        if isinstance(entry, dict) and SWR_MARKER in entry:
+            values[i] = entry["value"]
+            if not _is_fresh(entry) and key not in _refreshing:
+                stale.append(key)
+        else:
+            missing.append(i)
+
+    if stale:
+        _refreshing.update(stale)
+        task = asyncio.get_running_loop().create_task(
+            _refresh_many_in_background(stale, compute_many, soft_ttl, hard_ttl)
+        )
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+    if missing:
+        computed = await compute_many([keys[i] for i in missing])
+        envelopes = {}
+        for i, value in zip(missing, computed):
+            values[i] = value
+            if value is not None:
+                envelopes[keys[i]] = _wrap(value, soft_ttl)
+        await cache_set_many(envelopes, hard_ttl)
+    return values
@@ -0,0 +1,196 @@
+"""Binary encoding of cached values.
+
+Encoded values start with a header byte (>= 0x80) naming the serializer
+and compressor, so formats can change without flushing Redis. Values
+written before the codec existed are plain JSON text, which always
+starts with an ASCII byte, and are still decoded.
+
+    header = 0x80 | serializer << 3 | compressor
+"""
+from __future__ import annotations
+
+import json
+import zlib
+from typing import Any, Callable, Optional
+
+from .config import get_settings
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+settings = get_settings()
+
+HEADER_FLAG = 0x80
+
+# Serializer ids
+SERIALIZER_JSON = 0
+SERIALIZER_MSGPACK = 1
+
+# Compressor ids
+COMPRESSOR_NONE = 0
+COMPRESSOR_ZLIB = 1
+COMPRESSOR_ZSTD = 2
+
+_zstd_compressor = zstandard.ZstdCompressor(level=3) if ZSTD_AVAILABLE else None
+_zstd_decompressor = zstandard.ZstdDecompressor() if ZSTD_AVAILABLE else None
+
+
+class CacheCodecError(ValueError):
+    """Raised when a cached value cannot be decoded."""
+
+
+def _json_dumps(value: Any) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _msgpack_dumps(value: Any) -> bytes:
+    return msgpack.packb(value, use_bin_type=True)
+
+
+def _msgpack_loads(data: bytes) -> Any:
+    return msgpack.unpackb(data, raw=False)
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    return _zstd_compressor.compress(data)
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    return _zstd_decompressor.decompress(data)
+
+
+SERIALIZERS: dict[int, tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    SERIALIZER_JSON: (_json_dumps, _json_loads),
+}
+if MSGPACK_AVAILABLE:
+    SERIALIZERS[SERIALIZER_MSGPACK] = (_msgpack_dumps, _msgpack_loads)
+
+COMPRESSORS: dict[int, tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    COMPRESSOR_NONE: (lambda data: data, lambda data: data),
+    COMPRESSOR_ZLIB: (zlib.compress, zlib.decompress),
+}
+if ZSTD_AVAILABLE:
+    COMPRESSORS[COMPRESSOR_ZSTD] = (_zstd_compress, _zstd_decompress)
+
+SERIALIZER_NAMES = {"json": SERIALIZER_JSON, "msgpack": SERIALIZER_MSGPACK}
+
+
+class CacheCodec:
+    """Encode values as header + serialized (optionally compressed) payload."""
+
+    def __init__(
+        self,
+        serializer: str = "json",
+        compress_threshold: int = 1024,
+        legacy: bool = False,
+    ):
+        """
+        Args:
+            serializer: "json" (orjson when installed) or "msgpack"
+            compress_threshold: Compress payloads of at least this many bytes
+            legacy: Write plain JSON text readable by workers without the codec
+        """
+        serializer_id = SERIALIZER_NAMES.get(serializer, SERIALIZER_JSON)
+        if serializer_id not in SERIALIZERS:
+            print(f"Cache serializer {serializer} not installed, using json")
+            serializer_id = SERIALIZER_JSON
+        self.serializer_id = serializer_id
+        self.compressor_id = COMPRESSOR_ZSTD if ZSTD_AVAILABLE else COMPRESSOR_ZLIB
+        self.compress_threshold = compress_threshold
+        self.legacy = legacy
+
+    def encode(self, value: Any) -> bytes:
+        """Encode a value for storage in Redis."""
+        if self.legacy:
+            return json.dumps(value).encode("utf-8")
+
+        dumps, _ = SERIALIZERS[self.serializer_id]
+        payload = dumps(value)
+        compressor_id = COMPRESSOR_NONE
+        if len(payload) >= self.compress_threshold:
+            compress, _ = COMPRESSORS[self.compressor_id]
+            compressed = compress(payload)
+            if len(compressed) < len(payload):
+                payload = compressed
+                compressor_id = self.compressor_id
+
+        header = HEADER_FLAG | self.serializer_id << 3 | compressor_id
+        return bytes((header,)) + payload
+
+    def decode(self, data: Optional[bytes | str]) -> Any:
+        """
+        Decode a value read from Redis.
+
+        Raises:
+            CacheCodecError: If the value is corrupt or uses a format this
+                worker cannot read
+        """
+        if data is None:
+            return None
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if not data:
+            raise CacheCodecError("Empty cache value")
+
+        header = data[0]
+        if not header & HEADER_FLAG:
+            # Legacy plain JSON text
+            try:
+                return json.loads(data)
+            except ValueError as e:
+                raise CacheCodecError(f"Corrupt legacy cache value: {e}") from e
+
+        serializer_id = (header >> 3) & 0x0F
+        compressor_id = header & 0x07
+        if serializer_id not in SERIALIZERS or compressor_id not in COMPRESSORS:
+            raise CacheCodecError(f"Unsupported cache value header: {header:#x}")
+
+        _, decompress = COMPRESSORS[compressor_id]
+        _, loads = SERIALIZERS[serializer_id]
+        # zlib.error, ZstdError and msgpack errors are not ValueErrors
+        try:
+            return loads(decompress(data[1:]))
+        except Exception as e:
+            raise CacheCodecError(f"Corrupt cache value (header {header:#x}): {e}") from e
+
+
+# Codec singleton
+_codec: Optional[CacheCodec] = None
+
+
+def get_codec() -> CacheCodec:
+    """Get the cache codec configured in settings."""
+    global _codec
+    if _codec is None:
+        _codec = CacheCodec(
+            serializer=settings.cache_serializer,
+            compress_threshold=settings.cache_compress_threshold,
+            legacy=settings.cache_codec_legacy,
+        )
+    return _codec
@@ -0,0 +1,113 @@
+"""Cache key construction.
+
+Keys have the form ``{namespace}:v{version}:{part}:...:{text}``. Text is
+normalized so trivially different inputs (full-width letters, extra
+whitespace, "。" vs "." vs none) share an entry, and long text is hashed
+so key size stays bounded. Bump a namespace's version to invalidate all
+of its keys after a format change.
+
+Namespaces also have a generation number, stored in Redis and bumped at
+runtime (see app.core.cache.bump_namespace) when the underlying data
+changes. A non-zero generation is part of the version segment
+(``v1g3``), so bumping it makes every existing key unreachable at once;
+the old keys expire on their own TTLs.
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+import unicodedata
+
+# Key format version per namespace
+NAMESPACE_VERSIONS: dict[str, int] = {
+    "translate": 1,
+    "explain": 1,
+    "answer": 1,
+    "word_info": 1,
+    "tokens": 1,
+    "chat_window": 1,
+    "chat_turns": 1,
+    "db_pin": 1,
+}
+
+# Runtime generation per namespace, as last loaded from Redis (0 if never bumped)
+_generations: dict[str, int] = {}
+
+# Texts longer than this (UTF-8 bytes) are replaced by their hash
+MAX_TEXT_KEY_BYTES = 128
+
+# Trailing sentence punctuation; NFKC has already folded full-width ！？．
+_TRAILING_PUNCTUATION = re.compile(r"[.。!?…‥~〜・]+$")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for use in a cache key.
+
+    Applies NFKC (full-width ASCII to half-width, half-width katakana to
+    full-width), collapses whitespace, and canonicalizes trailing
+    punctuation: a run containing "?" becomes "?", one containing "!"
+    becomes "!", and plain full stops or ellipses are dropped.
+    """
+    text = " ".join(unicodedata.normalize("NFKC", text).split())
+
+    match = _TRAILING_PUNCTUATION.search(text)
+    if match:
+        run = match.group()
+        suffix = "?" if "?" in run else "!" if "!" in run else ""
+        text = text[: match.start()].rstrip() + suffix
+    return text
+
+
+def hash_text(text: str) -> str:
+    """Get a short, normalization-insensitive digest of text for use as a key part."""
+    encoded = normalize_text(text).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+
+
+def get_namespace_generation(namespace: str) -> int:
+    """Get the generation of a namespace known to this process."""
+    return _generations.get(namespace, 0)
+
+
+def set_namespace_generations(generations: dict[str, int]) -> None:
+    """Update the known generations of namespaces (never moves one backwards)."""
+    for namespace, generation in generations.items():
+        if generation > _generations.get(namespace, 0):
+            _generations[namespace] = generation
+
+
+def make_cache_key(
+    namespace: str, *parts: object, text: str | None = None, normalize: bool = True
+) -> str:
+    """
+    Build a versioned cache key for the namespace's current generation.
+
+    Args:
+        namespace: Key namespace (first key segment, selects L1 policy)
+        *parts: Short identifiers (language codes, ids, levels), used verbatim
+        text: Free-form user text, normalized and hashed when long
+        normalize: Normalize text first; disable when the cached value echoes
+            the exact input (e.g. token surfaces)
+
+    Returns:
+        Cache key
+    """
+    version = f"v{NAMESPACE_VERSIONS.get(namespace, 1)}"
+    generation = _generations.get(namespace, 0)
+    if generation:
+        version += f"g{generation}"
+    segments = [namespace, version]
+    segments.extend(str(part) for part in parts)
+    if text is not None:
+        normalized = normalize_text(text) if normalize else text
+        encoded = normalized.encode("utf-8")
+        if len(encoded) > MAX_TEXT_KEY_BYTES:
+            normalized = "h:" + hashlib.blake2b(encoded, digest_size=16).hexdigest()
+        segments.append(normalized)
+    return ":".join(segments)
+
+
+def key_namespace(key: str) -> str:
+    """Get the namespace of a cache key."""
+    return key.split(":", 1)[0]
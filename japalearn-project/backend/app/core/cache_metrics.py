@@ -0,0 +1,131 @@
+"""Cache instrumentation.
+
+Counts cache outcomes and payload bytes, and records Redis latency
+histograms, per key namespace. Metrics are kept in process (one set per
+worker) and rendered in the Prometheus text exposition format, so no
+client library is needed. Keys outside the known namespaces are counted
+under "other" to keep label cardinality bounded.
+"""
+from __future__ import annotations
+
+import bisect
+from typing import Any
+
+from .cache_keys import NAMESPACE_VERSIONS, key_namespace
+
+# Latency histogram bucket upper bounds (seconds)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+
+# Counter name -> help text
+COUNTERS = {
+    "l1_hits": "cache_get hits served from the in-process cache",
+    "hits": "cache_get hits served from Redis",
+    "misses": "cache_get misses",
+    "sets": "Values written to Redis",
+    "errors": "Failed Redis calls and undecodable values",
+    "bytes_read": "Encoded payload bytes read from Redis",
+    "bytes_written": "Encoded payload bytes written to Redis",
+}
+
+
+class Histogram:
+    """Cumulative latency histogram with fixed buckets."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Get (le, cumulative count) pairs including +Inf."""
+        pairs = []
+        total = 0
+        for bound, count in zip([*map(str, self.buckets), "+Inf"], self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+
+class CacheMetrics:
+    """Per-namespace cache counters and Redis latency histograms."""
+
+    def __init__(self):
+        self.counters: dict[str, dict[str, int]] = {}
+        self.latencies: dict[tuple[str, str], Histogram] = {}
+
+    @staticmethod
+    def namespace(key: str) -> str:
+        """Get the metrics label for a key's namespace."""
+        namespace = key_namespace(key)
+        return namespace if namespace in NAMESPACE_VERSIONS else "other"
+
+    def incr(self, key: str, counter: str, amount: int = 1) -> None:
+        """Increment a counter for key's namespace."""
+        counts = self.counters.setdefault(
+            self.namespace(key), dict.fromkeys(COUNTERS, 0)
+        )
+        counts[counter] += amount
+
+    def observe(self, key: str, operation: str, seconds: float) -> None:
+        """Record the latency of a Redis operation on key."""
+        label = (self.namespace(key), operation)
+        histogram = self.latencies.get(label)
+        if histogram is None:
+            histogram = self.latencies[label] = Histogram()
+        histogram.observe(seconds)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        Get counters and latency summaries per namespace.
+
+        Returns:
+            {namespace: {counter: value, ..., "latency": {operation:
+            {"count", "avg_ms"}}}}
+        """
+        snapshot: dict[str, dict[str, Any]] = {
+            namespace: {**counts, "latency": {}} for namespace, counts in self.counters.items()
+        }
+        for (namespace, operation), histogram in self.latencies.items():
+            entry = snapshot.setdefault(namespace, {**dict.fromkeys(COUNTERS, 0), "latency": {}})
+            entry["latency"][operation] = {
+                "count": histogram.count,
+                "avg_ms": histogram.sum / histogram.count * 1000 if histogram.count else 0.0,
+            }
+        return snapshot
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = []
+        for counter, help_text in COUNTERS.items():
+            name = f"japalearn_cache_{counter}_total"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for namespace, counts in sorted(self.counters.items()):
+                lines.append(f'{name}{{namespace="{namespace}"}} {counts[counter]}')
+
+        name = "japalearn_cache_redis_latency_seconds"
+        lines.append(f"# HELP {name} Latency of Redis cache operations")
+        lines.append(f"# TYPE {name} histogram")
+        for (namespace, operation), histogram in sorted(self.latencies.items()):
+            labels = f'namespace="{namespace}",operation="{operation}"'
+            for bound, count in histogram.cumulative():
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+# Metrics singleton (per worker)
+_metrics = CacheMetrics()
+
+
+def get_cache_metrics() -> CacheMetrics:
+    """Get this worker's cache metrics."""
+    return _metrics
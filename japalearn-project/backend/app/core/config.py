@@ -25,10 +25,27 @@ class Settings(BaseSettings):
     # Database
     # Use SQLite for development (no external database required)
     database_url: str = "sqlite+aiosqlite:///./japalearn.db"
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+
+    # Read replica for lookup-heavy endpoints (falls back to the primary if unset)
+    database_read_url: Optional[str] = None
+    db_read_pool_size: int = 10
+    db_read_max_overflow: int = 20
+    db_read_your_writes_seconds: int = 5  # Pin a user's reads to the primary after a write
+    db_replica_retry_seconds: int = 30  # Skip the replica this long after a failed connect
+
+    # Schema management on startup: "verify" (check Alembic revision), "create"
+    # (create_all, local development only) or "off"
+    db_schema_mode: str = "verify"
 
     # Redis
     redis_url: str = "redis://localhost:6379"
     cache_ttl: int = 3600  # 1 hour
+    redis_op_timeout_seconds: float = 0.1  # Per cache call; a slow Redis counts as a failure
+    redis_connect_timeout_seconds: float = 0.25
+    redis_breaker_failure_threshold: int = 5  # Consecutive failures before the breaker opens
+    redis_breaker_reset_seconds: float = 10.0  # Open period before a half-open probe
 
     # S3/MinIO
     s3_endpoint_url: str = "http://localhost:9000"
@@ -41,6 +58,7 @@ class Settings(BaseSettings):
     secret_key: str = "your-secret-key-change-this-in-production"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 60 * 24 * 7  # 1 week
+    admin_api_key: Optional[str] = None  # X-Admin-Key for /admin endpoints (disabled if unset)
 
     # OpenAI
     openai_api_key: Optional[str] = None
@@ -51,7 +69,24 @@ class Settings(BaseSettings):
 
     # Translation Providers
     # EASY SWITCHING: Change default_translation_provider to switch backends
-    default_translation_provider: str = "local_llm"  # "local_llm", "google_cloud", "deepl"
+    default_translation_provider: str = "local_llm"  # "local_llm", "google_cloud", "deepl", "googletrans", "stub"
+    # Per-provider request timeouts (seconds)
+    translation_timeout_local_llm: float = 60.0
+    translation_timeout_google_cloud: float = 5.0
+    translation_timeout_deepl: float = 5.0
+    translation_timeout_googletrans: float = 10.0
+    translation_timeout_stub: float = 1.0
+    translation_secondary_provider: Optional[str] = None  # Hedge slow primary calls with this provider
+    translation_hedge_percentile: float = 95.0  # Start the hedge after this primary latency percentile
+    translation_hedge_min_samples: int = 20  # Samples needed before using the percentile
+    translation_hedge_default_delay_seconds: float = 1.0  # Hedge delay until then
+    translation_hedge_min_delay_seconds: float = 0.05
+    translation_deadline_seconds: float = 15.0  # Per provider call, including the hedge
+    translate_batch_max_texts: int = 500  # Per POST /translate/batch request
+    enable_translation_memory: bool = True  # Reuse stored translations before calling the provider
+    translation_memory_fuzzy_threshold: float = 0.8  # Min trigram Dice similarity for a reference hint
+    translation_memory_fuzzy_min_chars: int = 12  # Shorter texts get no reference hint
+    translation_memory_fuzzy_max_chars: int = 500
 
     # Google Cloud Translation API
     google_cloud_api_key: Optional[str] = None
@@ -63,9 +98,57 @@ class Settings(BaseSettings):
     ollama_base_url: str = "http://localhost:11434"
     ollama_model: str = "qwen2.5:14b-instruct-q4_K_M"
 
+    # Shared outbound HTTP client
+    http_timeout_seconds: float = 10.0  # Default when a caller sets no timeout
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+
     # Cache settings
     enable_cache_warming: bool = True
     cache_ttl_translations: int = 604800  # 7 days for translations
+    cache_soft_ttl_llm: int = 86400  # LLM-derived entries refresh in the background after 1 day
+    cache_hard_ttl_llm: int = 604800  # ...and expire after 7 days
+    cache_ttl_tokens: int = 86400  # Tokenization results (1 day)
+    cache_ttl_word_miss: int = 600  # Negative entries for words not in the dictionary
+    cache_warm_word_limit: int = 2000  # Top words by frequency_rank to precompute
+    cache_warm_concurrency: int = 4
+    cache_warm_pause_seconds: float = 0.01  # Pause between items to yield to live traffic
+    cache_warm_interval_seconds: int = 0  # Re-warm on this schedule (0 = startup only)
+    enable_l1_cache: bool = True  # In-process layer in front of Redis
+    cache_invalidation_channel: str = "cache:invalidate"  # Redis pub/sub channel
+    single_flight_lease_seconds: int = 30  # Cross-worker compute lease on cache misses
+    single_flight_wait_seconds: float = 35.0  # Max wait for another worker's result
+    cache_serializer: str = "json"  # json (orjson when installed) or msgpack
+    cache_compress_threshold: int = 1024  # Compress cached payloads from this size (bytes)
+    cache_codec_legacy: bool = False  # Write plain JSON while old workers are still running
+    enable_metrics: bool = True  # Expose Prometheus metrics at /metrics
+    cache_oversized_key_bytes: int = 102400  # Flag sampled keys at least this large (100 KB)
+
+    # Word progress tracking (write-behind)
+    progress_flush_interval_seconds: float = 5.0
+    progress_flush_batch_size: int = 500
+    progress_max_pending: int = 10000  # Flush early once this many rows are buffered
+    progress_max_buffered: int = 100000  # Drop new events past this many rows (e.g. DB down)
+    progress_flush_max_retries: int = 10  # Failed flushes before a row's counts are dropped
+
+    # Conversation history window sent to the LLM
+    chat_window_size: int = 10
+    chat_window_cache_ttl: int = 3600  # 1 hour
+    chat_summary_every_n_turns: int = 10  # Refresh the rolling summary this often
+    chat_summary_max_tokens: int = 300
+    chat_prompt_token_budget: int = 3000  # System prompt + summary + window
+
+    # Chat archival (idle conversations move to S3 cold storage)
+    enable_chat_archival: bool = True
+    chat_archive_after_days: int = 90
+    chat_archive_interval_seconds: int = 3600
+    chat_archive_batch_size: int = 100
+
+    # Monthly partitions of chat_messages / user_translations
+    partition_maintenance_interval_seconds: int = 3600
+
+    # User stat counters (write-behind)
+    stats_flush_interval_seconds: float = 5.0
 
     # Japanese NLP
     sudachi_dict: str = "core"  # core, small, full
@@ -1,8 +1,13 @@
 """Database configuration and session management."""
 from __future__ import annotations
 
-from typing import AsyncGenerator
+import time
+from pathlib import Path
+from typing import Any, AsyncGenerator, Optional
 
+from fastapi import Request
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import DBAPIError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -10,13 +15,40 @@ from .config import get_settings
 
 settings = get_settings()
 
-# Create async engine
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "migrations"
+
+
+def _engine_options(url: str, pool_size: int, max_overflow: int) -> dict[str, Any]:
+    """Build engine options, applying pool sizing where the driver supports it."""
+    options: dict[str, Any] = {"echo": settings.debug, "future": True}
+    if not url.startswith("sqlite"):
+        options.update(
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_pre_ping=True,
+        )
+    return options
+
+
+# Create async engine (primary, handles all writes)
 engine = create_async_engine(
     settings.database_url,
-    echo=settings.debug,
-    future=True,
+    **_engine_options(settings.database_url, settings.db_pool_size, settings.db_max_overflow),
 )
 
+# Read replica engine (shares the primary when no replica is configured)
+if settings.database_read_url:
+    read_engine = create_async_engine(
+        settings.database_read_url,
+        **_engine_options(
+            settings.database_read_url,
+            settings.db_read_pool_size,
+            settings.db_read_max_overflow,
+        ),
+    )
+else:
+    read_engine = engine
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -26,20 +58,86 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# Read-only session factory bound to the replica
+ReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
+
+def dialect_insert():
+    """Get the dialect-specific INSERT construct supporting ON CONFLICT."""
+    if engine.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+
+# user_id -> monotonic deadline until which reads go to the primary
+_primary_pins: dict[str, float] = {}
+
+# Monotonic time until which the replica is considered unavailable
+_replica_down_until = 0.0
+
 
 class Base(DeclarativeBase):
     """Base class for all database models."""
     pass
 
 
+def _current_revision(connection: Connection) -> Optional[str]:
+    """Read the Alembic revision the database is stamped with."""
+    from alembic.runtime.migration import MigrationContext
+
+    return MigrationContext.configure(connection).get_current_revision()
+
+
+def _head_revision() -> Optional[str]:
+    """Get the latest Alembic revision shipped with the application."""
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    return ScriptDirectory.from_config(config).get_current_head()
+
+
 async def init_db() -> None:
-    """Initialize database tables."""
-    async with engine.begin() as conn:
-        # Import all models here to ensure they're registered
-        from app.models import user, word, translation, chat  # noqa: F401
+    """
+    Prepare the database schema according to ``db_schema_mode``.
+
+    Schema changes are applied with ``alembic upgrade head`` as a deploy step,
+    so workers only verify the revision and never take DDL locks on boot.
+    """
+    # Import all models here to ensure they're registered
+    from app.models import user, word, translation, chat  # noqa: F401
 
-        # Create all tables
-        await conn.run_sync(Base.metadata.create_all)
+    mode = settings.db_schema_mode
+    if mode == "create":
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    elif mode == "verify":
+        async with engine.connect() as conn:
+            current = await conn.run_sync(_current_revision)
+        head = _head_revision()
+        if current != head:
+            raise RuntimeError(
+                f"Database schema is at revision {current}, expected {head}. "
+                "Run 'alembic upgrade head' before starting the API."
+            )
+    elif mode != "off":
+        raise ValueError(f"Unknown db_schema_mode: {mode}")
+
+
+async def close_db() -> None:
+    """Dispose of database connection pools."""
+    if read_engine is not engine:
+        await read_engine.dispose()
+    await engine.dispose()
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -49,3 +147,97 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             yield session
         finally:
             await session.close()
+
+
+async def pin_to_primary(user_id: str) -> None:
+    """
+    Route a user's reads to the primary for the read-your-writes window.
+
+    Call after committing a write the user may immediately read back. The pin
+    is recorded locally and in Redis so other workers honor it as well.
+    """
+    window = settings.db_read_your_writes_seconds
+    if read_engine is engine or window <= 0:
+        return
+
+    _primary_pins[user_id] = time.monotonic() + window
+
+    from .cache import cache_set
+    from .cache_keys import make_cache_key
+
+    try:
+        await cache_set(make_cache_key("db_pin", user_id), 1, ttl=window)
+    except Exception as e:
+        print(f"Failed to share primary pin: {e}")
+
+
+async def _is_pinned_to_primary(user_id: str) -> bool:
+    """Check whether a user wrote recently enough to need primary reads."""
+    deadline = _primary_pins.get(user_id)
+    if deadline is not None:
+        if deadline > time.monotonic():
+            return True
+        del _primary_pins[user_id]
+
+    from .cache import cache_exists
+    from .cache_keys import make_cache_key
+
+    try:
+        return await cache_exists(make_cache_key("db_pin", user_id))
+    except Exception:
+        # Without pin information, prefer correctness over offloading
+        return True
+
+
+def _request_user_id(request: Request) -> Optional[str]:
+    """Extract the user ID from a bearer token without touching the database."""
+    from fastapi import HTTPException
+
+    from .auth import decode_token
+
+    authorization = request.headers.get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+
+    try:
+        return decode_token(token).get("sub")
+    except HTTPException:
+        return None
+
+
+async def get_read_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get a read-only database session.
+
+    Uses the read replica when configured and reachable. Falls back to the
+    primary when the replica is down or the user has a recent write pinned.
+    """
+    global _replica_down_until
+
+    use_replica = read_engine is not engine and _replica_down_until <= time.monotonic()
+    if use_replica:
+        user_id = _request_user_id(request)
+        if user_id and await _is_pinned_to_primary(user_id):
+            use_replica = False
+
+    if use_replica:
+        async with ReadSessionLocal() as session:
+            try:
+                # Connect eagerly so replica failures fall back before the endpoint runs
+                await session.connection()
+            except (OperationalError, DBAPIError, OSError) as e:
+                print(f"Read replica unavailable, using primary: {e}")
+                _replica_down_until = time.monotonic() + settings.db_replica_retry_seconds
+            else:
+                try:
+                    yield session
+                finally:
+                    await session.close()
+                return
+
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
@@ -0,0 +1,40 @@
+"""Shared HTTP client for outbound API calls."""
+from __future__ import annotations
+
+from typing import Optional
+
+import httpx
+
+from .config import get_settings
+
+settings = get_settings()
+
+# HTTP client singleton (pooled connections, reused across requests)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared async HTTP client.
+
+    Callers pass their own per-request timeout; the client default only
+    applies to calls that do not.
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(settings.http_timeout_seconds),
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive_connections,
+            ),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
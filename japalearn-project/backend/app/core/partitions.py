@@ -0,0 +1,100 @@
+"""Monthly range partitioning helpers (PostgreSQL).
+
+``chat_messages`` and ``user_translations`` are partitioned by month on
+``created_at``. Each table also has a DEFAULT partition so inserts never
+fail, but partitions should be created ahead of time to keep the default
+empty (a month cannot be attached while the default holds rows for it).
+"""
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from typing import Any, Optional
+
+from sqlalchemy import DDL, Table, event, text
+
+from .config import get_settings
+from .db import AsyncSessionLocal
+from .tasks import PeriodicTask
+
+settings = get_settings()
+
+# Tables range-partitioned by created_at
+PARTITIONED_TABLES = ("chat_messages", "user_translations")
+
+
+def month_start(value: date | datetime) -> date:
+    """Get the first day of the month containing value."""
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    """Shift a first-of-month date by a number of months."""
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """Get the partition table name for a month (e.g. chat_messages_y2026m10)."""
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def create_partition_sql(table: str, month: date) -> str:
+    """Build DDL creating the partition of table for the given month."""
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(table, month)} "
+        f"PARTITION OF {table} "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+    )
+
+
+def default_partition_sql(table: str) -> str:
+    """Build DDL creating the DEFAULT partition of table."""
+    return f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT"
+
+
+def add_default_partition(table: Table) -> None:
+    """Create the DEFAULT partition whenever the table is created via metadata."""
+    event.listen(
+        table,
+        "after_create",
+        DDL(default_partition_sql(table.name)).execute_if(dialect="postgresql"),
+    )
+
+
+async def ensure_monthly_partitions(connection: Any, months_ahead: int = 2) -> None:
+    """
+    Create partitions for the current month and the next months_ahead months.
+
+    Args:
+        connection: Async connection or session bound to PostgreSQL
+        months_ahead: How many future months to prepare
+    """
+    current = month_start(datetime.now(timezone.utc))
+    for table in PARTITIONED_TABLES:
+        for offset in range(months_ahead + 1):
+            await connection.execute(text(create_partition_sql(table, add_months(current, offset))))
+
+
+async def maintain_partitions() -> None:
+    """Create upcoming monthly partitions (no-op on other dialects)."""
+    async with AsyncSessionLocal() as session:
+        if session.bind.dialect.name != "postgresql":
+            return
+        await ensure_monthly_partitions(session)
+        await session.commit()
+
+
+# Partition maintenance (one per worker; CREATE TABLE IF NOT EXISTS is idempotent)
+_maintainer: Optional[PeriodicTask] = None
+
+
+def get_partition_maintainer() -> PeriodicTask:
+    """Get the background task that keeps future partitions created."""
+    global _maintainer
+    if _maintainer is None:
+        _maintainer = PeriodicTask(
+            "Partition maintenance",
+            settings.partition_maintenance_interval_seconds,
+            maintain_partitions,
+        )
+    return _maintainer
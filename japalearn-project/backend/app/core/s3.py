@@ -95,6 +95,24 @@ def upload_fileobj(file_obj: BinaryIO, key: str, content_type: str = "applicatio
         raise
 
 
+def download_file(key: str) -> bytes:
+    """
+    Download file from S3/MinIO.
+
+    Args:
+        key: S3 key (path) of the file
+
+    Returns:
+        File contents
+    """
+    try:
+        response = s3_client.get_object(Bucket=settings.s3_bucket, Key=key)
+        return response["Body"].read()
+    except ClientError as e:
+        print(f"Error downloading file: {e}")
+        raise
+
+
 def delete_file(key: str) -> None:
     """Delete file from S3/MinIO."""
     try:
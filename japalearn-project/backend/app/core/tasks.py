@@ -0,0 +1,46 @@
+"""Background task helpers."""
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Optional
+
+
+class PeriodicTask:
+    """Run an async callback on a fixed interval in the background.
+
+    Errors raised by the callback are logged and the loop keeps running.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        interval_seconds: float,
+        callback: Callable[[], Awaitable[object]],
+    ):
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self.callback = callback
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the loop on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the loop and wait for it to finish."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.callback()
+            except Exception as e:
+                print(f"{self.name} failed: {e}")
@@ -8,11 +8,25 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-
-from app.core.cache import close_redis
+from fastapi.responses import PlainTextResponse
+
+from app.core.cache import (
+    CacheUnavailableError,
+    close_redis,
+    refresh_namespace_generations,
+    start_invalidation_listener,
+    stop_invalidation_listener,
+)
+from app.core.cache_metrics import get_cache_metrics
 from app.core.config import get_settings
-from app.core.db import init_db
-from app.routers import auth, chat, conversation, translate, voice, word
+from app.core.db import close_db, init_db
+from app.core.http import close_http_client
+from app.core.partitions import get_partition_maintainer, maintain_partitions
+from app.routers import admin, auth, chat, conversation, export, review, stats, translate, voice, word
+from app.services.cache_warmer import start_cache_warming, stop_cache_warming
+from app.services.chat_archive import get_archive_sweeper
+from app.services.progress_tracker import get_progress_tracker
+from app.services.stats_counter import get_stats_counter
 
 settings = get_settings()
 
@@ -22,9 +36,35 @@ async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
     await init_db()
+    try:
+        # Load before serving so no request reads a bumped namespace's old keys
+        await refresh_namespace_generations()
+    except CacheUnavailableError as e:
+        print(f"Could not load cache namespace generations: {e}")
+    start_invalidation_listener()
+    try:
+        # Runs regardless of archival, so new months never land in DEFAULT
+        await maintain_partitions()
+    except Exception as e:
+        print(f"Partition maintenance failed: {e}")
+    get_partition_maintainer().start()
+    get_progress_tracker().start()
+    get_stats_counter().start()
+    if settings.enable_chat_archival:
+        get_archive_sweeper().start()
+    if settings.enable_cache_warming:
+        start_cache_warming()
     yield
     # Shutdown
+    await stop_cache_warming()
+    await get_archive_sweeper().stop()
+    await get_partition_maintainer().stop()
+    await get_progress_tracker().stop()
+    await get_stats_counter().stop()
+    await stop_invalidation_listener()
     await close_redis()
+    await close_http_client()
+    await close_db()
 
 
 app = FastAPI(
@@ -50,6 +90,14 @@ async def healthz() -> dict[str, str]:
     return {"status": "ok"}
 
 
+if settings.enable_metrics:
+
+    @app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+    async def metrics() -> str:
+        """Prometheus metrics for this worker."""
+        return get_cache_metrics().render_prometheus()
+
+
 @app.get("/")
 async def root() -> dict[str, str]:
     """Root endpoint."""
@@ -67,6 +115,10 @@ app.include_router(word.router, prefix="/api/v1/word", tags=["Words"])
 app.include_router(voice.router, prefix="/api/v1/voice", tags=["Voice"])
 app.include_router(chat.router, prefix="/api/v1/chat", tags=["Chat"])
 app.include_router(conversation.router, prefix="/api/v1/conversation", tags=["Conversation Practice"])
+app.include_router(review.router, prefix="/api/v1/review", tags=["Review"])
+app.include_router(export.router, prefix="/api/v1/export", tags=["Export"])
+app.include_router(stats.router, prefix="/api/v1/stats", tags=["Stats"])
+app.include_router(admin.router, prefix="/api/v1/admin", tags=["Admin"])
 
 
 if __name__ == "__main__":
@@ -0,0 +1 @@
+"""Alembic schema migrations."""
@@ -0,0 +1,85 @@
+"""Shared helpers for schema migrations.
+
+Index builds on live tables must not block writes. On PostgreSQL these
+helpers run ``CREATE/DROP INDEX CONCURRENTLY`` outside the migration
+transaction; other dialects fall back to a plain index build.
+"""
+from __future__ import annotations
+
+from typing import Any, Optional, Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+def is_postgresql() -> bool:
+    """Check whether migrations are running against PostgreSQL."""
+    return op.get_context().dialect.name == "postgresql"
+
+
+def _index_state(index_name: str) -> Optional[str]:
+    """Get "valid", "invalid" or None (missing) for a PostgreSQL index."""
+    valid = op.get_bind().execute(
+        sa.text(
+            """
+            SELECT i.indisvalid
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE c.relname = :name AND pg_catalog.pg_table_is_visible(c.oid)
+            """
+        ),
+        {"name": index_name},
+    ).scalar()
+    if valid is None:
+        return None
+    return "valid" if valid else "invalid"
+
+
+def create_index_concurrently(
+    index_name: str,
+    table_name: str,
+    columns: Sequence[Any],
+    **kwargs: Any,
+) -> None:
+    """
+    Create an index without blocking writes.
+
+    A failed concurrent build leaves an INVALID index behind; reruns drop
+    it and build again instead of skipping it. A valid index is kept.
+
+    Args:
+        index_name: Name of the index
+        table_name: Table to index
+        columns: Column names or SQL expressions
+        **kwargs: Extra options (unique, postgresql_where, ...)
+    """
+    if is_postgresql():
+        with op.get_context().autocommit_block():
+            state = _index_state(index_name)
+            if state == "valid":
+                return
+            if state == "invalid":
+                op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True)
+            op.create_index(
+                index_name,
+                table_name,
+                columns,
+                postgresql_concurrently=True,
+                **kwargs,
+            )
+    else:
+        op.create_index(index_name, table_name, columns, **kwargs)
+
+
+def drop_index_concurrently(index_name: str, table_name: str) -> None:
+    """Drop an index without blocking writes."""
+    if is_postgresql():
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+    else:
+        op.drop_index(index_name, table_name=table_name)
@@ -0,0 +1,147 @@
+"""Initial schema
+
+Matches the tables previously created by ``Base.metadata.create_all``.
+Databases bootstrapped that way should be marked with
+``alembic stamp 0001_initial_schema`` instead of upgrading.
+
+Revision ID: 0001_initial_schema
+Revises:
+Create Date: 2026-10-18 00:00:00
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0001_initial_schema"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("email", sa.String(255), nullable=False),
+        sa.Column("username", sa.String(100)),
+        sa.Column("password_hash", sa.String(255), nullable=False),
+        sa.Column("native_language", sa.String(10)),
+        sa.Column("target_language", sa.String(10)),
+        sa.Column("subscription_tier", sa.String(50), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_login", sa.DateTime(timezone=True)),
+        sa.Column("total_translations", sa.Integer(), nullable=False),
+        sa.Column("total_words_learned", sa.Integer(), nullable=False),
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "japanese_words",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("word", sa.Text(), nullable=False),
+        sa.Column("reading", sa.Text()),
+        sa.Column("romanji", sa.Text()),
+        sa.Column("part_of_speech", sa.String(50)),
+        sa.Column("jlpt_level", sa.Integer()),
+        sa.Column("frequency_rank", sa.Integer()),
+        sa.Column("definition_en", sa.Text()),
+        sa.Column("definition_zh", sa.Text()),
+        sa.Column("grammar_notes", postgresql.JSONB()),
+        sa.Column("kanji_breakdown", postgresql.JSONB()),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index("ix_japanese_words_word", "japanese_words", ["word"])
+
+    op.create_table(
+        "word_examples",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column(
+            "word_id",
+            sa.Integer(),
+            sa.ForeignKey("japanese_words.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("japanese_text", sa.Text(), nullable=False),
+        sa.Column("english_translation", sa.Text()),
+        sa.Column("romanji", sa.Text()),
+        sa.Column("difficulty_level", sa.Integer()),
+        sa.Column("context", sa.String(100)),
+    )
+
+    op.create_table(
+        "user_word_progress",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column(
+            "user_id",
+            sa.String(36),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "word_id",
+            sa.Integer(),
+            sa.ForeignKey("japanese_words.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("times_seen", sa.Integer(), nullable=False),
+        sa.Column("times_clicked", sa.Integer(), nullable=False),
+        sa.Column("mastery_level", sa.Integer(), nullable=False),
+        sa.Column("last_reviewed", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("next_review", sa.DateTime(timezone=True)),
+    )
+    op.create_index("ix_user_word_progress_user_id", "user_word_progress", ["user_id"])
+
+    op.create_table(
+        "user_translations",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("user_id", sa.String(36), sa.ForeignKey("users.id", ondelete="CASCADE")),
+        sa.Column("source_text", sa.Text(), nullable=False),
+        sa.Column("source_lang", sa.String(10), nullable=False),
+        sa.Column("translated_text", sa.Text(), nullable=False),
+        sa.Column("target_lang", sa.String(10), nullable=False),
+        sa.Column("words_analyzed", postgresql.JSONB()),
+        sa.Column("translation_service", sa.String(50)),
+        sa.Column("favorited", sa.Boolean(), nullable=False),
+        sa.Column("notes", sa.Text()),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index("ix_user_translations_user_id", "user_translations", ["user_id"])
+
+    op.create_table(
+        "chat_conversations",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("user_id", sa.String(36), sa.ForeignKey("users.id", ondelete="CASCADE")),
+        sa.Column("context_sentence", sa.Text()),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index("ix_chat_conversations_user_id", "chat_conversations", ["user_id"])
+
+    op.create_table(
+        "chat_messages",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column(
+            "conversation_id",
+            sa.String(36),
+            sa.ForeignKey("chat_conversations.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("role", sa.String(20), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("audio_url", sa.String(500)),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index("ix_chat_messages_conversation_id", "chat_messages", ["conversation_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("chat_messages")
+    op.drop_table("chat_conversations")
+    op.drop_table("user_translations")
+    op.drop_table("user_word_progress")
+    op.drop_table("word_examples")
+    op.drop_table("japanese_words")
+    op.drop_table("users")
@@ -0,0 +1,70 @@
+"""Unique (user_id, word_id) on user_word_progress
+
+Merges duplicate progress rows, then builds the unique index used as the
+ON CONFLICT target for batched view/click upserts.
+
+Revision ID: 0002_user_word_progress_unique
+Revises: 0001_initial_schema
+Create Date: 2026-10-18 00:00:00
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.migrations.helpers import create_index_concurrently, drop_index_concurrently
+
+revision: str = "0002_user_word_progress_unique"
+down_revision: Union[str, None] = "0001_initial_schema"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Fold duplicate rows into the most recently reviewed one
+    op.execute(
+        """
+        UPDATE user_word_progress
+        SET times_seen = totals.times_seen,
+            times_clicked = totals.times_clicked,
+            mastery_level = totals.mastery_level
+        FROM (
+            SELECT user_id, word_id,
+                   SUM(times_seen) AS times_seen,
+                   SUM(times_clicked) AS times_clicked,
+                   MAX(mastery_level) AS mastery_level
+            FROM user_word_progress
+            GROUP BY user_id, word_id
+            HAVING COUNT(*) > 1
+        ) AS totals
+        WHERE user_word_progress.user_id = totals.user_id
+          AND user_word_progress.word_id = totals.word_id
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM user_word_progress
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, ROW_NUMBER() OVER (
+                    PARTITION BY user_id, word_id
+                    ORDER BY last_reviewed DESC NULLS LAST, id
+                ) AS rn
+                FROM user_word_progress
+            ) AS ranked
+            WHERE ranked.rn > 1
+        )
+        """
+    )
+
+    create_index_concurrently(
+        "uq_user_word_progress_user_word",
+        "user_word_progress",
+        ["user_id", "word_id"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    drop_index_concurrently("uq_user_word_progress_user_word", "user_word_progress")
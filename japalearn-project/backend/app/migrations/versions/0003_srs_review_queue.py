@@ -0,0 +1,54 @@
+"""Spaced-repetition scheduling columns and due-queue index
+
+Revision ID: 0003_srs_review_queue
+Revises: 0002_user_word_progress_unique
+Create Date: 2026-10-18 00:00:00
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.migrations.helpers import create_index_concurrently, drop_index_concurrently
+
+revision: str = "0003_srs_review_queue"
+down_revision: Union[str, None] = "0002_user_word_progress_unique"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "user_word_progress",
+        sa.Column("ease_factor", sa.Float(), nullable=False, server_default="2.5"),
+    )
+    op.add_column(
+        "user_word_progress",
+        sa.Column("interval_days", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "user_word_progress",
+        sa.Column("repetitions", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    # Words seen before scheduling existed become due immediately
+    op.execute(
+        "UPDATE user_word_progress SET next_review = last_reviewed WHERE next_review IS NULL"
+    )
+
+    create_index_concurrently(
+        "ix_user_word_progress_due",
+        "user_word_progress",
+        ["user_id", "next_review"],
+        postgresql_where=sa.text("next_review IS NOT NULL"),
+        sqlite_where=sa.text("next_review IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    drop_index_concurrently("ix_user_word_progress_due", "user_word_progress")
+    op.drop_column("user_word_progress", "repetitions")
+    op.drop_column("user_word_progress", "interval_days")
+    op.drop_column("user_word_progress", "ease_factor")
@@ -0,0 +1,38 @@
+"""Composite indexes for keyset-paginated translation history
+
+Revision ID: 0004_translation_history_keyset
+Revises: 0003_srs_review_queue
+Create Date: 2026-10-18 00:00:00
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from app.migrations.helpers import create_index_concurrently, drop_index_concurrently
+
+revision: str = "0004_translation_history_keyset"
+down_revision: Union[str, None] = "0003_srs_review_queue"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    create_index_concurrently(
+        "ix_user_translations_user_created",
+        "user_translations",
+        ["user_id", "created_at", "id"],
+    )
+    create_index_concurrently(
+        "ix_user_translations_user_favorited",
+        "user_translations",
+        ["user_id", "created_at", "id"],
+        postgresql_where=sa.text("favorited"),
+        sqlite_where=sa.text("favorited"),
+    )
+
+
+def downgrade() -> None:
+    drop_index_concurrently("ix_user_translations_user_favorited", "user_translations")
+    drop_index_concurrently("ix_user_translations_user_created", "user_translations")
@@ -0,0 +1,28 @@
+"""Composite (conversation_id, created_at) index on chat_messages
+
+Revision ID: 0005_chat_messages_window_index
+Revises: 0004_translation_history_keyset
+Create Date: 2026-10-18 00:00:00
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from app.migrations.helpers import create_index_concurrently, drop_index_concurrently
+
+revision: str = "0005_chat_messages_window_index"
+down_revision: Union[str, None] = "0004_translation_history_keyset"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    create_index_concurrently(
+        "ix_chat_messages_conversation_created",
+        "chat_messages",
+        ["conversation_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    drop_index_concurrently("ix_chat_messages_conversation_created", "chat_messages")
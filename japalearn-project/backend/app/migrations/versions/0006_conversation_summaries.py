@@ -0,0 +1,33 @@
+"""Rolling summary columns on chat_conversations
+
+Revision ID: 0006_conversation_summaries
+Revises: 0005_chat_messages_window_index
+Create Date: 2026-10-18 00:00:00
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0006_conversation_summaries"
+down_revision: Union[str, None] = "0005_chat_messages_window_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("chat_conversations", sa.Column("summary", sa.Text()))
+    op.add_column(
+        "chat_conversations", sa.Column("summarized_until", sa.DateTime(timezone=True))
+    )
+    op.add_column(
+        "chat_conversations", sa.Column("summary_updated_at", sa.DateTime(timezone=True))
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("chat_conversations", "summary_updated_at")
+    op.drop_column("chat_conversations", "summarized_until")
+    op.drop_column("chat_conversations", "summary")
@@ -0,0 +1,130 @@
+"""Monthly partitioning of chat_messages/user_translations, chat archive columns
+
+Revision ID: 0007_partition_chat_and_translations
+Revises: 0006_conversation_summaries
+Create Date: 2026-10-18 00:00:00
+
+On PostgreSQL both tables are rebuilt as RANGE (created_at) partitioned
+tables and existing rows are copied over. The copy holds an exclusive
+lock on each table, so run this upgrade in a maintenance window. Other
+dialects only get the archive columns.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.core.partitions import (
+    PARTITIONED_TABLES,
+    add_months,
+    create_partition_sql,
+    default_partition_sql,
+    month_start,
+)
+from app.migrations.helpers import is_postgresql
+
+revision: str = "0007_partition_chat_and_translations"
+down_revision: Union[str, None] = "0006_conversation_summaries"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Partitions created ahead of the current month
+MONTHS_AHEAD = 2
+
+COLUMNS = {
+    "chat_messages": """
+        id VARCHAR(36) NOT NULL,
+        conversation_id VARCHAR(36) NOT NULL
+            REFERENCES chat_conversations (id) ON DELETE CASCADE,
+        role VARCHAR(20) NOT NULL,
+        content TEXT NOT NULL,
+        audio_url VARCHAR(500),
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL
+    """,
+    "user_translations": """
+        id VARCHAR(36) NOT NULL,
+        user_id VARCHAR(36) REFERENCES users (id) ON DELETE CASCADE,
+        source_text TEXT NOT NULL,
+        source_lang VARCHAR(10) NOT NULL,
+        translated_text TEXT NOT NULL,
+        target_lang VARCHAR(10) NOT NULL,
+        words_analyzed JSONB,
+        translation_service VARCHAR(50),
+        favorited BOOLEAN NOT NULL,
+        notes TEXT,
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL
+    """,
+}
+
+INDEXES = {
+    "chat_messages": [
+        "CREATE INDEX ix_chat_messages_conversation_id ON chat_messages (conversation_id)",
+        "CREATE INDEX ix_chat_messages_conversation_created "
+        "ON chat_messages (conversation_id, created_at)",
+    ],
+    "user_translations": [
+        "CREATE INDEX ix_user_translations_user_id ON user_translations (user_id)",
+        "CREATE INDEX ix_user_translations_user_created "
+        "ON user_translations (user_id, created_at, id)",
+        "CREATE INDEX ix_user_translations_user_favorited "
+        "ON user_translations (user_id, created_at, id) WHERE favorited",
+    ],
+}
+
+
+def _rebuild(table: str, partitioned: bool) -> None:
+    """Recreate table (partitioned or plain) and copy its rows across."""
+    old = f"{table}_old"
+    op.execute(f"ALTER TABLE {table} RENAME TO {old}")
+    op.execute(f"ALTER TABLE {old} RENAME CONSTRAINT {table}_pkey TO {old}_pkey")
+
+    if partitioned:
+        op.execute(
+            f"CREATE TABLE {table} ({COLUMNS[table]}, PRIMARY KEY (id, created_at)) "
+            "PARTITION BY RANGE (created_at)"
+        )
+        op.execute(default_partition_sql(table))
+
+        first = op.get_bind().execute(sa.text(f"SELECT min(created_at) FROM {old}")).scalar()
+        current = month_start(datetime.now(timezone.utc))
+        month = month_start(first) if first else current
+        while month <= add_months(current, MONTHS_AHEAD):
+            op.execute(create_partition_sql(table, month))
+            month = add_months(month, 1)
+    else:
+        op.execute(f"CREATE TABLE {table} ({COLUMNS[table]}, PRIMARY KEY (id))")
+
+    op.execute(f"INSERT INTO {table} SELECT * FROM {old}")
+    # Dropping the old table also drops its indexes, freeing their names
+    op.execute(f"DROP TABLE {old}")
+    for statement in INDEXES[table]:
+        op.execute(statement)
+
+
+def upgrade() -> None:
+    op.add_column("chat_conversations", sa.Column("archived_at", sa.DateTime(timezone=True)))
+    op.add_column("chat_conversations", sa.Column("archive_key", sa.String(500)))
+    op.create_index(
+        "ix_chat_conversations_unarchived",
+        "chat_conversations",
+        ["created_at"],
+        postgresql_where=sa.text("archived_at IS NULL"),
+        sqlite_where=sa.text("archived_at IS NULL"),
+    )
+
+    if is_postgresql():
+        for table in PARTITIONED_TABLES:
+            _rebuild(table, partitioned=True)
+
+
+def downgrade() -> None:
+    if is_postgresql():
+        for table in PARTITIONED_TABLES:
+            _rebuild(table, partitioned=False)
+
+    op.drop_index("ix_chat_conversations_unarchived", table_name="chat_conversations")
+    op.drop_column("chat_conversations", "archive_key")
+    op.drop_column("chat_conversations", "archived_at")
@@ -0,0 +1,65 @@
+"""Translation memory with an n-gram index for similar-sentence lookups
+
+Revision ID: 0008_translation_memory
+Revises: 0007_partition_chat_and_translations
+Create Date: 2026-10-18 00:00:00
+
+Populate from existing history with scripts/backfill_translation_memory.py.
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0008_translation_memory"
+down_revision: Union[str, None] = "0007_partition_chat_and_translations"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "translation_memory",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("source_lang", sa.String(10), nullable=False),
+        sa.Column("target_lang", sa.String(10), nullable=False),
+        sa.Column("source_hash", sa.String(32), nullable=False),
+        sa.Column("source_text", sa.Text(), nullable=False),
+        sa.Column("translated_text", sa.Text(), nullable=False),
+        sa.Column("translation_service", sa.String(50)),
+        sa.Column("ngram_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.UniqueConstraint(
+            "source_lang", "target_lang", "source_hash", name="uq_translation_memory_source"
+        ),
+    )
+    op.create_table(
+        "translation_memory_ngrams",
+        sa.Column("source_lang", sa.String(10), primary_key=True),
+        sa.Column("target_lang", sa.String(10), primary_key=True),
+        sa.Column("ngram", sa.String(16), primary_key=True),
+        sa.Column(
+            "memory_id",
+            sa.String(36),
+            sa.ForeignKey("translation_memory.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("ngram_count", sa.Integer(), nullable=False),
+    )
+    op.create_index(
+        "ix_translation_memory_ngrams_memory_id", "translation_memory_ngrams", ["memory_id"]
+    )
+    op.create_index(
+        "ix_translation_memory_ngrams_lookup",
+        "translation_memory_ngrams",
+        ["source_lang", "target_lang", "ngram", "ngram_count", "memory_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_translation_memory_ngrams_lookup", table_name="translation_memory_ngrams")
+    op.drop_index("ix_translation_memory_ngrams_memory_id", table_name="translation_memory_ngrams")
+    op.drop_table("translation_memory_ngrams")
+    op.drop_table("translation_memory")
@@ -5,16 +5,26 @@ import uuid
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.db import Base
+from app.core.partitions import add_default_partition
 
 
 class ChatConversation(Base):
     """Chat conversation session."""
 
     __tablename__ = "chat_conversations"
+    __table_args__ = (
+        # Archive sweeper candidates
+        Index(
+            "ix_chat_conversations_unarchived",
+            "created_at",
+            postgresql_where=text("archived_at IS NULL"),
+            sqlite_where=text("archived_at IS NULL"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid.uuid4())
@@ -27,6 +37,16 @@ class ChatConversation(Base):
     context_sentence: Mapped[Optional[str]] = mapped_column(Text)
     # The sentence the user was studying when they started this conversation
 
+    # Rolling summary of messages older than the recent window
+    summary: Mapped[Optional[str]] = mapped_column(Text)
+    summarized_until: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    # created_at of the last message folded into the summary
+    summary_updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+
+    # Cold storage: messages moved to an S3 JSONL archive once idle
+    archived_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    archive_key: Mapped[Optional[str]] = mapped_column(String(500))
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
@@ -39,6 +59,11 @@ class ChatMessage(Base):
     """Individual chat messages."""
 
     __tablename__ = "chat_messages"
+    __table_args__ = (
+        # Recent-window fetches: ORDER BY created_at DESC LIMIT n per conversation
+        Index("ix_chat_messages_conversation_created", "conversation_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid.uuid4())
@@ -53,9 +78,15 @@ class ChatMessage(Base):
     # Audio URL (for TTS responses)
     audio_url: Mapped[Optional[str]] = mapped_column(String(500))
 
+    # Partition key, so it must be part of the primary key
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True),
+        primary_key=True,
+        default=lambda: datetime.now(timezone.utc),
     )
 
     def __repr__(self) -> str:
         return f"<ChatMessage {self.role}: {self.content[:30]}...>"
+
+
+add_default_partition(ChatMessage.__table__)
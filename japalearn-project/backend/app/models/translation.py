@@ -5,17 +5,41 @@ import uuid
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.db import Base
+from app.core.partitions import add_default_partition
 
 
 class UserTranslation(Base):
     """User translation history."""
 
     __tablename__ = "user_translations"
+    __table_args__ = (
+        # Keyset pagination of a user's history, newest first
+        Index("ix_user_translations_user_created", "user_id", "created_at", "id"),
+        Index(
+            "ix_user_translations_user_favorited",
+            "user_id",
+            "created_at",
+            "id",
+            postgresql_where=text("favorited"),
+            sqlite_where=text("favorited"),
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid.uuid4())
@@ -42,9 +66,74 @@ class UserTranslation(Base):
     favorited: Mapped[bool] = mapped_column(Boolean, default=False)
     notes: Mapped[Optional[str]] = mapped_column(Text)
 
+    # Partition key, so it must be part of the primary key
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True),
+        primary_key=True,
+        default=lambda: datetime.now(timezone.utc),
     )
 
     def __repr__(self) -> str:
         return f"<UserTranslation {self.source_text[:30]}...>"
+
+
+add_default_partition(UserTranslation.__table__)
+
+
+class TranslationMemory(Base):
+    """Reusable translation of a normalized source text, shared across users."""
+
+    __tablename__ = "translation_memory"
+    __table_args__ = (
+        # Exact lookups by normalized source
+        UniqueConstraint(
+            "source_lang", "target_lang", "source_hash", name="uq_translation_memory_source"
+        ),
+    )
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+    )
+    source_lang: Mapped[str] = mapped_column(String(10))
+    target_lang: Mapped[str] = mapped_column(String(10))
+    source_hash: Mapped[str] = mapped_column(String(32))  # blake2b of normalized text
+    source_text: Mapped[str] = mapped_column(Text)  # Normalized
+    translated_text: Mapped[str] = mapped_column(Text)
+    translation_service: Mapped[Optional[str]] = mapped_column(String(50))
+    ngram_count: Mapped[int] = mapped_column(Integer)  # Distinct n-grams of source_text
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
+
+    def __repr__(self) -> str:
+        return f"<TranslationMemory {self.source_text[:30]}...>"
+
+
+class TranslationMemoryNgram(Base):
+    """Inverted index of character n-grams for fuzzy translation memory lookups."""
+
+    __tablename__ = "translation_memory_ngrams"
+    __table_args__ = (
+        # Posting lists ordered by entry size, so the similarity length bounds
+        # are a range scan within each n-gram (index-only, no join)
+        Index(
+            "ix_translation_memory_ngrams_lookup",
+            "source_lang",
+            "target_lang",
+            "ngram",
+            "ngram_count",
+            "memory_id",
+        ),
+    )
+
+    source_lang: Mapped[str] = mapped_column(String(10), primary_key=True)
+    target_lang: Mapped[str] = mapped_column(String(10), primary_key=True)
+    ngram: Mapped[str] = mapped_column(String(16), primary_key=True)
+    memory_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("translation_memory.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    )
+    ngram_count: Mapped[int] = mapped_column(Integer)  # Copy of the entry's ngram_count
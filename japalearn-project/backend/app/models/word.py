@@ -5,7 +5,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -76,6 +76,18 @@ class UserWordProgress(Base):
     """Track user's learning progress for each word."""
 
     __tablename__ = "user_word_progress"
+    __table_args__ = (
+        # Conflict target for batched progress upserts
+        Index("uq_user_word_progress_user_word", "user_id", "word_id", unique=True),
+        # Due queue: only scheduled cards are indexed
+        Index(
+            "ix_user_word_progress_due",
+            "user_id",
+            "next_review",
+            postgresql_where=text("next_review IS NOT NULL"),
+            sqlite_where=text("next_review IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid.uuid4())
@@ -97,6 +109,10 @@ class UserWordProgress(Base):
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
     next_review: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    ease_factor: Mapped[float] = mapped_column(Float, default=2.5)
+    interval_days: Mapped[int] = mapped_column(Integer, default=0)
+    repetitions: Mapped[int] = mapped_column(Integer, default=0)
+    # Consecutive successful reviews
 
     def __repr__(self) -> str:
         return f"<UserWordProgress user={self.user_id} word={self.word_id}>"
@@ -0,0 +1,194 @@
+"""Operational endpoints (require X-Admin-Key)."""
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import BaseModel
+
+from app.core.auth import require_admin
+from app.core.cache import (
+    CacheUnavailableError,
+    bump_namespace,
+    get_breaker,
+    get_cache_stats,
+    sample_key_sizes,
+)
+from app.core.cache_keys import NAMESPACE_VERSIONS
+from app.core.cache_metrics import get_cache_metrics
+from app.services.cache_warmer import trigger_cache_warming
+from app.services.dictionary_cache import top_word_misses
+from app.services.translation_hedging import get_provider_stats
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+class NamespaceCacheStats(BaseModel):
+    """cache_get outcomes for one key namespace."""
+
+    l1_hits: int
+    hits: int  # Including L1 hits
+    misses: int
+    hit_rate: float
+
+
+@router.get("/cache/stats", response_model=dict[str, NamespaceCacheStats])
+async def cache_stats() -> dict[str, NamespaceCacheStats]:
+    """
+    Get cache hit rates per namespace.
+
+    Counts are per worker since it started.
+    """
+    return {
+        namespace: NamespaceCacheStats(**counts)
+        for namespace, counts in get_cache_stats().items()
+    }
+
+
+@router.get("/cache/metrics")
+async def cache_metrics() -> dict[str, dict]:
+    """
+    Get cache counters, payload bytes and Redis latency per namespace.
+
+    Counts are per worker since it started.
+    """
+    return get_cache_metrics().snapshot()
+
+
+class NamespaceKeySizes(BaseModel):
+    """Sampled key sizes for one namespace."""
+
+    keys: int
+    avg_bytes: float
+    max_bytes: int
+    oversized: int  # At least settings.cache_oversized_key_bytes
+
+
+class SampledKey(BaseModel):
+    """A sampled key and its Redis memory usage."""
+
+    key: str
+    bytes: int
+
+
+class KeySizeReport(BaseModel):
+    """Key sizes estimated from a random sample of Redis keys."""
+
+    sampled: int
+    namespaces: dict[str, NamespaceKeySizes]
+    largest: list[SampledKey]
+
+
+@router.get("/cache/key-sizes", response_model=KeySizeReport)
+async def cache_key_sizes(
+    samples: int = Query(200, ge=1, le=5000),
+    top: int = Query(20, ge=1, le=200),
+) -> KeySizeReport:
+    """Estimate key sizes per namespace from random keys, to catch oversized entries."""
+    try:
+        report = await sample_key_sizes(samples, top)
+    except CacheUnavailableError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Cache unavailable: {e}",
+        )
+    return KeySizeReport(**report)
+
+
+class CacheWarmRequest(BaseModel):
+    """Cache warming options."""
+
+    word_limit: int | None = None  # Defaults to settings.cache_warm_word_limit
+
+
+@router.post("/cache/warm", status_code=202)
+async def warm_cache(request: CacheWarmRequest | None = None) -> dict[str, str]:
+    """
+    Precompute word info and scenario tokenization caches in the background.
+
+    Returns immediately; progress is logged by the worker.
+    """
+    word_limit = request.word_limit if request else None
+    started = trigger_cache_warming(word_limit)
+    return {"status": "started" if started else "already_running"}
+
+
+class CacheBreakerStatus(BaseModel):
+    """Redis circuit breaker state."""
+
+    state: str  # closed, open, half_open
+    consecutive_failures: int
+
+
+@router.get("/cache/breaker", response_model=CacheBreakerStatus)
+async def cache_breaker() -> CacheBreakerStatus:
+    """Get the Redis circuit breaker state of this worker."""
+    breaker = get_breaker()
+    return CacheBreakerStatus(state=breaker.state, consecutive_failures=breaker.failures)
+
+
+class WordMiss(BaseModel):
+    """An unknown word and how often it was looked up."""
+
+    word: str
+    count: int
+
+
+@router.get("/cache/word-misses", response_model=list[WordMiss])
+async def word_misses(limit: int = Query(50, ge=1, le=500)) -> list[WordMiss]:
+    """Get the most frequently looked-up words that are not in the dictionary."""
+    return [WordMiss(**miss) for miss in await top_word_misses(limit)]
+
+
+class NamespaceBump(BaseModel):
+    """Result of invalidating a cache namespace."""
+
+    namespace: str
+    generation: int
+
+
+@router.post("/cache/namespaces/{namespace}/bump", response_model=NamespaceBump)
+async def bump_cache_namespace(namespace: str) -> NamespaceBump:
+    """
+    Invalidate every cached entry of a namespace (e.g. after correcting
+    dictionary rows, bump word_info).
+    """
+    if namespace not in NAMESPACE_VERSIONS:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown cache namespace: {namespace}",
+        )
+    try:
+        generation = await bump_namespace(namespace)
+    except CacheUnavailableError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Cache unavailable: {e}",
+        )
+    return NamespaceBump(namespace=namespace, generation=generation)
+
+
+class TranslationProviderStats(BaseModel):
+    """Latency and hedging outcomes of one translation provider."""
+
+    calls: int
+    failures: int
+    hedges: int  # Calls slow enough that the secondary provider was started
+    races: int  # Calls that ran alongside the other provider
+    wins: int
+    win_rate: float | None
+    samples: int  # Latency samples in the window
+    p50_ms: float | None
+    p95_ms: float | None
+    p99_ms: float | None
+
+
+@router.get("/translation/providers", response_model=dict[str, TranslationProviderStats])
+async def translation_provider_stats() -> dict[str, TranslationProviderStats]:
+    """
+    Get latency percentiles and hedge win rates per translation provider.
+
+    Counts are per worker since it started. Use them to tune
+    translation_hedge_percentile and translation_deadline_seconds.
+    """
+    return {
+        name: TranslationProviderStats(**stats) for name, stats in get_provider_stats().items()
+    }
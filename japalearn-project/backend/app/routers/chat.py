@@ -10,6 +10,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.auth import get_current_user_optional
 from app.core.db import get_session
 from app.models.user import User
+from app.services.chat_archive import ChatArchiveService
+from app.services.chat_history import ChatHistoryService
+from app.services.conversation_summary import ConversationSummaryService
 from app.services.openai_service import OpenAIService
 
 router = APIRouter()
@@ -103,14 +106,11 @@ async def chat_conversation(
 
     # Get or create conversation
     if request.conversation_id:
-        result = await session.execute(
-            session.query(ChatConversation).filter(
-                ChatConversation.id == request.conversation_id
-            )
-        )
-        conversation = result.scalar_one_or_none()
+        conversation = await session.get(ChatConversation, request.conversation_id)
         if not conversation:
             raise HTTPException(status_code=404, detail="Conversation not found")
+        if conversation.archived_at:
+            await ChatArchiveService().restore(session, conversation)
     else:
         conversation = ChatConversation(
             user_id=current_user.id if current_user else None,
@@ -128,11 +128,16 @@ async def chat_conversation(
     )
     session.add(user_message)
     await session.commit()
+    chat_history = ChatHistoryService()
+    await chat_history.append(conversation.id, "user", request.message)
 
     # Generate response
     openai_service = OpenAIService()
     response = await openai_service.chat_response(
-        conversation_id=conversation.id, message=request.message, session=session
+        conversation_id=conversation.id,
+        message=request.message,
+        session=session,
+        summary=conversation.summary,
     )
 
     # Add assistant message
@@ -144,6 +149,8 @@ async def chat_conversation(
     )
     session.add(assistant_message)
     await session.commit()
+    await chat_history.append(conversation.id, "assistant", response["text"])
+    await ConversationSummaryService(openai_service=openai_service).record_turn(conversation.id)
 
     return ChatResponse(
         conversation_id=conversation.id,
@@ -159,23 +166,14 @@ async def get_conversation_history(
     current_user: Optional[User] = Depends(get_current_user_optional),
 ):
     """Get conversation message history."""
-    from sqlalchemy import select
-
-    from app.models.chat import ChatMessage
-
-    result = await session.execute(
-        select(ChatMessage)
-        .where(ChatMessage.conversation_id == conversation_id)
-        .order_by(ChatMessage.created_at.asc())
-    )
-    messages = result.scalars().all()
+    messages = await ChatArchiveService().load_messages(session, conversation_id)
 
     return [
         {
-            "role": msg.role,
-            "content": msg.content,
-            "audio_url": msg.audio_url,
-            "created_at": msg.created_at.isoformat(),
+            "role": msg["role"],
+            "content": msg["content"],
+            "audio_url": msg["audio_url"],
+            "created_at": msg["created_at"],
         }
         for msg in messages
     ]
@@ -12,6 +12,9 @@ from app.core.auth import get_current_user_optional
 from app.core.db import get_session
 from app.models.chat import ChatConversation, ChatMessage
 from app.models.user import User
+from app.services.chat_archive import ChatArchiveService
+from app.services.chat_history import ChatHistoryService
+from app.services.conversation_summary import ConversationSummaryService
 from app.services.openai_service import OpenAIService
 from app.services.tokenizer import TokenizerService
 from app.services.translator import TranslatorService
@@ -84,6 +87,7 @@ async def start_conversation(
     )
     session.add(starter_msg)
     await session.commit()
+    await ChatHistoryService().append(conversation.id, "assistant", request.starter_message)
 
     # Tokenize starter message
     tokenizer = TokenizerService()
@@ -129,6 +133,8 @@ async def send_message(
     conversation = result.scalar_one_or_none()
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
+    if conversation.archived_at:
+        await ChatArchiveService().restore(session, conversation)
 
     # If user sent English, translate to Japanese
     japanese_message = request.message
@@ -164,19 +170,13 @@ async def send_message(
     session.add(user_msg)
     await session.commit()
 
-    # Get conversation history for context
-    history_result = await session.execute(
-        select(ChatMessage)
-        .where(ChatMessage.conversation_id == conversation.id)
-        .order_by(ChatMessage.created_at.asc())
-    )
-    history = history_result.scalars().all()
+    # Get recent conversation history for context
+    chat_history = ChatHistoryService()
+    await chat_history.append(conversation.id, "user", japanese_message)
+    history = await chat_history.get_window(session, conversation.id)
 
     # Generate AI response
 
-    # Build conversation for OpenAI
-    messages = []
-
     # Different system prompt based on check_sentence mode
     if request.check_sentence:
         # Sentence checking mode
@@ -203,11 +203,13 @@ Keep responses conversational and encourage the learner.
 Use appropriate formality level based on the scenario.
 Keep responses to 1-3 sentences."""
 
-    messages.append({"role": "system", "content": system_prompt})
-
-    # Add conversation history
-    for msg in history[-10:]:  # Last 10 messages for context
-        messages.append({"role": msg.role, "content": msg.content})
+    # Build conversation for OpenAI: summary plus recent window, within budget
+    summary_service = ConversationSummaryService(openai_service=openai_service)
+    messages = summary_service.build_messages(
+        system_prompt=system_prompt,
+        summary=conversation.summary,
+        window=history,
+    )
 
     # Get AI response
     try:
@@ -227,6 +229,8 @@ Keep responses to 1-3 sentences."""
         )
         session.add(assistant_msg)
         await session.commit()
+        await chat_history.append(conversation.id, "assistant", ai_message)
+        await summary_service.record_turn(conversation.id)
 
         # Tokenize AI response
         tokenizer = TokenizerService()
@@ -272,12 +276,7 @@ async def get_conversation_history(
     current_user: Optional[User] = Depends(get_current_user_optional),
 ):
     """Get conversation message history."""
-    result = await session.execute(
-        select(ChatMessage)
-        .where(ChatMessage.conversation_id == conversation_id)
-        .order_by(ChatMessage.created_at.asc())
-    )
-    messages = result.scalars().all()
+    messages = await ChatArchiveService().load_messages(session, conversation_id)
 
     # Tokenize each message
     tokenizer = TokenizerService()
@@ -286,7 +285,7 @@ async def get_conversation_history(
     for msg in messages:
         words = []
         try:
-            tokens = await tokenizer.tokenize(msg.content)
+            tokens = await tokenizer.tokenize(msg["content"])
             words = [
                 {
                     "word": t["surface"],
@@ -301,11 +300,11 @@ async def get_conversation_history(
 
         response_messages.append(
             {
-                "role": msg.role,
-                "content": msg.content,
+                "role": msg["role"],
+                "content": msg["content"],
                 "words": words,
-                "audio_url": msg.audio_url,
-                "created_at": msg.created_at.isoformat(),
+                "audio_url": msg["audio_url"],
+                "created_at": msg["created_at"],
             }
         )
 
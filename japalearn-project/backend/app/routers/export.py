@@ -0,0 +1,319 @@
+"""Bulk export of a user's learning data."""
+from __future__ import annotations
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.auth import get_current_user
+from app.core.db import ReadSessionLocal
+from app.models.chat import ChatConversation, ChatMessage
+from app.models.translation import UserTranslation
+from app.models.user import User
+from app.models.word import JapaneseWord, UserWordProgress
+from app.services.chat_archive import ChatArchiveService
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+router = APIRouter()
+
+# Rows fetched per server-side cursor round trip and per output chunk
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+# Column name -> type, used for CSV headers and the Parquet schema
+EXPORT_COLUMNS: dict[str, dict[str, str]] = {
+    "translations": {
+        "id": "string",
+        "source_text": "string",
+        "source_lang": "string",
+        "translated_text": "string",
+        "target_lang": "string",
+        "translation_service": "string",
+        "favorited": "bool",
+        "notes": "string",
+        "created_at": "timestamp",
+    },
+    "progress": {
+        "word_id": "int",
+        "word": "string",
+        "reading": "string",
+        "times_seen": "int",
+        "times_clicked": "int",
+        "mastery_level": "int",
+        "ease_factor": "float",
+        "interval_days": "int",
+        "last_reviewed": "timestamp",
+        "next_review": "timestamp",
+    },
+    "chat": {
+        "conversation_id": "string",
+        "context_sentence": "string",
+        "role": "string",
+        "content": "string",
+        "audio_url": "string",
+        "created_at": "timestamp",
+    },
+}
+
+
+def _export_query(dataset: str, user_id: str) -> Select:
+    """Build the projection query for an export dataset."""
+    if dataset == "translations":
+        return (
+            select(
+                UserTranslation.id,
+                UserTranslation.source_text,
+                UserTranslation.source_lang,
+                UserTranslation.translated_text,
+                UserTranslation.target_lang,
+                UserTranslation.translation_service,
+                UserTranslation.favorited,
+                UserTranslation.notes,
+                UserTranslation.created_at,
+            )
+            .where(UserTranslation.user_id == user_id)
+            .order_by(UserTranslation.created_at, UserTranslation.id)
+        )
+
+    if dataset == "progress":
+        return (
+            select(
+                UserWordProgress.word_id,
+                JapaneseWord.word,
+                JapaneseWord.reading,
+                UserWordProgress.times_seen,
+                UserWordProgress.times_clicked,
+                UserWordProgress.mastery_level,
+                UserWordProgress.ease_factor,
+                UserWordProgress.interval_days,
+                UserWordProgress.last_reviewed,
+                UserWordProgress.next_review,
+            )
+            .join(JapaneseWord, JapaneseWord.id == UserWordProgress.word_id)
+            .where(UserWordProgress.user_id == user_id)
+            .order_by(UserWordProgress.word_id)
+        )
+
+    return (
+        select(
+            ChatMessage.conversation_id,
+            ChatConversation.context_sentence,
+            ChatMessage.role,
+            ChatMessage.content,
+            ChatMessage.audio_url,
+            ChatMessage.created_at,
+        )
+        .join(ChatConversation, ChatConversation.id == ChatMessage.conversation_id)
+        .where(ChatConversation.user_id == user_id)
+        .order_by(ChatMessage.conversation_id, ChatMessage.created_at)
+    )
+
+
+async def _stream_batches(dataset: str, user_id: str) -> AsyncIterator[list[dict[str, Any]]]:
+    """
+    Yield export rows in batches using a server-side cursor.
+
+    The session is opened here rather than injected, because request
+    dependencies are torn down before a streaming body is sent.
+    """
+    query = _export_query(dataset, user_id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+
+    async with ReadSessionLocal() as session:
+        result = await session.stream(query)
+        async for partition in result.mappings().partitions(EXPORT_BATCH_SIZE):
+            yield [dict(row) for row in partition]
+
+        if dataset == "chat":
+            async for batch in _archived_chat_batches(session, user_id):
+                yield batch
+
+
+async def _archived_chat_batches(
+    session: AsyncSession, user_id: str
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Yield chat export rows of archived conversations, loaded from S3 one at a time."""
+    result = await session.execute(
+        select(ChatConversation.id, ChatConversation.context_sentence)
+        .where(
+            ChatConversation.user_id == user_id,
+            ChatConversation.archived_at.is_not(None),
+            ChatConversation.archive_key.is_not(None),
+        )
+        .order_by(ChatConversation.id)
+    )
+    archive = ChatArchiveService()
+    batch: list[dict[str, Any]] = []
+    for conversation_id, context_sentence in result.all():
+        for message in await archive.load_messages(session, conversation_id):
+            batch.append(
+                {
+                    "conversation_id": conversation_id,
+                    "context_sentence": context_sentence,
+                    "role": message["role"],
+                    "content": message["content"],
+                    "audio_url": message.get("audio_url"),
+                    "created_at": datetime.fromisoformat(message["created_at"]),
+                }
+            )
+        if len(batch) >= EXPORT_BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize datetimes and other non-JSON values."""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+async def _ndjson_body(dataset: str, user_id: str) -> AsyncIterator[bytes]:
+    async for batch in _stream_batches(dataset, user_id):
+        yield "".join(
+            json.dumps(row, default=_json_default, ensure_ascii=False) + "\n"
+            for row in batch
+        ).encode("utf-8")
+
+
+async def _csv_body(dataset: str, user_id: str) -> AsyncIterator[bytes]:
+    columns = list(EXPORT_COLUMNS[dataset])
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns)
+    writer.writeheader()
+
+    async for batch in _stream_batches(dataset, user_id):
+        for row in batch:
+            writer.writerow(
+                {k: v.isoformat() if hasattr(v, "isoformat") else v for k, v in row.items()}
+            )
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands written bytes back in chunks.
+
+    Keeps an absolute position so the Parquet writer can record offsets
+    while the already-sent bytes are released.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _parquet_schema(dataset: str) -> "pa.Schema":
+    types = {
+        "string": pa.string(),
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "bool": pa.bool_(),
+        "timestamp": pa.timestamp("us", tz="UTC"),
+    }
+    return pa.schema(
+        [(name, types[kind]) for name, kind in EXPORT_COLUMNS[dataset].items()]
+    )
+
+
+async def _parquet_body(dataset: str, user_id: str) -> AsyncIterator[bytes]:
+    schema = _parquet_schema(dataset)
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+
+    try:
+        async for batch in _stream_batches(dataset, user_id):
+            # One row group per batch keeps memory bounded by the batch size
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+
+    yield sink.drain()
+
+
+@router.get("")
+async def export_data(
+    format: str = "ndjson",
+    dataset: str = "translations",
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    """
+    Export the user's learning data as a download.
+
+    - dataset: translations, progress or chat
+    - format: ndjson, csv or parquet
+
+    Rows are streamed from a server-side cursor in fixed-size batches,
+    so memory use does not grow with the number of rows exported.
+    The chat dataset ends with archived conversations, read from S3.
+    """
+    if dataset not in EXPORT_COLUMNS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown dataset '{dataset}'. Available: {', '.join(EXPORT_COLUMNS)}",
+        )
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown format '{format}'. Available: {', '.join(EXPORT_FORMATS)}",
+        )
+    if format == "parquet" and not PYARROW_AVAILABLE:
+        raise HTTPException(status_code=400, detail="Parquet export requires pyarrow")
+
+    body = {
+        "ndjson": _ndjson_body,
+        "csv": _csv_body,
+        "parquet": _parquet_body,
+    }[format](dataset, current_user.id)
+
+    media_type, extension = EXPORT_FORMATS[format]
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="japalearn-{dataset}.{extension}"'
+        },
+    )
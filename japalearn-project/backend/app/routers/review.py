@@ -0,0 +1,216 @@
+"""Spaced-repetition review endpoints."""
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel, Field
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.auth import get_current_user
+from app.core.db import dialect_insert, get_read_session, get_session, pin_to_primary
+from app.models.user import User
+from app.models.word import JapaneseWord, UserWordProgress
+from app.services.srs import SRSScheduler
+from app.services.stats_counter import get_stats_counter
+
+router = APIRouter()
+
+MAX_GRADES_PER_REQUEST = 1000
+
+
+class DueCard(BaseModel):
+    """Word due for review."""
+
+    word_id: int
+    word: str
+    reading: str | None = None
+    romanji: str | None = None
+    definition: str | None = None
+    mastery_level: int
+    next_review: datetime
+
+
+class GradeItem(BaseModel):
+    """Review result for a single word."""
+
+    word_id: int
+    grade: int = Field(ge=0, le=5)  # SM-2 recall quality
+    reviewed_at: datetime | None = None
+
+
+class GradeRequest(BaseModel):
+    """Batch of review results."""
+
+    grades: list[GradeItem] = Field(max_length=MAX_GRADES_PER_REQUEST)
+
+
+class GradeResult(BaseModel):
+    """Updated schedule for a graded word."""
+
+    word_id: int
+    mastery_level: int
+    interval_days: int
+    next_review: datetime
+
+
+def _review_time(item: GradeItem, now: datetime) -> datetime:
+    """
+    Get when a grade was given, treating naive timestamps as UTC.
+
+    Future timestamps are clamped to now, so a client clock cannot push
+    next_review arbitrarily far out.
+    """
+    if item.reviewed_at is None:
+        return now
+    reviewed_at = item.reviewed_at
+    if reviewed_at.tzinfo is None:
+        reviewed_at = reviewed_at.replace(tzinfo=timezone.utc)
+    return min(reviewed_at, now)
+
+
+@router.get("/due", response_model=list[DueCard])
+async def get_due_cards(
+    limit: int = Query(100, ge=1, le=500),
+    session: AsyncSession = Depends(get_read_session),
+    current_user: User = Depends(get_current_user),
+) -> list[DueCard]:
+    """
+    Get the user's words that are due for review, most overdue first.
+
+    Served by the partial (user_id, next_review) index in a single query.
+    """
+    result = await session.execute(
+        select(
+            UserWordProgress.word_id,
+            UserWordProgress.mastery_level,
+            UserWordProgress.next_review,
+            JapaneseWord.word,
+            JapaneseWord.reading,
+            JapaneseWord.romanji,
+            JapaneseWord.definition_en,
+        )
+        .join(JapaneseWord, JapaneseWord.id == UserWordProgress.word_id)
+        .where(
+            UserWordProgress.user_id == current_user.id,
+            UserWordProgress.next_review.is_not(None),
+            UserWordProgress.next_review <= datetime.now(timezone.utc),
+        )
+        .order_by(UserWordProgress.next_review.asc())
+        .limit(limit)
+    )
+
+    return [
+        DueCard(
+            word_id=row.word_id,
+            word=row.word,
+            reading=row.reading,
+            romanji=row.romanji,
+            definition=row.definition_en,
+            mastery_level=row.mastery_level,
+            next_review=row.next_review,
+        )
+        for row in result
+    ]
+
+
+@router.post("/grade", response_model=list[GradeResult])
+async def grade_reviews(
+    request: GradeRequest,
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> list[GradeResult]:
+    """
+    Apply a batch of review grades in one transaction.
+
+    Grades for the same word are applied in review order.
+    """
+    if not request.grades:
+        return []
+
+    now = datetime.now(timezone.utc)
+    grades = sorted(request.grades, key=lambda g: _review_time(g, now))
+    word_ids = {g.word_id for g in grades}
+
+    result = await session.execute(
+        select(UserWordProgress).where(
+            UserWordProgress.user_id == current_user.id,
+            UserWordProgress.word_id.in_(word_ids),
+        )
+    )
+    progress_by_word = {p.word_id: p for p in result.scalars()}
+
+    # Words graded before they were ever looked up get a fresh record
+    missing = word_ids - progress_by_word.keys()
+    if missing:
+        result = await session.execute(
+            select(JapaneseWord.id).where(JapaneseWord.id.in_(missing))
+        )
+        existing = set(result.scalars())
+        unknown = missing - existing
+        if unknown:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Words not found: {', '.join(str(w) for w in sorted(unknown))}",
+            )
+        # The progress tracker may upsert the same rows concurrently, so
+        # insert with the same conflict target and read back whichever won
+        insert = dialect_insert()
+        await session.execute(
+            insert(UserWordProgress).on_conflict_do_nothing(
+                index_elements=[UserWordProgress.user_id, UserWordProgress.word_id]
+            ),
+            [
+                {
+                    "id": str(uuid.uuid4()),
+                    "user_id": current_user.id,
+                    "word_id": word_id,
+                    "times_seen": 0,
+                    "times_clicked": 0,
+                    "mastery_level": 0,
+                    "ease_factor": 2.5,
+                    "interval_days": 0,
+                    "repetitions": 0,
+                }
+                for word_id in sorted(missing)
+            ],
+        )
+        result = await session.execute(
+            select(UserWordProgress).where(
+                UserWordProgress.user_id == current_user.id,
+                UserWordProgress.word_id.in_(missing),
+            )
+        )
+        progress_by_word.update({p.word_id: p for p in result.scalars()})
+
+    scheduler = SRSScheduler()
+    learned_before = {
+        word_id: p.mastery_level >= scheduler.LEARNED_MASTERY
+        for word_id, p in progress_by_word.items()
+    }
+    for item in grades:
+        scheduler.apply_grade(
+            progress_by_word[item.word_id], item.grade, _review_time(item, now)
+        )
+
+    await session.commit()
+    await pin_to_primary(current_user.id)
+
+    # Words crossing the learned threshold either way adjust the user's total
+    learned_delta = sum(
+        (p.mastery_level >= scheduler.LEARNED_MASTERY) - learned_before[word_id]
+        for word_id, p in progress_by_word.items()
+    )
+    get_stats_counter().increment(current_user.id, "total_words_learned", learned_delta)
+
+    return [
+        GradeResult(
+            word_id=p.word_id,
+            mastery_level=p.mastery_level,
+            interval_days=p.interval_days,
+            next_review=p.next_review,
+        )
+        for p in (progress_by_word[word_id] for word_id in sorted(word_ids))
+    ]
@@ -0,0 +1,39 @@
+"""User statistics endpoints."""
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel
+
+from app.core.auth import get_current_user
+from app.models.user import User
+from app.services.stats_counter import get_stats_counter
+
+router = APIRouter()
+
+
+class UserStats(BaseModel):
+    """Rolled-up learning statistics for a user."""
+
+    total_translations: int
+    total_words_learned: int
+
+
+@router.get("", response_model=UserStats)
+async def get_user_stats(current_user: User = Depends(get_current_user)) -> UserStats:
+    """
+    Get the current user's learning statistics.
+
+    Served from the users counter columns plus increments this worker
+    has buffered but not yet flushed.
+
+    Counts are eventually consistent across workers. Increments buffered
+    by other workers appear once those workers flush, within
+    stats_flush_interval_seconds (5s by default). Until then two requests
+    may return different totals, depending on which worker serves them.
+    """
+    pending = get_stats_counter().pending(current_user.id)
+
+    return UserStats(
+        total_translations=current_user.total_translations + pending["total_translations"],
+        total_words_learned=current_user.total_words_learned + pending["total_words_learned"],
+    )
@@ -1,17 +1,24 @@
 """Translation endpoints."""
 from __future__ import annotations
 
-from typing import Optional
+import base64
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_current_user_optional
-from app.core.db import get_session
+from app.core.auth import get_current_user, get_current_user_optional
+from app.core.config import get_settings
+from app.core.db import AsyncSessionLocal, get_read_session, get_session, pin_to_primary
 from app.models.user import User
 from app.services.translator import TranslatorService
 
+settings = get_settings()
+
 router = APIRouter()
 
 
@@ -75,37 +82,190 @@ async def translate(
         raise HTTPException(status_code=500, detail=f"Translation failed: {str(e)}")
 
 
+def _sse_event(event: str, data: dict[str, Any]) -> bytes:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode("utf-8")
+
+
+async def _translate_stream_body(
+    request: TranslateRequest, user: Optional[User]
+) -> AsyncIterator[bytes]:
+    """
+    Stream translation events.
+
+    The session is opened here rather than injected, because request
+    dependencies are torn down before a streaming body is sent.
+    """
+    translator = TranslatorService()
+    try:
+        async with AsyncSessionLocal() as session:
+            async for event, data in translator.translate_stream(
+                text=request.text,
+                source=request.source,
+                target=request.target,
+                session=session,
+                user=user,
+            ):
+                yield _sse_event(event, data)
+    except Exception as e:
+        yield _sse_event("error", {"detail": f"Translation failed: {str(e)}"})
+
+
+@router.post("/translate/stream")
+async def translate_stream(
+    request: TranslateRequest,
+    current_user: Optional[User] = Depends(get_current_user_optional),
+) -> StreamingResponse:
+    """
+    Translate text, streaming the translation as Server-Sent Events.
+
+    - event "delta": {"text"}, a piece of the translation as it is generated
+    - event "done": the full TranslateResponse including the word breakdown
+    - event "error": {"detail"} if translation fails
+
+    Stores the translation in user history if authenticated.
+    """
+    return StreamingResponse(
+        _translate_stream_body(request, current_user),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Disable proxy buffering (nginx)
+        },
+    )
+
+
+class BatchTranslateRequest(BaseModel):
+    """Batch translation request."""
+
+    texts: list[str] = Field(min_length=1)
+    source: str = "en"  # Source language code
+    target: str = "ja"  # Target language code
+
+
+class BatchTranslateResponse(BaseModel):
+    """Batch translation response, one entry per input text in order."""
+
+    translations: list[TranslateResponse]
+
+
+@router.post("/translate/batch", response_model=BatchTranslateResponse)
+async def translate_batch(
+    request: BatchTranslateRequest,
+    session: AsyncSession = Depends(get_session),
+    current_user: Optional[User] = Depends(get_current_user_optional),
+) -> BatchTranslateResponse:
+    """
+    Translate many texts at once (e.g. subtitle lines or article sentences).
+
+    - Duplicate texts are translated once
+    - Cached translations are served in one round trip
+    - Uncached texts are sent to the provider in batches
+    - Stores all translations in user history if authenticated
+    """
+    if len(request.texts) > settings.translate_batch_max_texts:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.translate_batch_max_texts} texts per batch",
+        )
+
+    translator = TranslatorService()
+
+    try:
+        translations = await translator.translate_batch(
+            texts=request.texts,
+            source=request.source,
+            target=request.target,
+            session=session,
+            user=current_user,
+        )
+        return BatchTranslateResponse(translations=translations)
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Translation failed: {str(e)}")
+
+
+def _encode_history_cursor(created_at: datetime, translation_id: str) -> str:
+    """Encode the position of the last returned history row."""
+    raw = f"{created_at.isoformat()}|{translation_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_history_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a history cursor into (created_at, id)."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, translation_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), translation_id
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
 @router.get("/history")
 async def get_translation_history(
-    limit: int = 50,
-    session: AsyncSession = Depends(get_session),
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = None,
+    favorited: Optional[bool] = None,
+    session: AsyncSession = Depends(get_read_session),
     current_user: User = Depends(get_current_user),
 ):
-    """Get user's translation history."""
-    from sqlalchemy import select
+    """
+    Get user's translation history, newest first.
+
+    Pages with a keyset cursor over (created_at, id), so each page is a
+    range scan on the (user_id, created_at, id) index regardless of depth.
+    Pass the returned next_cursor to fetch the following page.
+    """
+    from sqlalchemy import select, tuple_
 
     from app.models.translation import UserTranslation
 
+    query = select(
+        UserTranslation.id,
+        UserTranslation.source_text,
+        UserTranslation.translated_text,
+        UserTranslation.source_lang,
+        UserTranslation.target_lang,
+        UserTranslation.favorited,
+        UserTranslation.created_at,
+    ).where(UserTranslation.user_id == current_user.id)
+
+    if favorited is not None:
+        query = query.where(UserTranslation.favorited == favorited)
+
+    if cursor:
+        created_at, translation_id = _decode_history_cursor(cursor)
+        query = query.where(
+            tuple_(UserTranslation.created_at, UserTranslation.id)
+            < tuple_(created_at, translation_id)
+        )
+
     result = await session.execute(
-        select(UserTranslation)
-        .where(UserTranslation.user_id == current_user.id)
-        .order_by(UserTranslation.created_at.desc())
-        .limit(limit)
+        query.order_by(UserTranslation.created_at.desc(), UserTranslation.id.desc())
+        .limit(limit + 1)
     )
-    translations = result.scalars().all()
-
-    return [
-        {
-            "id": t.id,
-            "source_text": t.source_text,
-            "translated_text": t.translated_text,
-            "source_lang": t.source_lang,
-            "target_lang": t.target_lang,
-            "favorited": t.favorited,
-            "created_at": t.created_at.isoformat(),
-        }
-        for t in translations
-    ]
+    rows = result.all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_history_cursor(rows[-1].created_at, rows[-1].id)
+
+    return {
+        "items": [
+            {
+                "id": t.id,
+                "source_text": t.source_text,
+                "translated_text": t.translated_text,
+                "source_lang": t.source_lang,
+                "target_lang": t.target_lang,
+                "favorited": t.favorited,
+                "created_at": t.created_at.isoformat(),
+            }
+            for t in rows
+        ],
+        "next_cursor": next_cursor,
+    }
 
 
 @router.post("/history/{translation_id}/favorite")
@@ -132,5 +292,6 @@ async def toggle_favorite(
 
     translation.favorited = not translation.favorited
     await session.commit()
+    await pin_to_primary(current_user.id)
 
     return {"favorited": translation.favorited}
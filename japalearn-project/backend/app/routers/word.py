@@ -8,7 +8,7 @@ from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import get_current_user_optional
-from app.core.db import get_session
+from app.core.db import get_read_session, get_session
 from app.core.language_manager import LanguageManager
 from app.models.user import User
 from app.services.grammar_service import GrammarService
@@ -68,7 +68,7 @@ class ExplainResponse(BaseModel):
 async def get_word_info(
     word: str,
     language: str = "ja",
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     current_user: Optional[User] = Depends(get_current_user_optional),
     language_manager: LanguageManager = Depends(lambda: LanguageManager()),
 ) -> WordInfo:
@@ -81,7 +81,7 @@ async def get_word_info(
     Args:
         word: Word to look up
         language: Language code (default: 'ja' for Japanese)
-        session: Database session
+        session: Read-only database session for dictionary lookups
         current_user: Current user (optional)
         language_manager: Language manager instance
 
@@ -142,7 +142,7 @@ async def explain_sentence(
 async def get_word_examples(
     word: str,
     limit: int = 5,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
 ):
     """Get example sentences for a word."""
     from sqlalchemy import select
@@ -0,0 +1,174 @@
+"""Cache warming after deploys and Redis flushes.
+
+Precomputes WordInfo for the most frequent words and the tokenization of
+conversation scenario starter messages, with bounded concurrency and
+short pauses so warming never competes with live traffic.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Optional
+
+from sqlalchemy import select
+
+from app.core.cache import CacheUnavailableError, cache_acquire_lock, cache_release_lock
+from app.core.config import get_settings
+from app.core.db import ReadSessionLocal
+from app.core.tasks import PeriodicTask
+from app.models.word import JapaneseWord
+from app.services.jdict_service import JDictService
+from app.services.tokenizer import TokenizerService
+
+settings = get_settings()
+
+# Mirrors starterMessage in frontend/src/data/scenarios.ts; keep in sync
+SCENARIO_STARTER_MESSAGES = {
+    "cafe-order": "いらっしゃいませ！ご注文をどうぞ。",
+    "directions": "こんにちは！どこに行きたいですか？",
+    "shopping": "いらっしゃいませ。何をお探しですか？",
+    "restaurant": "こんばんは。お席へどうぞ。メニューです。",
+    "train-station": "いらっしゃいませ。どちらまでですか？",
+    "hotel-checkin": "いらっしゃいませ。ご予約のお名前をお願いします。",
+    "doctor-visit": "こんにちは。今日はどうされましたか？",
+    "job-interview": "本日はお越しいただきありがとうございます。自己紹介をお願いします。",
+    "making-friends": "こんにちは！初めまして。趣味は何ですか？",
+    "phone-call": "お電話ありがとうございます。レストラン山田でございます。",
+}
+
+# Only one worker warms at a time
+WARM_LOCK_KEY = "cache_warm:lock"
+WARM_LOCK_SECONDS = 600
+
+
+class CacheWarmer:
+    """Precompute hot cache entries."""
+
+    def __init__(self):
+        self.jdict_service = JDictService()
+        self.tokenizer = TokenizerService()
+        self._semaphore = asyncio.Semaphore(settings.cache_warm_concurrency)
+
+    async def top_words(self, limit: int) -> list[str]:
+        """
+        Get the most useful words to warm.
+
+        Ordered by frequency_rank (most frequent first), then by JLPT level
+        (N5 first) for words without a rank.
+        """
+        async with ReadSessionLocal() as session:
+            result = await session.execute(
+                select(JapaneseWord.word)
+                .order_by(
+                    JapaneseWord.frequency_rank.asc().nulls_last(),
+                    JapaneseWord.jlpt_level.desc().nulls_last(),
+                )
+                .limit(limit)
+            )
+            return list(result.scalars().all())
+
+    async def _warm_word(self, word: str) -> bool:
+        async with self._semaphore:
+            try:
+                async with ReadSessionLocal() as session:
+                    await self.jdict_service.get_word_info(word, session)
+                return True
+            except Exception as e:
+                print(f"Cache warm failed for word {word}: {e}")
+                return False
+            finally:
+                await asyncio.sleep(settings.cache_warm_pause_seconds)
+
+    async def _warm_tokens(self, text: str) -> bool:
+        async with self._semaphore:
+            try:
+                await self.tokenizer.tokenize(text)
+                return True
+            except Exception as e:
+                print(f"Cache warm failed for tokens of {text}: {e}")
+                return False
+            finally:
+                await asyncio.sleep(settings.cache_warm_pause_seconds)
+
+    async def warm(self, word_limit: Optional[int] = None) -> dict[str, int]:
+        """
+        Warm word info and scenario tokenization caches.
+
+        Args:
+            word_limit: Number of top words to warm (defaults to settings)
+
+        Returns:
+            Counts of warmed entries, or {"skipped": 1} if another worker
+            is already warming or the cache is unavailable
+        """
+        try:
+            token = await cache_acquire_lock(WARM_LOCK_KEY, WARM_LOCK_SECONDS)
+        except CacheUnavailableError as e:
+            print(f"Cache warm skipped: {e}")
+            return {"skipped": 1}
+        if not token:
+            return {"skipped": 1}
+
+        try:
+            words = await self.top_words(word_limit or settings.cache_warm_word_limit)
+            word_results = await asyncio.gather(*(self._warm_word(w) for w in words))
+            token_results = await asyncio.gather(
+                *(self._warm_tokens(m) for m in SCENARIO_STARTER_MESSAGES.values())
+            )
+        finally:
+            # Only our own lock: it may have expired and been taken by another worker
+            await cache_release_lock(WARM_LOCK_KEY, token)
+
+        return {"words": sum(word_results), "starter_messages": sum(token_results)}
+
+
+# Background warming state (one per worker)
+_warm_task: Optional[asyncio.Task] = None
+_scheduled: Optional[PeriodicTask] = None
+
+
+async def _warm_and_log(word_limit: Optional[int] = None) -> None:
+    try:
+        counts = await CacheWarmer().warm(word_limit)
+        print(f"Cache warming finished: {counts}")
+    except Exception as e:
+        print(f"Cache warming failed: {e}")
+
+
+def trigger_cache_warming(word_limit: Optional[int] = None) -> bool:
+    """
+    Start warming in the background.
+
+    Returns:
+        False if this worker is already warming
+    """
+    global _warm_task
+    if _warm_task is not None and not _warm_task.done():
+        return False
+    _warm_task = asyncio.get_running_loop().create_task(_warm_and_log(word_limit))
+    return True
+
+
+def start_cache_warming() -> None:
+    """Warm on startup and, if configured, on a schedule."""
+    global _scheduled
+    trigger_cache_warming()
+    if settings.cache_warm_interval_seconds > 0 and _scheduled is None:
+        _scheduled = PeriodicTask(
+            "Cache warming", settings.cache_warm_interval_seconds, _warm_and_log
+        )
+        _scheduled.start()
+
+
+async def stop_cache_warming() -> None:
+    """Cancel scheduled and in-progress warming."""
+    global _warm_task, _scheduled
+    if _scheduled is not None:
+        await _scheduled.stop()
+        _scheduled = None
+    if _warm_task is not None:
+        _warm_task.cancel()
+        try:
+            await _warm_task
+        except asyncio.CancelledError:
+            pass
+        _warm_task = None
@@ -0,0 +1,255 @@
+"""Cold storage for idle chat conversations.
+
+Conversations with no messages inside the retention window are moved out
+of ``chat_messages`` into a gzip-compressed JSONL object in S3, keeping
+the hot partitions and their indexes small. Archived history is loaded
+from S3 on demand, and a conversation is restored to the database if the
+learner continues it.
+"""
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from sqlalchemy import delete, exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import cache_delete
+from app.core.config import get_settings
+from app.core.db import AsyncSessionLocal
+from app.core.s3 import delete_file, download_file, upload_file
+from app.core.tasks import PeriodicTask
+from app.models.chat import ChatConversation, ChatMessage
+from app.services.chat_history import ChatHistoryService
+
+settings = get_settings()
+
+ARCHIVE_PREFIX = "archive/chat"
+
+
+def _serialize(messages: list[dict[str, Any]]) -> bytes:
+    """Encode messages as gzip-compressed JSON lines."""
+    lines = "\n".join(json.dumps(m, ensure_ascii=False) for m in messages)
+    return gzip.compress(lines.encode("utf-8"))
+
+
+def _deserialize(data: bytes) -> list[dict[str, Any]]:
+    """Decode gzip-compressed JSON lines."""
+    text = gzip.decompress(data).decode("utf-8")
+    return [json.loads(line) for line in text.splitlines() if line]
+
+
+def _message_dict(message: ChatMessage) -> dict[str, Any]:
+    return {
+        "id": message.id,
+        "role": message.role,
+        "content": message.content,
+        "audio_url": message.audio_url,
+        "created_at": message.created_at.isoformat(),
+    }
+
+
+class ChatArchiveService:
+    """Archive idle conversations to S3 and read them back."""
+
+    def __init__(self, retention_days: Optional[int] = None):
+        self.retention_days = retention_days or settings.chat_archive_after_days
+
+    @staticmethod
+    def _archive_key(conversation: ChatConversation) -> str:
+        created = conversation.created_at
+        return f"{ARCHIVE_PREFIX}/{created:%Y/%m}/{conversation.id}.jsonl.gz"
+
+    async def sweep(self) -> int:
+        """
+        Archive conversations that have been idle past the retention window.
+
+        Candidates are locked with SKIP LOCKED so concurrent workers never
+        archive the same conversation twice.
+
+        Returns:
+            Number of conversations archived
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.retention_days)
+        recent_message = (
+            select(ChatMessage.id)
+            .where(
+                ChatMessage.conversation_id == ChatConversation.id,
+                ChatMessage.created_at >= cutoff,
+            )
+            .correlate(ChatConversation)
+        )
+
+        archived = 0
+        async with AsyncSessionLocal() as session:
+            # One row per transaction: archive() commits, which releases the lock
+            candidate = (
+                select(ChatConversation)
+                .where(
+                    ChatConversation.archived_at.is_(None),
+                    ChatConversation.created_at < cutoff,
+                    ~exists(recent_message),
+                )
+                .order_by(ChatConversation.created_at)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            )
+            for _ in range(settings.chat_archive_batch_size):
+                result = await session.execute(candidate)
+                conversation = result.scalar_one_or_none()
+                if conversation is None:
+                    break
+                try:
+                    if await self.archive(session, conversation):
+                        archived += 1
+                except Exception as e:
+                    print(f"Error archiving conversation {conversation.id}: {e}")
+                    await session.rollback()
+                    break
+
+        return archived
+
+    async def archive(self, session: AsyncSession, conversation: ChatConversation) -> bool:
+        """
+        Move a conversation's messages to S3 and delete them from the database.
+
+        Args:
+            session: Database session holding the conversation row
+            conversation: Conversation to archive
+
+        Returns:
+            False if a message arrived while archiving (nothing is archived)
+        """
+        result = await session.execute(
+            select(ChatMessage)
+            .where(ChatMessage.conversation_id == conversation.id)
+            .order_by(ChatMessage.created_at.asc())
+        )
+        messages = [_message_dict(m) for m in result.scalars().all()]
+
+        archive_key = None
+        if messages:
+            archive_key = self._archive_key(conversation)
+            await asyncio.to_thread(
+                upload_file, _serialize(messages), archive_key, "application/gzip"
+            )
+
+        # Delete only what was archived; sending a message does not lock the conversation
+        archived_ids = [m["id"] for m in messages]
+        if archived_ids:
+            await session.execute(
+                delete(ChatMessage).where(
+                    ChatMessage.conversation_id == conversation.id,
+                    ChatMessage.id.in_(archived_ids),
+                )
+            )
+        late_message = await session.execute(
+            select(ChatMessage.id).where(ChatMessage.conversation_id == conversation.id).limit(1)
+        )
+        if late_message.first() is not None:
+            # A message arrived mid-archive: the conversation is active again
+            await session.rollback()
+            if archive_key:
+                await asyncio.to_thread(delete_file, archive_key)
+            return False
+
+        conversation.archived_at = datetime.now(timezone.utc)
+        conversation.archive_key = archive_key
+        await session.commit()
+
+        await cache_delete(ChatHistoryService.cache_key(conversation.id))
+        return True
+
+    async def load_messages(
+        self, session: AsyncSession, conversation_id: str
+    ) -> list[dict[str, Any]]:
+        """
+        Get the full message history of a conversation, hot or archived.
+
+        Args:
+            session: Database session
+            conversation_id: Conversation ID
+
+        Returns:
+            Messages oldest first, with created_at as ISO strings
+        """
+        conversation = await session.get(ChatConversation, conversation_id)
+        if conversation and conversation.archived_at:
+            if not conversation.archive_key:
+                return []
+            data = await asyncio.to_thread(download_file, conversation.archive_key)
+            return _deserialize(data)
+
+        result = await session.execute(
+            select(ChatMessage)
+            .where(ChatMessage.conversation_id == conversation_id)
+            .order_by(ChatMessage.created_at.asc())
+        )
+        return [_message_dict(m) for m in result.scalars().all()]
+
+    async def restore(self, session: AsyncSession, conversation: ChatConversation) -> None:
+        """
+        Move an archived conversation back into the database.
+
+        Concurrent restores of the same conversation are serialized on the
+        conversation row; later ones find it already restored.
+
+        Args:
+            session: Database session holding the conversation row
+            conversation: Archived conversation to restore
+        """
+        # Lock the row and re-read archived_at under the lock
+        await session.execute(
+            select(ChatConversation)
+            .where(ChatConversation.id == conversation.id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        if not conversation.archived_at:
+            # Restored by another request while we waited; release the lock
+            await session.commit()
+            return
+
+        archive_key = conversation.archive_key
+        if archive_key:
+            data = await asyncio.to_thread(download_file, archive_key)
+            for message in _deserialize(data):
+                session.add(
+                    ChatMessage(
+                        id=message["id"],
+                        conversation_id=conversation.id,
+                        role=message["role"],
+                        content=message["content"],
+                        audio_url=message.get("audio_url"),
+                        created_at=datetime.fromisoformat(message["created_at"]),
+                    )
+                )
+
+        conversation.archived_at = None
+        conversation.archive_key = None
+        await session.commit()
+
+        if archive_key:
+            try:
+                await asyncio.to_thread(delete_file, archive_key)
+            except Exception as e:
+                print(f"Error deleting restored archive {archive_key}: {e}")
+
+
+# Sweeper (one per worker; SKIP LOCKED keeps them from overlapping)
+_sweeper: Optional[PeriodicTask] = None
+
+
+def get_archive_sweeper() -> PeriodicTask:
+    """Get the background chat archive sweeper."""
+    global _sweeper
+    if _sweeper is None:
+        _sweeper = PeriodicTask(
+            "Chat archive sweep",
+            settings.chat_archive_interval_seconds,
+            ChatArchiveService().sweep,
+        )
+    return _sweeper
@@ -0,0 +1,81 @@
+"""Recent conversation history for building LLM context."""
+from __future__ import annotations
+
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import cache_list_append, cache_list_get, cache_list_set
+from app.core.cache_keys import make_cache_key
+from app.core.config import get_settings
+from app.models.chat import ChatMessage
+
+settings = get_settings()
+
+
+class ChatHistoryService:
+    """Fetch and maintain the recent message window of a conversation.
+
+    The window is read with ORDER BY created_at DESC LIMIT n on the
+    (conversation_id, created_at) index and cached as a Redis list that
+    is appended to as messages are saved, so building context costs
+    O(window) regardless of conversation length.
+    """
+
+    def __init__(self, window_size: Optional[int] = None):
+        self.window_size = window_size or settings.chat_window_size
+
+    @staticmethod
+    def cache_key(conversation_id: str) -> str:
+        """Get the cache key of a conversation's window."""
+        return make_cache_key("chat_window", conversation_id)
+
+    async def get_window(
+        self, session: AsyncSession, conversation_id: str
+    ) -> list[dict[str, str]]:
+        """
+        Get the most recent messages of a conversation, oldest first.
+
+        Args:
+            session: Database session
+            conversation_id: Conversation ID
+
+        Returns:
+            List of {"role", "content"} dictionaries
+        """
+        cache_key = self.cache_key(conversation_id)
+        try:
+            cached = await cache_list_get(cache_key)
+            if cached is not None:
+                return cached[-self.window_size:]
+        except Exception as e:
+            print(f"Chat window cache read error: {e}")
+
+        result = await session.execute(
+            select(ChatMessage.role, ChatMessage.content)
+            .where(ChatMessage.conversation_id == conversation_id)
+            .order_by(ChatMessage.created_at.desc())
+            .limit(self.window_size)
+        )
+        window = [{"role": row.role, "content": row.content} for row in result]
+        window.reverse()
+
+        try:
+            await cache_list_set(cache_key, window, ttl=settings.chat_window_cache_ttl)
+        except Exception as e:
+            print(f"Chat window cache write error: {e}")
+
+        return window
+
+    async def append(self, conversation_id: str, role: str, content: str) -> None:
+        """Add a newly saved message to the cached window."""
+        try:
+            await cache_list_append(
+                self.cache_key(conversation_id),
+                {"role": role, "content": content},
+                max_length=self.window_size,
+                ttl=settings.chat_window_cache_ttl,
+            )
+        except Exception as e:
+            print(f"Chat window cache append error: {e}")
@@ -0,0 +1,198 @@
+"""Rolling summaries to keep conversation prompts within a token budget.
+
+Prompts are built from the system prompt, a rolling summary of older
+messages and the recent message window. The summary is refreshed in the
+background every N turns, folding in messages that have left the window.
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import select
+
+from app.core.cache import cache_incr
+from app.core.cache_keys import make_cache_key
+from app.core.config import get_settings
+from app.core.db import AsyncSessionLocal
+from app.models.chat import ChatConversation, ChatMessage
+
+try:
+    import tiktoken
+
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+settings = get_settings()
+
+# Approximate per-message overhead of the chat format (role, separators)
+MESSAGE_TOKEN_OVERHEAD = 4
+
+# Upper bound on messages folded per refresh, so long backlogs catch up gradually
+MAX_MESSAGES_PER_REFRESH = 50
+
+_encoding = None
+
+# Strong references to in-flight refreshes so they are not garbage collected
+_refresh_tasks: set[asyncio.Task] = set()
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count prompt tokens locally.
+
+    Uses tiktoken when installed; otherwise falls back to one token per
+    character, which over-estimates English and is close for Japanese.
+    """
+    global _encoding
+    if TIKTOKEN_AVAILABLE:
+        if _encoding is None:
+            try:
+                _encoding = tiktoken.encoding_for_model(settings.openai_model)
+            except KeyError:
+                _encoding = tiktoken.get_encoding("cl100k_base")
+        return len(_encoding.encode(text))
+    return len(text)
+
+
+class ConversationSummaryService:
+    """Build budgeted prompts and maintain per-conversation summaries."""
+
+    def __init__(self, openai_service=None):
+        if openai_service is None:
+            from app.services.openai_service import OpenAIService
+
+            openai_service = OpenAIService()
+        self.openai_service = openai_service
+
+    def build_messages(
+        self,
+        system_prompt: str,
+        summary: Optional[str],
+        window: list[dict[str, str]],
+        token_budget: Optional[int] = None,
+    ) -> list[dict[str, str]]:
+        """
+        Assemble chat messages within a token budget.
+
+        The system prompt and summary are always included; the oldest
+        window messages are dropped until the prompt fits, keeping at
+        least the most recent message.
+
+        Args:
+            system_prompt: Instructions for the model
+            summary: Rolling summary of earlier conversation (optional)
+            window: Recent messages, oldest first
+            token_budget: Maximum prompt tokens (defaults to settings)
+
+        Returns:
+            Messages ready for the chat completions API
+        """
+        budget = token_budget or settings.chat_prompt_token_budget
+
+        messages = [{"role": "system", "content": system_prompt}]
+        if summary:
+            messages.append(
+                {
+                    "role": "system",
+                    "content": f"Summary of the earlier conversation:\n{summary}",
+                }
+            )
+
+        used = sum(count_tokens(m["content"]) + MESSAGE_TOKEN_OVERHEAD for m in messages)
+
+        recent: list[dict[str, str]] = []
+        for msg in reversed(window):
+            cost = count_tokens(msg["content"]) + MESSAGE_TOKEN_OVERHEAD
+            if recent and used + cost > budget:
+                break
+            recent.append({"role": msg["role"], "content": msg["content"]})
+            used += cost
+
+        recent.reverse()
+        return messages + recent
+
+    async def record_turn(self, conversation_id: str) -> None:
+        """
+        Count a conversation turn and schedule a summary refresh every N turns.
+
+        The refresh runs in the background and never delays the response.
+        """
+        every = settings.chat_summary_every_n_turns
+        if every <= 0 or not self.openai_service.client:
+            return
+
+        try:
+            turns = await cache_incr(make_cache_key("chat_turns", conversation_id), ttl=86400)
+        except Exception as e:
+            print(f"Chat turn counter error: {e}")
+            return
+
+        if turns % every == 0:
+            task = asyncio.get_running_loop().create_task(self.refresh(conversation_id))
+            _refresh_tasks.add(task)
+            task.add_done_callback(_refresh_tasks.discard)
+
+    async def refresh(self, conversation_id: str) -> None:
+        """Fold messages that have left the recent window into the summary."""
+        try:
+            async with AsyncSessionLocal() as session:
+                conversation = await session.get(ChatConversation, conversation_id)
+                if not conversation:
+                    return
+
+                query = (
+                    select(ChatMessage.role, ChatMessage.content, ChatMessage.created_at)
+                    .where(ChatMessage.conversation_id == conversation_id)
+                    .order_by(ChatMessage.created_at.asc())
+                )
+                if conversation.summarized_until:
+                    query = query.where(ChatMessage.created_at > conversation.summarized_until)
+
+                limit = MAX_MESSAGES_PER_REFRESH + settings.chat_window_size
+                result = await session.execute(query.limit(limit))
+                unsummarized = result.all()
+
+                # Messages still in the recent window are sent verbatim
+                if len(unsummarized) == limit:
+                    to_fold = unsummarized[:MAX_MESSAGES_PER_REFRESH]
+                else:
+                    to_fold = unsummarized[: max(0, len(unsummarized) - settings.chat_window_size)]
+                if not to_fold:
+                    return
+
+                summary = await self._summarize(conversation.summary, to_fold)
+
+                conversation.summary = summary
+                conversation.summarized_until = to_fold[-1].created_at
+                conversation.summary_updated_at = datetime.now(timezone.utc)
+                await session.commit()
+        except Exception as e:
+            print(f"Conversation summary refresh failed: {e}")
+
+    async def _summarize(self, previous: Optional[str], messages: list) -> str:
+        """Ask the model to extend the running summary with new messages."""
+        transcript = "\n".join(f"{m.role}: {m.content}" for m in messages)
+        prompt = f"""Update the running summary of a Japanese practice conversation.
+
+Current summary:
+{previous or "(none)"}
+
+New messages:
+{transcript}
+
+Write the updated summary in at most {settings.chat_summary_max_tokens} tokens.
+Keep the scenario, facts the learner shared, and mistakes they made."""
+
+        response = await self.openai_service.client.chat.completions.create(
+            model=settings.openai_model,
+            messages=[
+                {"role": "system", "content": "You summarize conversations concisely."},
+                {"role": "user", "content": prompt},
+            ],
+            temperature=0.3,
+            max_tokens=settings.chat_summary_max_tokens,
+        )
+        return response.choices[0].message.content.strip()
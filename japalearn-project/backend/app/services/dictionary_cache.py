@@ -0,0 +1,73 @@
+"""Negative caching and miss tracking for dictionary lookups.
+
+Words that are not found after the full fallback chain are cached under
+their normal word_info key with a short-lived "not found" marker, so
+repeated hovers on unknown tokens skip Sudachi and the database. Misses
+are also counted in a sorted set to show which unknown words are hot.
+
+Importing dictionary rows bumps the word_info namespace, which drops
+negative entries along with everything else.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from app.core.cache import cache_set, cache_zincr, cache_ztop
+from app.core.cache_keys import make_cache_key, normalize_text
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# Marks a cached word_info value as "not found"
+NOT_FOUND_MARKER = "__not_found__"
+
+# Sorted set of unknown words by number of lookups
+WORD_MISSES_KEY = "word_misses"
+WORD_MISSES_TTL = 7 * 86400
+
+
+def word_info_key(word: str) -> str:
+    """Get the cache key for a word's WordInfo."""
+    return make_cache_key("word_info", text=word)
+
+
+def is_not_found(value: Any) -> bool:
+    """Check whether a cached word_info value is a negative entry."""
+    return isinstance(value, dict) and NOT_FOUND_MARKER in value
+
+
+async def cache_not_found(word: str, tried: list[str]) -> None:
+    """
+    Cache that a word is not in the dictionary.
+
+    Args:
+        word: Word that was looked up
+        tried: Fallback terms that were tried
+    """
+    key = word_info_key(word)
+    try:
+        await cache_set(key, {NOT_FOUND_MARKER: 1, "tried": tried}, ttl=settings.cache_ttl_word_miss)
+    except Exception as e:
+        print(f"Negative cache write error: {e}")
+
+
+async def record_word_miss(word: str) -> None:
+    """Count a lookup of a word that is not in the dictionary."""
+    try:
+        await cache_zincr(WORD_MISSES_KEY, normalize_text(word), ttl=WORD_MISSES_TTL)
+    except Exception as e:
+        print(f"Word miss counter error: {e}")
+
+
+async def top_word_misses(limit: int = 50) -> list[dict[str, Any]]:
+    """
+    Get the most frequently looked-up unknown words.
+
+    Returns:
+        [{"word", "count"}], most frequent first
+    """
+    return [
+        {"word": word, "count": int(count)}
+        for word, count in await cache_ztop(WORD_MISSES_KEY, limit)
+    ]
+
@@ -3,7 +3,8 @@ from __future__ import annotations
 
 from typing import Optional
 
-from app.core.cache import cache_exists, cache_get, cache_set
+from app.core.cache import cache_exists, cache_get_or_compute
+from app.core.cache_keys import make_cache_key
 from app.core.config import get_settings
 from app.models.user import User
 from app.routers.word import ExplainResponse, GrammarBreakdown
@@ -35,30 +36,18 @@ class GrammarService:
         Returns:
             Detailed explanation with grammar breakdown
         """
-        # Check cache
-        cache_key = f"explain:{detail_level}:{sentence}"
-        cached = await cache_get(cache_key)
-        if cached:
-            return ExplainResponse(**cached)
-
-        # Use OpenAI for explanation
+        # Use OpenAI for explanation. Cached explanations are served stale while
+        # refreshing in the background; concurrent misses share one GPT call
+        cache_key = make_cache_key("explain", detail_level, text=sentence)
         try:
-            result = await self.openai_service.explain_grammar(sentence, detail_level)
-
-            response = ExplainResponse(
-                sentence=sentence,
-                explanation=result["explanation"],
-                grammar_breakdown=[
-                    GrammarBreakdown(**item) for item in result.get("breakdown", [])
-                ],
-                cultural_context=result.get("cultural_context"),
-                alternative_phrasings=result.get("alternatives", []),
+            data = await cache_get_or_compute(
+                cache_key,
+                lambda: self._explain_uncached(sentence, detail_level),
+                soft_ttl=settings.cache_soft_ttl_llm,
+                hard_ttl=settings.cache_hard_ttl_llm,
             )
-
-            # Cache result
-            await cache_set(cache_key, response.model_dump(), ttl=86400)  # 24 hours
-
-            return response
+            # The entry may come from a normalization-equivalent sentence
+            return ExplainResponse(**{**data, "sentence": sentence})
 
         except Exception as e:
             # Fallback to basic explanation
@@ -67,3 +56,18 @@ class GrammarService:
                 explanation=f"Sentence: {sentence}\n\n[Grammar explanation service is currently unavailable]",
                 grammar_breakdown=[],
             )
+
+    async def _explain_uncached(self, sentence: str, detail_level: str) -> dict:
+        """Ask OpenAI for an explanation without consulting the cache."""
+        result = await self.openai_service.explain_grammar(sentence, detail_level)
+
+        response = ExplainResponse(
+            sentence=sentence,
+            explanation=result["explanation"],
+            grammar_breakdown=[
+                GrammarBreakdown(**item) for item in result.get("breakdown", [])
+            ],
+            cultural_context=result.get("cultural_context"),
+            alternative_phrasings=result.get("alternatives", []),
+        )
+        return response.model_dump()
@@ -6,11 +6,18 @@ from typing import Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.cache import cache_get, cache_set
+from app.core.cache import cache_compute_once, cache_get, cache_set
 from app.models.user import User
 from app.models.word import JapaneseWord, WordExample
 from app.routers.word import KanjiInfo, WordInfo
+from app.services.dictionary_cache import (
+    cache_not_found,
+    is_not_found,
+    record_word_miss,
+    word_info_key,
+)
 from app.services.fallback_terms import FallbackTermsService
+from app.services.progress_tracker import get_progress_tracker
 
 
 class JDictService:
@@ -39,18 +46,47 @@ class JDictService:
 
         Args:
             word: Japanese word to look up
-            session: Database session
+            session: Database session used for dictionary lookups
             user: Current user (optional)
 
         Returns:
             Detailed word information
         """
-        # Check cache first for exact match
-        cache_key = f"word_info:{word}"
+        # Check cache first for exact match (may be a short-lived "not found" entry)
+        cache_key = word_info_key(word)
         cached = await cache_get(cache_key)
-        if cached:
+        if cached and not is_not_found(cached):
             return WordInfo(**cached)
 
+        if not cached:
+            # Look up the word (concurrent misses for the same word share one lookup)
+            cached = await cache_compute_once(
+                cache_key, lambda: self._lookup_uncached(word, session, user), ttl=86400
+            )
+            if cached and not is_not_found(cached):
+                return WordInfo(**cached)
+
+        # Word not found - even after fallback chain
+        # In future, could query external API (JMdict, etc.)
+        # For now, return message indicating word not in database
+        await record_word_miss(word)
+        if cached:
+            fallback_terms = cached["tried"]
+        else:
+            fallback_terms = await self.fallback_service.get_fallback_terms(word)
+        return WordInfo(
+            word=word,
+            reading=None,
+            romanji=None,
+            part_of_speech=None,
+            jlpt_level=None,
+            definition="[Word not found in database. Tried: " + ", ".join(fallback_terms) + "]",
+        )
+
+    async def _lookup_uncached(
+        self, word: str, session: AsyncSession, user: Optional[User]
+    ) -> Optional[dict]:
+        """Look up a word through the fallback chain without consulting the cache."""
         # Generate fallback terms using jidoujisho pattern
         fallback_terms = await self.fallback_service.get_fallback_terms(word)
 
@@ -104,55 +140,19 @@ class JDictService:
                 ],
             )
 
-            # Cache result (both original and found term)
-            await cache_set(cache_key, word_info.model_dump(), ttl=86400)
+            # Also cache under the found term (cache_compute_once stores the original)
             if found_term and found_term != word:
-                found_cache_key = f"word_info:{found_term}"
+                found_cache_key = word_info_key(found_term)
                 await cache_set(found_cache_key, word_info.model_dump(), ttl=86400)
 
-            # Track user progress
+            # Track user progress (buffered, flushed in the background)
             if user:
-                await self._track_word_view(session, user, word_obj)
+                get_progress_tracker().record_view(user.id, word_obj.id)
 
-            return word_info
+            return word_info.model_dump()
 
-        else:
-            # Word not found - even after fallback chain
-            # In future, could query external API (JMdict, etc.)
-            # For now, return message indicating word not in database
-            return WordInfo(
-                word=word,
-                reading=None,
-                romanji=None,
-                part_of_speech=None,
-                jlpt_level=None,
-                definition="[Word not found in database. Tried: " + ", ".join(fallback_terms) + "]",
-            )
-
-    async def _track_word_view(
-        self, session: AsyncSession, user: User, word: JapaneseWord
-    ) -> None:
-        """Track that user viewed this word."""
-        from datetime import datetime, timezone
-
-        from app.models.word import UserWordProgress
-
-        # Find or create progress record
-        result = await session.execute(
-            select(UserWordProgress).where(
-                UserWordProgress.user_id == user.id,
-                UserWordProgress.word_id == word.id,
-            )
-        )
-        progress = result.scalar_one_or_none()
-
-        if progress:
-            progress.times_seen += 1
-            progress.last_reviewed = datetime.now(timezone.utc)
-        else:
-            progress = UserWordProgress(
-                user_id=user.id, word_id=word.id, times_seen=1
-            )
-            session.add(progress)
+        # Cached here (not by cache_compute_once) so it gets the short miss TTL,
+        # and before the lease is released so waiting workers find it
+        await cache_not_found(word, fallback_terms)
+        return None
 
-        await session.commit()
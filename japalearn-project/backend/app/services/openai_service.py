@@ -7,6 +7,8 @@ from typing import Any, Optional
 
 from openai import AsyncOpenAI
 
+from app.core.cache import cache_get_or_compute
+from app.core.cache_keys import hash_text, make_cache_key
 from app.core.config import get_settings
 from app.core.s3 import upload_file
 from app.models.user import User
@@ -169,14 +171,32 @@ Format your response as JSON with this structure:
         if not self.client:
             raise ValueError("OpenAI API key not configured")
 
+        context_sentence = (context or {}).get("current_sentence")
+        cache_key = make_cache_key(
+            "answer", hash_text(context_sentence or ""), text=question
+        )
+
+        # Answers don't depend on the user, so they are shared and served
+        # stale while refreshing in the background
+        return await cache_get_or_compute(
+            cache_key,
+            lambda: self._answer_uncached(question, context_sentence),
+            soft_ttl=settings.cache_soft_ttl_llm,
+            hard_ttl=settings.cache_hard_ttl_llm,
+        )
+
+    async def _answer_uncached(
+        self, question: str, context_sentence: Optional[str]
+    ) -> dict[str, Any]:
+        """Ask the model to answer a question without consulting the cache."""
         system_prompt = """You are a helpful Japanese language tutor.
 Answer questions clearly and concisely with examples.
 Be encouraging and patient. Provide practical usage examples."""
 
         user_prompt = question
-        if context and context.get("current_sentence"):
+        if context_sentence:
             user_prompt = f"""Context: The student is studying this sentence:
-"{context['current_sentence']}"
+"{context_sentence}"
 
 Question: {question}"""
 
@@ -198,7 +218,11 @@ Question: {question}"""
         }
 
     async def chat_response(
-        self, conversation_id: str, message: str, session: Any
+        self,
+        conversation_id: str,
+        message: str,
+        session: Any,
+        summary: Optional[str] = None,
     ) -> dict[str, Any]:
         """
         Generate chat response in a conversation.
@@ -207,6 +231,7 @@ Question: {question}"""
             conversation_id: Conversation ID
             message: User's message
             session: Database session
+            summary: Rolling summary of earlier messages (optional)
 
         Returns:
             Response with text and optional audio
@@ -214,30 +239,18 @@ Question: {question}"""
         if not self.client:
             raise ValueError("OpenAI API key not configured")
 
-        # Get conversation history
-        from sqlalchemy import select
+        # Get recent conversation history
+        from app.services.chat_history import ChatHistoryService
+        from app.services.conversation_summary import ConversationSummaryService
 
-        from app.models.chat import ChatMessage
+        messages_history = await ChatHistoryService().get_window(session, conversation_id)
 
-        result = await session.execute(
-            select(ChatMessage)
-            .where(ChatMessage.conversation_id == conversation_id)
-            .order_by(ChatMessage.created_at.asc())
+        # Build conversation context: summary plus recent window, within budget
+        conversation = ConversationSummaryService(openai_service=self).build_messages(
+            system_prompt="You are a helpful Japanese language tutor. Be encouraging, clear, and provide practical examples.",
+            summary=summary,
+            window=messages_history + [{"role": "user", "content": message}],
         )
-        messages_history = result.scalars().all()
-
-        # Build conversation context
-        conversation = [
-            {
-                "role": "system",
-                "content": "You are a helpful Japanese language tutor. Be encouraging, clear, and provide practical examples.",
-            }
-        ]
-
-        for msg in messages_history[-10:]:  # Last 10 messages for context
-            conversation.append({"role": msg.role, "content": msg.content})
-
-        conversation.append({"role": "user", "content": message})
 
         # Generate response
         response = await self.client.chat.completions.create(
@@ -0,0 +1,197 @@
+"""Write-behind tracking of word views and clicks.
+
+Word lookups are on the hover path, so recording progress must not add a
+write transaction to every request. Events are counted in memory and
+flushed periodically as batched upserts:
+
+    INSERT ... ON CONFLICT (user_id, word_id)
+    DO UPDATE SET times_seen = times_seen + excluded.times_seen, ...
+"""
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy.exc import IntegrityError
+
+from app.core.config import get_settings
+from app.core.db import AsyncSessionLocal, dialect_insert
+from app.core.tasks import PeriodicTask
+from app.models.word import UserWordProgress
+
+settings = get_settings()
+
+
+class WordProgressTracker:
+    """Buffer per-user word events and flush them in batches."""
+
+    def __init__(self):
+        # (user_id, word_id) -> [views, clicks]
+        self._pending: dict[tuple[str, int], list[int]] = {}
+        self._flush_lock = asyncio.Lock()
+        # Strong references to early flushes so they are not garbage collected
+        self._flush_tasks: set[asyncio.Task] = set()
+        # (user_id, word_id) -> failed flushes of its buffered counts
+        self._attempts: dict[tuple[str, int], int] = {}
+        # Events discarded because the buffer was full (logged on flush)
+        self._dropped = 0
+        self._task = PeriodicTask(
+            "Word progress flush", settings.progress_flush_interval_seconds, self.flush
+        )
+
+    def record_view(self, user_id: str, word_id: int) -> None:
+        """Record that a user looked up a word."""
+        self._record(user_id, word_id, views=1)
+
+    def record_click(self, user_id: str, word_id: int) -> None:
+        """Record that a user clicked a word."""
+        self._record(user_id, word_id, clicks=1)
+
+    def _record(self, user_id: str, word_id: int, views: int = 0, clicks: int = 0) -> None:
+        key = (user_id, word_id)
+        if key not in self._pending and len(self._pending) >= settings.progress_max_buffered:
+            # Database is not keeping up; bound memory rather than queue forever
+            self._dropped += 1
+            return
+        counts = self._pending.setdefault(key, [0, 0])
+        counts[0] += views
+        counts[1] += clicks
+
+        # Flush early rather than letting a burst grow the buffer unbounded
+        if (
+            len(self._pending) >= settings.progress_max_pending
+            and not self._flush_lock.locked()
+            and not self._flush_tasks
+        ):
+            task = asyncio.get_running_loop().create_task(self.flush())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+    async def flush(self) -> int:
+        """
+        Write buffered events to the database.
+
+        Each chunk commits on its own. A chunk that violates a constraint
+        (e.g. the user or word was deleted) is retried row by row and the
+        failing rows are dropped. Other errors are treated as transient:
+        the unwritten counts go back into the buffer, up to
+        progress_flush_max_retries times per row.
+
+        Returns:
+            Number of (user, word) rows upserted
+        """
+        async with self._flush_lock:
+            if self._dropped:
+                print(f"Word progress buffer full, dropped {self._dropped} events")
+                self._dropped = 0
+            if not self._pending:
+                return 0
+
+            pending, self._pending = self._pending, {}
+            keys = list(pending)
+            now = datetime.now(timezone.utc)
+
+            insert = dialect_insert()
+            stmt = insert(UserWordProgress)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[UserWordProgress.user_id, UserWordProgress.word_id],
+                set_={
+                    "times_seen": UserWordProgress.times_seen + stmt.excluded.times_seen,
+                    "times_clicked": UserWordProgress.times_clicked + stmt.excluded.times_clicked,
+                    "last_reviewed": stmt.excluded.last_reviewed,
+                },
+            )
+
+            written = 0
+            batch_size = settings.progress_flush_batch_size
+            for start in range(0, len(keys), batch_size):
+                chunk = keys[start:start + batch_size]
+                rows = [self._row(key, pending[key], now) for key in chunk]
+                try:
+                    try:
+                        async with AsyncSessionLocal() as session:
+                            await session.execute(stmt, rows)
+                            await session.commit()
+                        written += len(rows)
+                    except IntegrityError:
+                        written += await self._flush_rows(stmt, rows)
+                except Exception as e:
+                    print(f"Word progress flush failed, retrying later: {e}")
+                    self._requeue({key: pending[key] for key in keys[start:]})
+                    break
+                for key in chunk:
+                    self._attempts.pop(key, None)
+
+            return written
+
+    @staticmethod
+    def _row(key: tuple[str, int], counts: list[int], now: datetime) -> dict:
+        user_id, word_id = key
+        return {
+            "id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "word_id": word_id,
+            "times_seen": counts[0],
+            "times_clicked": counts[1],
+            "mastery_level": 0,
+            "last_reviewed": now,
+            # Newly seen words enter the review queue right away
+            "next_review": now,
+        }
+
+    async def _flush_rows(self, stmt, rows: list[dict]) -> int:
+        """Upsert rows one by one (savepoint each), dropping those that violate constraints."""
+        written = 0
+        async with AsyncSessionLocal() as session:
+            for row in rows:
+                try:
+                    async with session.begin_nested():
+                        await session.execute(stmt, [row])
+                    written += 1
+                except IntegrityError as e:
+                    print(
+                        f"Dropping word progress for user {row['user_id']}, "
+                        f"word {row['word_id']}: {e.orig}"
+                    )
+                    self._attempts.pop((row["user_id"], row["word_id"]), None)
+            await session.commit()
+        return written
+
+    def _requeue(self, unflushed: dict[tuple[str, int], list[int]]) -> None:
+        """Merge unflushed counts back into the buffer, dropping rows out of retries."""
+        dropped = 0
+        for key, (views, clicks) in unflushed.items():
+            attempts = self._attempts.get(key, 0) + 1
+            if attempts > settings.progress_flush_max_retries:
+                self._attempts.pop(key, None)
+                dropped += 1
+                continue
+            self._attempts[key] = attempts
+            counts = self._pending.setdefault(key, [0, 0])
+            counts[0] += views
+            counts[1] += clicks
+        if dropped:
+            print(f"Dropping word progress for {dropped} rows after repeated flush failures")
+
+    def start(self) -> None:
+        """Start the periodic flush loop."""
+        self._task.start()
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write any remaining events."""
+        await self._task.stop()
+        await self.flush()
+
+
+# Tracker singleton (one buffer per worker)
+_tracker: Optional[WordProgressTracker] = None
+
+
+def get_progress_tracker() -> WordProgressTracker:
+    """Get word progress tracker instance."""
+    global _tracker
+    if _tracker is None:
+        _tracker = WordProgressTracker()
+    return _tracker
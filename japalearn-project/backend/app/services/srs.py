@@ -0,0 +1,58 @@
+"""Spaced-repetition scheduling (SM-2)."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from app.models.word import UserWordProgress
+
+
+class SRSScheduler:
+    """Schedule word reviews using the SM-2 algorithm.
+
+    Grades follow SM-2's 0-5 scale: 0-2 are failed recalls that reset the
+    card, 3-5 are successful recalls of increasing ease.
+    """
+
+    MIN_EASE = 1.3
+    PASSING_GRADE = 3
+    MAX_MASTERY = 5
+    LEARNED_MASTERY = 3  # Mastery at which a word counts as learned
+
+    def apply_grade(
+        self, progress: UserWordProgress, grade: int, reviewed_at: datetime
+    ) -> None:
+        """
+        Update a progress record with the result of a review.
+
+        Args:
+            progress: Progress record to update in place
+            grade: Recall quality (0-5)
+            reviewed_at: When the review happened
+        """
+        ease = progress.ease_factor or 2.5
+        repetitions = progress.repetitions or 0
+        interval = progress.interval_days or 0
+
+        if grade >= self.PASSING_GRADE:
+            if repetitions == 0:
+                interval = 1
+            elif repetitions == 1:
+                interval = 6
+            else:
+                interval = max(1, round(interval * ease))
+            repetitions += 1
+        else:
+            # Failed recall: start the card over
+            repetitions = 0
+            interval = 1
+
+        # Every grade adjusts ease as in SM-2, so failures also make the
+        # card harder (down to MIN_EASE)
+        ease += 0.1 - (5 - grade) * (0.08 + (5 - grade) * 0.02)
+
+        progress.ease_factor = max(self.MIN_EASE, ease)
+        progress.repetitions = repetitions
+        progress.interval_days = interval
+        progress.mastery_level = min(repetitions, self.MAX_MASTERY)
+        progress.last_reviewed = reviewed_at
+        progress.next_review = reviewed_at + timedelta(days=interval)
@@ -0,0 +1,122 @@
+"""Batched, atomic counters for user statistics.
+
+Incrementing ``user.total_translations`` on a loaded ORM object is a
+read-modify-write that loses updates under concurrent requests. Instead,
+increments are accumulated per worker and flushed periodically as
+
+    UPDATE users SET total_translations = total_translations + :n
+
+so the database applies every delta atomically.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Optional
+
+from sqlalchemy import bindparam, update
+
+from app.core.config import get_settings
+from app.core.db import AsyncSessionLocal
+from app.core.tasks import PeriodicTask
+from app.models.user import User
+
+settings = get_settings()
+
+# Counter columns on the users table
+STAT_FIELDS = ("total_translations", "total_words_learned")
+
+
+class UserStatsCounter:
+    """Accumulate user stat increments and flush them as atomic updates."""
+
+    def __init__(self):
+        # user_id -> {field: delta}
+        self._pending: dict[str, dict[str, int]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._task = PeriodicTask(
+            "User stats flush", settings.stats_flush_interval_seconds, self.flush
+        )
+
+    def increment(self, user_id: str, field: str, amount: int = 1) -> None:
+        """
+        Add to a user's counter.
+
+        Args:
+            user_id: User to update
+            field: Counter name (one of STAT_FIELDS)
+            amount: Delta to apply (may be negative)
+        """
+        if field not in STAT_FIELDS:
+            raise ValueError(f"Unknown stat field: {field}")
+        if amount == 0:
+            return
+
+        counts = self._pending.setdefault(user_id, dict.fromkeys(STAT_FIELDS, 0))
+        counts[field] += amount
+
+    def pending(self, user_id: str) -> dict[str, int]:
+        """Get increments for a user that have not been flushed yet."""
+        return dict(self._pending.get(user_id) or dict.fromkeys(STAT_FIELDS, 0))
+
+    async def flush(self) -> int:
+        """
+        Apply buffered increments to the users table.
+
+        Returns:
+            Number of users updated
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            pending, self._pending = self._pending, {}
+
+            table = User.__table__
+            stmt = (
+                update(table)
+                .where(table.c.id == bindparam("b_user_id"))
+                .values(
+                    {
+                        field: table.c[field] + bindparam(f"b_{field}")
+                        for field in STAT_FIELDS
+                    }
+                )
+            )
+            params = [
+                {"b_user_id": user_id, **{f"b_{f}": n for f, n in counts.items()}}
+                for user_id, counts in pending.items()
+            ]
+
+            try:
+                async with AsyncSessionLocal() as session:
+                    await session.execute(stmt, params)
+                    await session.commit()
+            except Exception as e:
+                print(f"User stats flush failed, retrying later: {e}")
+                for user_id, counts in pending.items():
+                    for field, amount in counts.items():
+                        self.increment(user_id, field, amount)
+                return 0
+
+            return len(params)
+
+    def start(self) -> None:
+        """Start the periodic flush loop."""
+        self._task.start()
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write any remaining increments."""
+        await self._task.stop()
+        await self.flush()
+
+
+# Counter singleton (one buffer per worker)
+_counter: Optional[UserStatsCounter] = None
+
+
+def get_stats_counter() -> UserStatsCounter:
+    """Get user stats counter instance."""
+    global _counter
+    if _counter is None:
+        _counter = UserStatsCounter()
+    return _counter
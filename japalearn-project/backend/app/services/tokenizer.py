@@ -3,6 +3,10 @@ from __future__ import annotations
 
 from typing import Any
 
+from app.core.cache import cache_get, cache_get_many, cache_set, cache_set_many
+from app.core.cache_keys import make_cache_key
+from app.core.config import get_settings
+
 try:
     from sudachipy import Dictionary, tokenizer
 
@@ -17,6 +21,8 @@ try:
 except ImportError:
     PYKAKASI_AVAILABLE = False
 
+settings = get_settings()
+
 
 class TokenizerService:
     """Japanese text tokenization and morphological analysis."""
@@ -48,36 +54,89 @@ class TokenizerService:
             # Fallback: simple character-based splitting
             return self._fallback_tokenize(text)
 
+        # Surfaces echo the input, so the key uses the exact text
+        cache_key = make_cache_key("tokens", text=text, normalize=False)
         try:
-            tokens = self.tokenizer_obj.tokenize(text, self.mode)
-            result = []
-
-            for token in tokens:
-                # Get token information
-                surface = token.surface()  # Original word
-                reading = token.reading_form()  # Hiragana reading
-                base_form = token.dictionary_form()  # Dictionary form
-                pos = token.part_of_speech()[0]  # Part of speech
-
-                # Convert reading to romanji (simplified)
-                romanji = self._to_romanji(reading)
-
-                result.append(
-                    {
-                        "surface": surface,
-                        "reading": reading,
-                        "romanji": romanji,
-                        "base_form": base_form,
-                        "pos": pos,
-                    }
-                )
-
-            return result
+            cached = await cache_get(cache_key)
+            if cached is not None:
+                return cached
+        except Exception as e:
+            print(f"Token cache read error: {e}")
 
+        try:
+            result = self._analyze(text)
         except Exception as e:
             print(f"Tokenization error: {e}")
             return self._fallback_tokenize(text)
 
+        try:
+            await cache_set(cache_key, result, ttl=settings.cache_ttl_tokens)
+        except Exception as e:
+            print(f"Token cache write error: {e}")
+
+        return result
+
+    async def tokenize_batch(self, texts: list[str]) -> list[list[dict[str, Any]]]:
+        """
+        Tokenize several texts, reading and writing the cache in one round trip each.
+
+        Args:
+            texts: Japanese texts to tokenize
+
+        Returns:
+            Token lists aligned with texts
+        """
+        if not SUDACHI_AVAILABLE or not self.tokenizer_obj:
+            return [self._fallback_tokenize(text) for text in texts]
+
+        cache_keys = [make_cache_key("tokens", text=text, normalize=False) for text in texts]
+        try:
+            results = await cache_get_many(cache_keys)
+        except Exception as e:
+            print(f"Token cache read error: {e}")
+            results = [None] * len(texts)
+
+        analyzed = {}
+        for i, text in enumerate(texts):
+            if results[i] is not None:
+                continue
+            try:
+                results[i] = analyzed[cache_keys[i]] = self._analyze(text)
+            except Exception as e:
+                print(f"Tokenization error: {e}")
+                results[i] = self._fallback_tokenize(text)
+
+        try:
+            await cache_set_many(analyzed, ttl=settings.cache_ttl_tokens)
+        except Exception as e:
+            print(f"Token cache write error: {e}")
+
+        return results
+
+    def _analyze(self, text: str) -> list[dict[str, Any]]:
+        """Run Sudachi over text and build token dictionaries."""
+        result = []
+        for token in self.tokenizer_obj.tokenize(text, self.mode):
+            # Get token information
+            surface = token.surface()  # Original word
+            reading = token.reading_form()  # Hiragana reading
+            base_form = token.dictionary_form()  # Dictionary form
+            pos = token.part_of_speech()[0]  # Part of speech
+
+            # Convert reading to romanji (simplified)
+            romanji = self._to_romanji(reading)
+
+            result.append(
+                {
+                    "surface": surface,
+                    "reading": reading,
+                    "romanji": romanji,
+                    "base_form": base_form,
+                    "pos": pos,
+                }
+            )
+        return result
+
     def _fallback_tokenize(self, text: str) -> list[dict[str, Any]]:
         """Simple fallback tokenization (character-based)."""
         return [
@@ -0,0 +1,227 @@
+"""Hedged, deadline-bounded calls to translation providers.
+
+The primary provider is called first. If it has not answered after its
+recent latency percentile (translation_hedge_percentile), the secondary
+provider is called as well and the first valid answer wins; a primary
+failure starts the secondary immediately. Every call is bounded by
+translation_deadline_seconds.
+
+Latency samples and win counts are kept per provider (per worker) so
+the percentile and deadline can be tuned from data.
+"""
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from app.core.config import get_settings
+from app.services.translation_providers import (
+    Reference,
+    TranslationError,
+    TranslationProvider,
+    get_translation_provider,
+)
+
+settings = get_settings()
+
+T = TypeVar("T")
+
+# Recent latency samples kept per provider
+LATENCY_WINDOW = 500
+
+
+class ProviderStats:
+    """Call outcomes and a sliding window of latencies for one provider."""
+
+    def __init__(self):
+        self.calls = 0
+        self.failures = 0
+        self.races = 0  # Calls that ran alongside another provider
+        self.wins = 0  # Races whose answer was used
+        self.hedges = 0  # Times this provider was slow and a hedge was started
+        self.latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Get the p-th percentile of recent latencies (seconds), if any."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, math.ceil(p / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get counts, win rate and latency percentiles in milliseconds."""
+
+        def ms(value: Optional[float]) -> Optional[float]:
+            return round(value * 1000, 1) if value is not None else None
+
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "hedges": self.hedges,
+            "races": self.races,
+            "wins": self.wins,
+            "win_rate": self.wins / self.races if self.races else None,
+            "samples": len(self.latencies),
+            "p50_ms": ms(self.percentile(50)),
+            "p95_ms": ms(self.percentile(95)),
+            "p99_ms": ms(self.percentile(99)),
+        }
+
+
+# Provider name -> stats (per worker)
+_stats: dict[str, ProviderStats] = {}
+
+
+def _provider_stats(name: str) -> ProviderStats:
+    stats = _stats.get(name)
+    if stats is None:
+        stats = _stats[name] = ProviderStats()
+    return stats
+
+
+def get_provider_stats() -> dict[str, dict[str, Any]]:
+    """Get latency and win statistics per translation provider for this worker."""
+    return {name: stats.snapshot() for name, stats in _stats.items()}
+
+
+class HedgedTranslator:
+    """Translate through a primary provider, hedging with a secondary one."""
+
+    def __init__(
+        self,
+        primary: Optional[TranslationProvider] = None,
+        secondary: Optional[TranslationProvider] = None,
+    ):
+        """
+        Args:
+            primary: Defaults to settings.default_translation_provider
+            secondary: Defaults to settings.translation_secondary_provider
+                (no hedging if unset)
+        """
+        self.primary = primary or get_translation_provider()
+        if secondary is None and settings.translation_secondary_provider:
+            secondary = get_translation_provider(settings.translation_secondary_provider)
+        self.secondary = secondary if secondary is not self.primary else None
+
+    @property
+    def max_batch_size(self) -> int:
+        """Largest batch every provider in the race accepts."""
+        sizes = [self.primary.max_batch_size]
+        if self.secondary:
+            sizes.append(self.secondary.max_batch_size)
+        return min(sizes)
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait for the primary before starting the secondary."""
+        stats = _provider_stats(self.primary.name)
+        delay = settings.translation_hedge_default_delay_seconds
+        if len(stats.latencies) >= settings.translation_hedge_min_samples:
+            delay = stats.percentile(settings.translation_hedge_percentile)
+        return max(settings.translation_hedge_min_delay_seconds, delay)
+
+    async def translate(
+        self, text: str, source: str, target: str, reference: Optional[Reference] = None
+    ) -> tuple[str, str]:
+        """
+        Translate text.
+
+        Args:
+            reference: Similar (source, translation) pair passed to providers
+                that use it as context
+
+        Returns:
+            (translated text, name of the provider that answered)
+
+        Raises:
+            TranslationError: If no provider answered validly before the deadline
+        """
+        return await self._run(
+            lambda provider: provider.translate(text, source, target, reference),
+            lambda result: bool(result and result.strip()),
+        )
+
+    async def translate_batch(
+        self, texts: list[str], source: str, target: str
+    ) -> tuple[list[str], str]:
+        """
+        Translate several texts in one provider call.
+
+        Returns:
+            (translations in order, name of the provider that answered)
+
+        Raises:
+            TranslationError: If no provider answered validly before the deadline
+        """
+        return await self._run(
+            lambda provider: provider.translate_batch(texts, source, target),
+            lambda results: len(results) == len(texts),
+        )
+
+    async def _run(
+        self,
+        call: Callable[[TranslationProvider], Awaitable[T]],
+        valid: Callable[[T], bool],
+    ) -> tuple[T, str]:
+        """Race the providers under the deadline and return the first valid answer."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.translation_deadline_seconds
+        started: dict[asyncio.Task, tuple[TranslationProvider, float]] = {}
+        errors: list[str] = []
+
+        def start(provider: TranslationProvider) -> asyncio.Task:
+            _provider_stats(provider.name).calls += 1
+            task = loop.create_task(call(provider))
+            started[task] = (provider, time.perf_counter())
+            return task
+
+        pending = {start(self.primary)}
+        hedge_at = loop.time() + self.hedge_delay() if self.secondary else None
+
+        try:
+            while pending:
+                now = loop.time()
+                if now >= deadline:
+                    break
+                wake = min(deadline, hedge_at) if hedge_at is not None else deadline
+                done, pending = await asyncio.wait(
+                    pending, timeout=wake - now, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in done:
+                    provider, began = started[task]
+                    stats = _provider_stats(provider.name)
+                    error = task.exception()
+                    if error is None and valid(task.result()):
+                        stats.latencies.append(time.perf_counter() - began)
+                        if len(started) > 1:
+                            for raced in {p.name for p, _ in started.values()}:
+                                _provider_stats(raced).races += 1
+                            stats.wins += 1
+                        return task.result(), provider.name
+                    stats.failures += 1
+                    errors.append(f"{provider.name}: {error or 'invalid response'}")
+
+                if hedge_at is not None and (loop.time() >= hedge_at or not pending):
+                    # Primary is slow (or already failed): start the secondary
+                    if pending:
+                        _provider_stats(self.primary.name).hedges += 1
+                    pending.add(start(self.secondary))
+                    hedge_at = None
+        finally:
+            for task in pending:
+                task.cancel()
+                provider, began = started[task]
+                # Lower bound, so slow providers still raise their percentiles
+                _provider_stats(provider.name).latencies.append(time.perf_counter() - began)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        if pending or not errors:
+            raise TranslationError(
+                f"No translation within {settings.translation_deadline_seconds}s"
+            )
+        raise TranslationError("; ".join(errors))
@@ -0,0 +1,295 @@
+"""Translation memory: reuse past translations across users.
+
+Provider translations are stored under a hash of the normalized source
+text (same normalization as cache keys), so an identical sentence never
+goes back to the provider even after its cache entry expires. Only exact
+matches are served.
+
+Sources are also indexed by character trigrams. A near-identical
+sentence, whose Dice coefficient
+
+    2 * |shared trigrams| / (|trigrams of a| + |trigrams of b|)
+
+reaches translation_memory_fuzzy_threshold, is never served: a changed
+number, name or negation keeps the score high but changes the meaning.
+It is passed to LLM providers as a reference translation instead, and
+only when both texts contain the same numbers, so digits such as another
+learner's phone number never reach the prompt.
+Candidates come from the inverted index, restricted to entries whose
+trigram count can reach the threshold at all.
+"""
+from __future__ import annotations
+
+import hashlib
+import math
+import re
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache_keys import normalize_text
+from app.core.config import get_settings
+from app.core.db import AsyncSessionLocal, ReadSessionLocal, dialect_insert
+from app.models.translation import TranslationMemory, TranslationMemoryNgram
+
+settings = get_settings()
+
+NGRAM_SIZE = 3
+
+# Entries sharing the most trigrams to score per fuzzy lookup
+FUZZY_CANDIDATES = 20
+
+# Posting-list rows aggregated per fuzzy lookup at most, closest in size first
+FUZZY_SCAN_LIMIT = 5000
+
+# translation_service of responses served from memory
+MEMORY_SERVICE = "translation_memory"
+
+
+@dataclass(frozen=True)
+class MemoryMatch:
+    """A stored translation matching a source text."""
+
+    source_text: str  # Stored (normalized) source
+    translated_text: str
+    similarity: float  # Dice coefficient of the sources' trigrams (1.0 if exact)
+
+
+_NUMBER = re.compile(r"\d+")
+
+
+def source_hash(normalized: str) -> str:
+    """Hash a normalized source text."""
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def ngrams(normalized: str) -> set[str]:
+    """Get the distinct character trigrams of a normalized text (case-folded, padded)."""
+    padded = f" {normalized.casefold()} "
+    if len(padded) <= NGRAM_SIZE:
+        return {padded}
+    return {padded[i : i + NGRAM_SIZE] for i in range(len(padded) - NGRAM_SIZE + 1)}
+
+
+class TranslationMemoryService:
+    """Look up and store translations in the translation memory."""
+
+    async def lookup(self, text: str, source: str, target: str) -> Optional[MemoryMatch]:
+        """
+        Find the stored translation of exactly this (normalized) text.
+
+        Args:
+            text: Source text
+            source: Source language code
+            target: Target language code
+
+        Returns:
+            Exact match, or None (also when the lookup fails)
+        """
+        return (await self.lookup_many([text], source, target))[0]
+
+    async def lookup_many(
+        self, texts: list[str], source: str, target: str
+    ) -> list[Optional[MemoryMatch]]:
+        """
+        Find stored translations of several texts in one query (exact matches only).
+
+        Returns:
+            Matches aligned with texts, None where nothing matched
+        """
+        matches: list[Optional[MemoryMatch]] = [None] * len(texts)
+        if not settings.enable_translation_memory or not texts:
+            return matches
+
+        normalized = [normalize_text(text) for text in texts]
+        hashes = [source_hash(n) for n in normalized]
+        try:
+            async with ReadSessionLocal() as session:
+                result = await session.execute(
+                    select(TranslationMemory.source_hash, TranslationMemory.translated_text).where(
+                        TranslationMemory.source_lang == source,
+                        TranslationMemory.target_lang == target,
+                        TranslationMemory.source_hash.in_(set(hashes)),
+                    )
+                )
+                exact = dict(result.all())
+        except Exception as e:
+            print(f"Translation memory lookup error: {e}")
+            return matches
+
+        for i, digest in enumerate(hashes):
+            if digest in exact:
+                matches[i] = MemoryMatch(normalized[i], exact[digest], 1.0)
+        return matches
+
+    async def similar(self, text: str, source: str, target: str) -> Optional[MemoryMatch]:
+        """
+        Find the most similar stored source, as a reference for the provider.
+
+        The match may differ in numbers, names or negation, so its
+        translation must not be served as is.
+
+        Returns:
+            Best match at or above the fuzzy threshold, or None (also when
+            the lookup fails)
+        """
+        if not settings.enable_translation_memory:
+            return None
+        try:
+            async with ReadSessionLocal() as session:
+                return await self._fuzzy(session, normalize_text(text), source, target)
+        except Exception as e:
+            print(f"Translation memory lookup error: {e}")
+            return None
+
+    async def _fuzzy(
+        self, session: AsyncSession, normalized: str, source: str, target: str
+    ) -> Optional[MemoryMatch]:
+        """Find the most similar stored source at or above the fuzzy threshold."""
+        length = len(normalized)
+        if not (
+            settings.translation_memory_fuzzy_min_chars
+            <= length
+            <= settings.translation_memory_fuzzy_max_chars
+        ):
+            return None
+
+        grams = ngrams(normalized)
+        count = len(grams)
+        threshold = settings.translation_memory_fuzzy_threshold
+        # Dice >= t requires the other trigram count m within these bounds,
+        # and at least t * (count + m) / 2 shared trigrams
+        min_count = math.ceil(count * threshold / (2 - threshold))
+        max_count = math.floor(count * (2 - threshold) / threshold)
+        min_shared = math.ceil(threshold * (count + min_count) / 2)
+
+        # Size-filtered posting lists, read from the lookup index only. The
+        # cap keeps common trigrams from blowing up the aggregation; entries
+        # closest in size to the query (which Dice favors) are kept, with
+        # memory_id as a tie-break so the same reference is found every time.
+        # Past the cap the reference is best-effort.
+        postings = (
+            select(TranslationMemoryNgram.memory_id, TranslationMemoryNgram.ngram_count)
+            .where(
+                TranslationMemoryNgram.source_lang == source,
+                TranslationMemoryNgram.target_lang == target,
+                TranslationMemoryNgram.ngram.in_(grams),
+                TranslationMemoryNgram.ngram_count.between(min_count, max_count),
+            )
+            .order_by(
+                func.abs(TranslationMemoryNgram.ngram_count - count),
+                TranslationMemoryNgram.memory_id,
+            )
+            .limit(FUZZY_SCAN_LIMIT)
+            .subquery()
+        )
+        shared = func.count().label("shared")
+        candidates = (
+            select(postings.c.memory_id, postings.c.ngram_count, shared)
+            .group_by(postings.c.memory_id, postings.c.ngram_count)
+            .having(shared >= min_shared)
+            .order_by(shared.desc())
+            .limit(FUZZY_CANDIDATES)
+            .subquery()
+        )
+        result = await session.execute(
+            select(
+                TranslationMemory.source_text,
+                TranslationMemory.translated_text,
+                candidates.c.ngram_count,
+                candidates.c.shared,
+            ).join(candidates, candidates.c.memory_id == TranslationMemory.id)
+        )
+
+        numbers = _NUMBER.findall(normalized)
+        best: Optional[MemoryMatch] = None
+        for source_text, translated_text, ngram_count, shared_count in result.all():
+            similarity = 2 * shared_count / (count + ngram_count)
+            if _NUMBER.findall(source_text) != numbers:
+                continue
+            if similarity >= threshold and (best is None or similarity > best.similarity):
+                best = MemoryMatch(source_text, translated_text, similarity)
+        return best
+
+    async def remember(
+        self,
+        entries: list[tuple[str, str]],
+        source: str,
+        target: str,
+        translation_service: str,
+    ) -> int:
+        """
+        Store provider translations, keeping the first translation of each source.
+
+        Args:
+            entries: (source text, translated text) pairs
+            source: Source language code
+            target: Target language code
+            translation_service: Provider that produced the translations
+
+        Returns:
+            Number of new entries (0 if storing fails)
+        """
+        if not settings.enable_translation_memory or not entries:
+            return 0
+
+        rows: dict[str, dict] = {}
+        grams_by_id: dict[str, set[str]] = {}
+        for text, translated_text in entries:
+            normalized = normalize_text(text)
+            digest = source_hash(normalized)
+            if not normalized or digest in rows:
+                continue
+            memory_id = str(uuid.uuid4())
+            grams = ngrams(normalized)
+            grams_by_id[memory_id] = grams
+            rows[digest] = {
+                "id": memory_id,
+                "source_lang": source,
+                "target_lang": target,
+                "source_hash": digest,
+                "source_text": normalized,
+                "translated_text": translated_text,
+                "translation_service": translation_service,
+                "ngram_count": len(grams),
+            }
+        if not rows:
+            return 0
+
+        insert = dialect_insert()
+        try:
+            async with AsyncSessionLocal() as session:
+                await session.execute(
+                    insert(TranslationMemory).on_conflict_do_nothing(
+                        index_elements=["source_lang", "target_lang", "source_hash"]
+                    ),
+                    list(rows.values()),
+                )
+                # Rows that lost a conflict keep the other writer's id
+                result = await session.execute(
+                    select(TranslationMemory.id).where(TranslationMemory.id.in_(grams_by_id))
+                )
+                inserted = list(result.scalars().all())
+                ngram_rows = [
+                    {
+                        "source_lang": source,
+                        "target_lang": target,
+                        "ngram": gram,
+                        "memory_id": memory_id,
+                        "ngram_count": len(grams_by_id[memory_id]),
+                    }
+                    for memory_id in inserted
+                    for gram in grams_by_id[memory_id]
+                ]
+                if ngram_rows:
+                    await session.execute(
+                        insert(TranslationMemoryNgram).on_conflict_do_nothing(), ngram_rows
+                    )
+                await session.commit()
+        except Exception as e:
+            print(f"Translation memory write error: {e}")
+            return 0
+        return len(inserted)
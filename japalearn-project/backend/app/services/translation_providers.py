@@ -0,0 +1,362 @@
+"""Pluggable machine translation backends.
+
+Providers share the pooled client from app.core.http and each applies
+its own timeout. The active provider is chosen by
+settings.default_translation_provider:
+
+- local_llm: Ollama (ollama_base_url / ollama_model)
+- google_cloud: Google Cloud Translation v2 (google_cloud_api_key)
+- deepl: DeepL (deepl_api_key; free-tier keys end in ":fx")
+- googletrans: unofficial googletrans client, run in a thread
+- stub: deterministic local output for tests and offline development
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Optional
+
+import httpx
+
+from app.core.config import get_settings
+from app.core.http import get_http_client
+
+try:
+    from googletrans import Translator
+
+    GOOGLETRANS_AVAILABLE = True
+except (ImportError, AttributeError):
+    # 4.0.0rc1 fails to import next to the httpx version we pin
+    GOOGLETRANS_AVAILABLE = False
+
+settings = get_settings()
+
+# Language names used in LLM prompts
+LANGUAGE_NAMES = {
+    "en": "English",
+    "ja": "Japanese",
+    "zh": "Chinese",
+    "ko": "Korean",
+    "es": "Spanish",
+    "fr": "French",
+    "de": "German",
+}
+
+
+# (source text, translated text) of a similar, previously translated sentence
+Reference = tuple[str, str]
+
+
+class TranslationError(Exception):
+    """Raised when a provider cannot translate text."""
+
+
+class TranslationProvider(ABC):
+    """Async machine translation backend."""
+
+    name: str
+    # Texts per translate_batch call (a request for native batch APIs,
+    # concurrent requests otherwise)
+    max_batch_size: int = 8
+    # Whether translate() uses a reference translation as context
+    uses_reference: bool = False
+
+    def __init__(self, timeout: float):
+        """
+        Args:
+            timeout: Seconds allowed per request to the backend
+        """
+        self.timeout = timeout
+
+    @abstractmethod
+    async def translate(
+        self, text: str, source: str, target: str, reference: Optional[Reference] = None
+    ) -> str:
+        """
+        Translate text.
+
+        Args:
+            text: Text to translate
+            source: Source language code
+            target: Target language code
+            reference: (source, translation) of a similar sentence, used as
+                context by providers with uses_reference; others ignore it
+
+        Returns:
+            Translated text
+
+        Raises:
+            TranslationError: If the backend fails or is not configured
+        """
+
+    async def translate_batch(self, texts: list[str], source: str, target: str) -> list[str]:
+        """
+        Translate several texts, in order.
+
+        Providers with a native batch API override this; the default
+        translates concurrently.
+        """
+        return list(await asyncio.gather(*(self.translate(t, source, target) for t in texts)))
+
+    async def translate_stream(
+        self, text: str, source: str, target: str, reference: Optional[Reference] = None
+    ) -> AsyncIterator[str]:
+        """
+        Translate text, yielding the translation in pieces as it is generated.
+
+        Providers without streaming yield the whole translation at once.
+
+        Raises:
+            TranslationError: If the backend fails or is not configured
+        """
+        yield await self.translate(text, source, target, reference)
+
+    async def _post(self, url: str, **kwargs) -> dict:
+        """POST to the backend and return its JSON body."""
+        try:
+            response = await get_http_client().post(url, timeout=self.timeout, **kwargs)
+            response.raise_for_status()
+            return response.json()
+        except httpx.TimeoutException as e:
+            raise TranslationError(f"{self.name} timed out after {self.timeout}s") from e
+        except httpx.HTTPError as e:
+            raise TranslationError(f"{self.name} request failed: {e}") from e
+        except ValueError as e:
+            raise TranslationError(f"{self.name} returned invalid JSON") from e
+
+
+class OllamaProvider(TranslationProvider):
+    """Local LLM served by Ollama."""
+
+    name = "local_llm"
+    uses_reference = True
+
+    def prompt(
+        self, text: str, source: str, target: str, reference: Optional[Reference] = None
+    ) -> str:
+        """Build the translation prompt."""
+        source_name = LANGUAGE_NAMES.get(source, source)
+        target_name = LANGUAGE_NAMES.get(target, target)
+        context = ""
+        if reference:
+            context = (
+                "A similar sentence was translated before; follow its wording where "
+                "the meaning is the same, but translate numbers, names and negation "
+                "from the text itself.\n"
+                f"{source_name}: {reference[0]}\n{target_name}: {reference[1]}\n\n"
+            )
+        return (
+            f"Translate the following {source_name} text into natural {target_name}. "
+            "Reply with the translation only, without notes or quotes.\n\n"
+            f"{context}{text}"
+        )
+
+    def request(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        stream: bool,
+        reference: Optional[Reference] = None,
+    ) -> dict:
+        """Build the /api/generate request body."""
+        return {
+            "model": settings.ollama_model,
+            "prompt": self.prompt(text, source, target, reference),
+            "stream": stream,
+            "options": {"temperature": 0},
+        }
+
+    @property
+    def generate_url(self) -> str:
+        """Ollama generate endpoint."""
+        return f"{settings.ollama_base_url.rstrip('/')}/api/generate"
+
+    async def translate(
+        self, text: str, source: str, target: str, reference: Optional[Reference] = None
+    ) -> str:
+        data = await self._post(
+            self.generate_url, json=self.request(text, source, target, False, reference)
+        )
+        translated = data.get("response", "").strip()
+        if not translated:
+            raise TranslationError("local_llm returned an empty translation")
+        return translated
+
+    async def translate_stream(
+        self, text: str, source: str, target: str, reference: Optional[Reference] = None
+    ) -> AsyncIterator[str]:
+        """Yield generated pieces as Ollama streams them (one JSON object per line)."""
+        started = False
+        try:
+            async with get_http_client().stream(
+                "POST",
+                self.generate_url,
+                json=self.request(text, source, target, True, reference),
+                timeout=self.timeout,
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line.strip():
+                        continue
+                    chunk = json.loads(line)
+                    if chunk.get("error"):
+                        raise TranslationError(f"local_llm failed: {chunk['error']}")
+                    piece = chunk.get("response", "")
+                    if not started:
+                        # Models often open with whitespace
+                        piece = piece.lstrip()
+                        started = bool(piece)
+                    if piece:
+                        yield piece
+                    if chunk.get("done"):
+                        break
+        except httpx.TimeoutException as e:
+            raise TranslationError(f"local_llm timed out after {self.timeout}s") from e
+        except httpx.HTTPError as e:
+            raise TranslationError(f"local_llm request failed: {e}") from e
+        except ValueError as e:
+            raise TranslationError("local_llm returned invalid JSON") from e
+        if not started:
+            raise TranslationError("local_llm returned an empty translation")
+
+
+class GoogleCloudProvider(TranslationProvider):
+    """Google Cloud Translation API (v2, API key auth)."""
+
+    name = "google_cloud"
+    max_batch_size = 128  # API limit on q entries
+    url = "https://translation.googleapis.com/language/translate/v2"
+
+    async def translate(
+        self, text: str, source: str, target: str, reference: Optional[Reference] = None
+    ) -> str:
+        return (await self.translate_batch([text], source, target))[0]
+
+    async def translate_batch(self, texts: list[str], source: str, target: str) -> list[str]:
+        if not settings.google_cloud_api_key:
+            raise TranslationError("google_cloud_api_key is not set")
+        data = await self._post(
+            self.url,
+            params={"key": settings.google_cloud_api_key},
+            json={"q": texts, "source": source, "target": target, "format": "text"},
+        )
+        try:
+            return [t["translatedText"] for t in data["data"]["translations"]]
+        except (KeyError, TypeError) as e:
+            raise TranslationError("google_cloud returned an unexpected response") from e
+
+
+class DeepLProvider(TranslationProvider):
+    """DeepL API."""
+
+    name = "deepl"
+    max_batch_size = 50  # API limit on text entries
+
+    @staticmethod
+    def target_code(language: str) -> str:
+        """DeepL requires a regional variant for English and Portuguese targets."""
+        return {"en": "EN-US", "pt": "PT-BR"}.get(language, language.upper())
+
+    def endpoint(self) -> str:
+        """Free-tier keys use a separate host."""
+        host = "api-free.deepl.com" if settings.deepl_api_key.endswith(":fx") else "api.deepl.com"
+        return f"https://{host}/v2/translate"
+
+    async def translate(
+        self, text: str, source: str, target: str, reference: Optional[Reference] = None
+    ) -> str:
+        return (await self.translate_batch([text], source, target))[0]
+
+    async def translate_batch(self, texts: list[str], source: str, target: str) -> list[str]:
+        if not settings.deepl_api_key:
+            raise TranslationError("deepl_api_key is not set")
+        data = await self._post(
+            self.endpoint(),
+            headers={"Authorization": f"DeepL-Auth-Key {settings.deepl_api_key}"},
+            json={
+                "text": texts,
+                "source_lang": source.upper(),
+                "target_lang": self.target_code(target),
+            },
+        )
+        try:
+            return [t["text"] for t in data["translations"]]
+        except (KeyError, TypeError) as e:
+            raise TranslationError("deepl returned an unexpected response") from e
+
+
+class GoogletransProvider(TranslationProvider):
+    """Unofficial googletrans client; it is synchronous, so calls run in a thread."""
+
+    name = "googletrans"
+
+    def __init__(self, timeout: float):
+        super().__init__(timeout)
+        self.translator = Translator() if GOOGLETRANS_AVAILABLE else None
+
+    async def translate(
+        self, text: str, source: str, target: str, reference: Optional[Reference] = None
+    ) -> str:
+        if self.translator is None:
+            raise TranslationError("googletrans is not installed")
+        try:
+            result = await asyncio.wait_for(
+                asyncio.to_thread(self.translator.translate, text, src=source, dest=target),
+                timeout=self.timeout,
+            )
+        except asyncio.TimeoutError as e:
+            raise TranslationError(f"googletrans timed out after {self.timeout}s") from e
+        except Exception as e:
+            raise TranslationError(f"googletrans failed: {e}") from e
+        return result.text
+
+
+class StubProvider(TranslationProvider):
+    """Deterministic offline provider for tests and local development."""
+
+    name = "stub"
+    max_batch_size = 1000
+
+    async def translate(
+        self, text: str, source: str, target: str, reference: Optional[Reference] = None
+    ) -> str:
+        return f"[{source}->{target}] {text}"
+
+
+# Provider name -> (class, settings attribute holding its timeout)
+PROVIDERS: dict[str, tuple[type[TranslationProvider], str]] = {
+    "local_llm": (OllamaProvider, "translation_timeout_local_llm"),
+    "google_cloud": (GoogleCloudProvider, "translation_timeout_google_cloud"),
+    "deepl": (DeepLProvider, "translation_timeout_deepl"),
+    "googletrans": (GoogletransProvider, "translation_timeout_googletrans"),
+    "stub": (StubProvider, "translation_timeout_stub"),
+}
+
+# Provider singletons by name
+_providers: dict[str, TranslationProvider] = {}
+
+
+def get_translation_provider(name: Optional[str] = None) -> TranslationProvider:
+    """
+    Get a translation provider.
+
+    Args:
+        name: Provider name (defaults to settings.default_translation_provider)
+
+    Returns:
+        Provider instance
+
+    Raises:
+        ValueError: If the provider name is unknown
+    """
+    name = name or settings.default_translation_provider
+    if name not in _providers:
+        if name not in PROVIDERS:
+            raise ValueError(
+                f"Unknown translation provider {name!r}; expected one of {', '.join(PROVIDERS)}"
+            )
+        provider_class, timeout_setting = PROVIDERS[name]
+        _providers[name] = provider_class(timeout=getattr(settings, timeout_setting))
+    return _providers[name]
@@ -1,23 +1,44 @@
-"""Translation service using Google Translate."""
+"""Translation service backed by the configured translation provider."""
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, AsyncIterator, Optional
 
-from googletrans import Translator
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.cache import cache_exists, cache_get, cache_set
+from app.core.cache import (
+    cache_exists,
+    cache_get_or_compute,
+    cache_get_or_compute_many,
+    cache_get_swr,
+    cache_set_swr,
+)
+from app.core.cache_keys import make_cache_key
+from app.core.config import get_settings
+from app.core.db import pin_to_primary
 from app.models.user import User
 from app.routers.translate import TranslateResponse, WordToken
+from app.services.stats_counter import get_stats_counter
 from app.services.tokenizer import TokenizerService
+from app.services.translation_hedging import HedgedTranslator
+from app.services.translation_memory import MEMORY_SERVICE, TranslationMemoryService
+from app.services.translation_providers import (
+    Reference,
+    TranslationError,
+    get_translation_provider,
+)
+
+settings = get_settings()
 
 
 class TranslatorService:
     """Handle translation between languages."""
 
     def __init__(self):
-        self.translator = Translator()
+        self.provider = get_translation_provider()
+        self.hedged = HedgedTranslator(self.provider)
         self.tokenizer = TokenizerService()
+        self.memory = TranslationMemoryService()
 
     async def translate(
         self,
@@ -40,43 +61,322 @@ class TranslatorService:
         Returns:
             TranslateResponse with translation and word tokens
         """
-        # Check cache
-        cache_key = f"translate:{source}:{target}:{text}"
-        cached = await cache_get(cache_key)
-        if cached:
-            return TranslateResponse(**cached)
+        # Cached translations are served stale while refreshing in the background;
+        # concurrent misses for the same text share one call
+        cache_key = make_cache_key("translate", source, target, text=text)
+        try:
+            data = await cache_get_or_compute(
+                cache_key,
+                lambda: self._translate_uncached(text, source, target),
+                soft_ttl=settings.cache_soft_ttl_llm,
+                hard_ttl=settings.cache_ttl_translations,
+            )
+        except TranslationError as e:
+            # Not cached, and not stored in history
+            print(f"Translation error ({self.provider.name}): {e}")
+            return TranslateResponse(
+                original=text,
+                translated=f"[Translation Error: {str(e)}]",
+                source_lang=source,
+                target_lang=target,
+                translation_service=self.provider.name,
+            )
+        # The entry may come from a normalization-equivalent text
+        response = TranslateResponse(**{**data, "original": text})
+
+        # Store in user history
+        if user:
+            await self._record_history(response, session, user)
+
+        return response
+
+    async def translate_stream(
+        self,
+        text: str,
+        source: str,
+        target: str,
+        session: AsyncSession,
+        user: Optional[User] = None,
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """
+        Translate text, yielding the translation as the provider generates it.
+
+        Cached and translation-memory hits arrive as a single delta. The
+        provider is called directly: streaming is not hedged or coalesced
+        with concurrent callers.
+
+        Args:
+            text: Text to translate
+            source: Source language code
+            target: Target language code
+            session: Database session
+            user: Current user (optional)
+
+        Yields:
+            ("delta", {"text"}) for each generated piece, then ("done",
+            TranslateResponse fields) with the word breakdown, or
+            ("error", {"detail"}) if the provider fails
+        """
+        cache_key = make_cache_key("translate", source, target, text=text)
+        data = await cache_get_swr(cache_key)
+        if data is None:
+            match = await self.memory.lookup(text, source, target)
+            if match:
+                yield "delta", {"text": match.translated_text}
+                translated_text, service = match.translated_text, MEMORY_SERVICE
+            else:
+                reference = await self._reference(text, source, target)
+                pieces = []
+                try:
+                    async for piece in self.provider.translate_stream(
+                        text, source, target, reference
+                    ):
+                        if not piece:
+                            continue
+                        pieces.append(piece)
+                        yield "delta", {"text": piece}
+                    translated_text, service = "".join(pieces).strip(), self.provider.name
+                    if not translated_text:
+                        raise TranslationError(f"{service} returned an empty translation")
+                except TranslationError as e:
+                    # Not remembered, cached or stored in history
+                    print(f"Streaming translation error ({self.provider.name}): {e}")
+                    yield "error", {"detail": f"Translation failed: {str(e)}"}
+                    return
+                await self.memory.remember([(text, translated_text)], source, target, service)
+
+            tokens = None
+            if target == "ja":
+                try:
+                    tokens = await self.tokenizer.tokenize(translated_text)
+                except Exception as e:
+                    print(f"Tokenization error: {e}")
+            data = self._build_response(text, translated_text, tokens, source, target, service)
+            await cache_set_swr(
+                cache_key,
+                data,
+                soft_ttl=settings.cache_soft_ttl_llm,
+                hard_ttl=settings.cache_ttl_translations,
+            )
+        else:
+            yield "delta", {"text": data["translated"]}
+
+        response = TranslateResponse(**{**data, "original": text})
+        if user:
+            await self._record_history(response, session, user)
+        yield "done", response.model_dump()
+
+    async def _record_history(
+        self, response: TranslateResponse, session: AsyncSession, user: User
+    ) -> None:
+        """Store a translation in the user's history."""
+        from app.models.translation import UserTranslation
+
+        translation_record = UserTranslation(
+            user_id=user.id,
+            source_text=response.original,
+            source_lang=response.source_lang,
+            translated_text=response.translated,
+            target_lang=response.target_lang,
+            translation_service=response.translation_service,
+        )
+        session.add(translation_record)
+        await session.commit()
+        get_stats_counter().increment(user.id, "total_translations")
+        await pin_to_primary(user.id)
+
+    async def translate_batch(
+        self,
+        texts: list[str],
+        source: str,
+        target: str,
+        session: AsyncSession,
+        user: Optional[User] = None,
+    ) -> list[TranslateResponse]:
+        """
+        Translate many texts with one cache round trip and batched provider calls.
+
+        Inputs that normalize to the same cache key are translated once.
+        Cached entries are read with a single MGET, misses go to the
+        provider in chunks of its max_batch_size, Japanese outputs are
+        tokenized together, and history is written in one bulk insert.
+
+        Args:
+            texts: Texts to translate
+            source: Source language code
+            target: Target language code
+            session: Database session
+            user: Current user (optional)
+
+        Returns:
+            TranslateResponse per input text, in order
+        """
+        keys = [make_cache_key("translate", source, target, text=text) for text in texts]
+        # First input text per distinct key
+        unique: dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            unique.setdefault(key, text)
+
+        async def compute_many(missing_keys: list[str]) -> list[dict]:
+            return await self._translate_many_uncached(
+                [unique[key] for key in missing_keys], source, target
+            )
 
-        # Translate
         try:
-            result = self.translator.translate(text, src=source, dest=target)
-            translated_text = result.text
-        except Exception as e:
-            # Fallback: if googletrans fails, use simple echo for now
-            # In production, use Google Cloud Translate API
-            translated_text = f"[Translation Error: {str(e)}]"
-
-        # Tokenize if target is Japanese
-        words = []
-        romanji = None
+            data = await cache_get_or_compute_many(
+                list(unique),
+                compute_many,
+                soft_ttl=settings.cache_soft_ttl_llm,
+                hard_ttl=settings.cache_ttl_translations,
+            )
+        except TranslationError as e:
+            # Not cached, and not stored in history
+            print(f"Batch translation error ({self.provider.name}): {e}")
+            return [
+                TranslateResponse(
+                    original=text,
+                    translated=f"[Translation Error: {str(e)}]",
+                    source_lang=source,
+                    target_lang=target,
+                    translation_service=self.provider.name,
+                )
+                for text in texts
+            ]
+        by_key = dict(zip(unique, data))
+        responses = [
+            TranslateResponse(**{**by_key[key], "original": text})
+            for key, text in zip(keys, texts)
+        ]
+
+        # Store in user history
+        if user and responses:
+            from app.models.translation import UserTranslation
+
+            await session.execute(
+                insert(UserTranslation),
+                [
+                    {
+                        "user_id": user.id,
+                        "source_text": response.original,
+                        "source_lang": source,
+                        "translated_text": response.translated,
+                        "target_lang": target,
+                        "translation_service": response.translation_service,
+                    }
+                    for response in responses
+                ],
+            )
+            await session.commit()
+            get_stats_counter().increment(user.id, "total_translations", len(responses))
+            await pin_to_primary(user.id)
+
+        return responses
+
+    async def _translate_uncached(self, text: str, source: str, target: str) -> dict:
+        """
+        Translate and tokenize text without consulting the cache.
+
+        Exact translation memory matches skip the provider; a similar
+        entry is passed to it as a reference.
+
+        Raises:
+            TranslationError: If the provider fails
+        """
+        match = await self.memory.lookup(text, source, target)
+        if match:
+            translated_text, service = match.translated_text, MEMORY_SERVICE
+        else:
+            reference = await self._reference(text, source, target)
+            translated_text, service = await self.hedged.translate(
+                text, source, target, reference
+            )
+            await self.memory.remember([(text, translated_text)], source, target, service)
+
+        tokens = None
         if target == "ja":
             try:
                 tokens = await self.tokenizer.tokenize(translated_text)
-                words = [
-                    WordToken(
-                        word=t["surface"],
-                        reading=t.get("reading"),
-                        romanji=t.get("romanji"),
-                        part_of_speech=t.get("pos"),
-                        base_form=t.get("base_form"),
-                        position=i,
-                    )
-                    for i, t in enumerate(tokens)
-                ]
-                # Generate romanji for full sentence
-                romanji = " ".join([w.romanji or w.word for w in words if w.romanji])
             except Exception as e:
                 print(f"Tokenization error: {e}")
 
+        return self._build_response(text, translated_text, tokens, source, target, service)
+
+    async def _translate_many_uncached(
+        self, texts: list[str], source: str, target: str
+    ) -> list[dict]:
+        """
+        Translate and tokenize texts without consulting the translation cache.
+
+        Texts found in the translation memory (exact matches) skip the provider.
+
+        Raises:
+            TranslationError: If the provider fails
+        """
+        matches = await self.memory.lookup_many(texts, source, target)
+        translated: list[str] = [m.translated_text if m else "" for m in matches]
+        services = [MEMORY_SERVICE if m else self.provider.name for m in matches]
+
+        missing = [i for i, match in enumerate(matches) if match is None]
+        size = self.hedged.max_batch_size
+        for start in range(0, len(missing), size):
+            chunk = missing[start : start + size]
+            results, service = await self.hedged.translate_batch(
+                [texts[i] for i in chunk], source, target
+            )
+            for i, result in zip(chunk, results):
+                translated[i] = result
+                services[i] = service
+            await self.memory.remember(
+                [(texts[i], translated[i]) for i in chunk], source, target, service
+            )
+
+        token_lists: list[Optional[list[dict]]] = [None] * len(texts)
+        if target == "ja":
+            try:
+                token_lists = await self.tokenizer.tokenize_batch(translated)
+            except Exception as e:
+                print(f"Tokenization error: {e}")
+
+        return [
+            self._build_response(text, translated_text, tokens, source, target, service)
+            for text, translated_text, tokens, service in zip(
+                texts, translated, token_lists, services
+            )
+        ]
+
+    async def _reference(self, text: str, source: str, target: str) -> Optional[Reference]:
+        """Get a similar stored translation as context, if the provider uses one."""
+        if not self.provider.uses_reference:
+            return None
+        match = await self.memory.similar(text, source, target)
+        return (match.source_text, match.translated_text) if match else None
+
+    def _build_response(
+        self,
+        text: str,
+        translated_text: str,
+        tokens: Optional[list[dict]],
+        source: str,
+        target: str,
+        service: str,
+    ) -> dict:
+        """Build a serialized TranslateResponse from a translation and its tokens."""
+        words = [
+            WordToken(
+                word=t["surface"],
+                reading=t.get("reading"),
+                romanji=t.get("romanji"),
+                part_of_speech=t.get("pos"),
+                base_form=t.get("base_form"),
+                position=i,
+            )
+            for i, t in enumerate(tokens or [])
+        ]
+        # Generate romanji for full sentence
+        romanji = " ".join([w.romanji or w.word for w in words if w.romanji])
+        if tokens is None:
+            romanji = None
+
         response = TranslateResponse(
             original=text,
             translated=translated_text,
@@ -84,26 +384,7 @@ class TranslatorService:
             source_lang=source,
             target_lang=target,
             words=words,
-            translation_service="googletrans",
+            translation_service=service,
         )
 
-        # Cache result
-        await cache_set(cache_key, response.model_dump(), ttl=86400)  # 24 hours
-
-        # Store in user history
-        if user:
-            from app.models.translation import UserTranslation
-
-            translation_record = UserTranslation(
-                user_id=user.id,
-                source_text=text,
-                source_lang=source,
-                translated_text=translated_text,
-                target_lang=target,
-                translation_service="googletrans",
-            )
-            session.add(translation_record)
-            user.total_translations += 1
-            await session.commit()
-
-        return response
+        return response.model_dump()
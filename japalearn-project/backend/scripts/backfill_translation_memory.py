@@ -0,0 +1,81 @@
+"""
+Backfill the translation memory from translation history.
+
+Streams user_translations oldest first and stores each distinct
+(normalized) source text once, keeping its earliest translation. Failed
+translations, and responses that were themselves served from the
+translation memory, are skipped. Safe to re-run: existing entries are kept.
+
+Usage:
+    python scripts/backfill_translation_memory.py
+    python scripts/backfill_translation_memory.py --batch-size 1000
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import func, select
+
+from app.core.db import AsyncSessionLocal, close_db
+from app.models.translation import UserTranslation
+from app.services.translation_memory import TranslationMemoryService
+
+ERROR_PREFIX = "[Translation Error"
+
+# translation_service of responses served from the memory: exact matches
+# are already stored, and fuzzy matches may carry another sentence's meaning
+SKIPPED_SERVICES = ("translation_memory", "translation_memory_fuzzy")
+
+
+async def backfill(batch_size: int) -> None:
+    """Store history translations in the translation memory."""
+    memory = TranslationMemoryService()
+    scanned = 0
+    stored = 0
+
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(
+            select(
+                UserTranslation.source_text,
+                UserTranslation.translated_text,
+                UserTranslation.source_lang,
+                UserTranslation.target_lang,
+                UserTranslation.translation_service,
+            )
+            .where(
+                ~UserTranslation.translated_text.startswith(ERROR_PREFIX),
+                ~func.coalesce(UserTranslation.translation_service, "").in_(SKIPPED_SERVICES),
+            )
+            .order_by(UserTranslation.created_at)
+            .execution_options(yield_per=batch_size)
+        )
+        async for rows in result.partitions(batch_size):
+            groups: dict[tuple[str, str, str], list[tuple[str, str]]] = {}
+            for source_text, translated_text, source, target, service in rows:
+                groups.setdefault((source, target, service or "unknown"), []).append(
+                    (source_text, translated_text)
+                )
+            for (source, target, service), entries in groups.items():
+                stored += await memory.remember(entries, source, target, service)
+            scanned += len(rows)
+            print(f"Scanned {scanned} translations, stored {stored} new entries")
+
+    print(f"\n✅ Backfill completed: {stored} entries from {scanned} translations")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    try:
+        await backfill(args.batch_size)
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,156 @@
+"""
+Benchmark cache value encodings.
+
+Compares the legacy json.dumps text format with the binary cache codec
+(orjson/msgpack, zlib/zstd compression) on representative payloads:
+encoded size, encode time, and decode time (the cache hit path).
+
+Usage:
+    python scripts/benchmark_cache_codec.py
+    python scripts/benchmark_cache_codec.py --redis redis://localhost:6379
+
+With --redis, each encoded payload is also written to Redis and the
+server-reported MEMORY USAGE of the key is shown.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.cache_codec import (
+    MSGPACK_AVAILABLE,
+    ORJSON_AVAILABLE,
+    ZSTD_AVAILABLE,
+    CacheCodec,
+)
+
+SENTENCE = "明日は友達と一緒に新しいレストランで晩ご飯を食べる予定です。"
+
+
+def translate_payload(repeat: int) -> dict:
+    """A TranslateResponse-shaped payload with tokenized words."""
+    words = [
+        {
+            "word": ch,
+            "reading": ch,
+            "romanji": "ashita",
+            "part_of_speech": "名詞",
+            "base_form": ch,
+            "position": i,
+        }
+        for i, ch in enumerate(SENTENCE * repeat)
+    ]
+    return {
+        "original": "I plan to eat dinner at a new restaurant with a friend tomorrow.",
+        "translated": SENTENCE * repeat,
+        "romanji": "ashita wa tomodachi to issho ni atarashii resutoran de bangohan",
+        "source_lang": "en",
+        "target_lang": "ja",
+        "words": words,
+        "translation_service": "googletrans",
+    }
+
+
+def explain_payload() -> dict:
+    """An ExplainResponse-shaped payload."""
+    return {
+        "sentence": SENTENCE,
+        "explanation": "This sentence describes a plan for tomorrow. " * 20,
+        "grammar_breakdown": [
+            {
+                "part": part,
+                "role": "particle",
+                "explanation": f"{part} marks the preceding phrase. " * 5,
+            }
+            for part in ("は", "と", "に", "で", "を", "です")
+        ],
+        "cultural_context": "Dinner plans are often made casually among friends. " * 5,
+        "alternative_phrasings": [SENTENCE, SENTENCE.replace("です", "だ")],
+    }
+
+
+def word_payload() -> dict:
+    """A small WordInfo-shaped payload."""
+    return {
+        "word": "食べる",
+        "reading": "たべる",
+        "romanji": "taberu",
+        "part_of_speech": "verb",
+        "jlpt_level": 5,
+        "definition": "to eat",
+        "grammar_notes": None,
+        "kanji_breakdown": [{"character": "食", "meaning": "eat", "reading": "ショク"}],
+        "examples": [{"japanese": "ご飯を食べる。", "english": "Eat rice.", "romanji": None}],
+    }
+
+
+def codecs() -> dict[str, CacheCodec]:
+    """Codec configurations to compare."""
+    variants = {
+        "legacy json": CacheCodec(legacy=True),
+        "json": CacheCodec(serializer="json", compress_threshold=sys.maxsize),
+        "json+compress": CacheCodec(serializer="json", compress_threshold=1024),
+    }
+    if MSGPACK_AVAILABLE:
+        variants["msgpack"] = CacheCodec(serializer="msgpack", compress_threshold=sys.maxsize)
+        variants["msgpack+compress"] = CacheCodec(serializer="msgpack", compress_threshold=1024)
+    return variants
+
+
+def time_per_call(func, arg, iterations: int) -> float:
+    """Average microseconds per call."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func(arg)
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--redis", help="Redis URL for MEMORY USAGE measurements")
+    args = parser.parse_args()
+
+    redis_client = None
+    if args.redis:
+        import redis
+
+        redis_client = redis.Redis.from_url(args.redis)
+
+    payloads = {
+        "word_info": word_payload(),
+        "explain": explain_payload(),
+        "translate (short)": translate_payload(1),
+        "translate (long)": translate_payload(8),
+    }
+
+    print(f"orjson: {ORJSON_AVAILABLE}  msgpack: {MSGPACK_AVAILABLE}  zstd: {ZSTD_AVAILABLE}")
+    header = f"{'payload':<18} {'codec':<17} {'bytes':>8} {'encode us':>10} {'decode us':>10}"
+    if redis_client:
+        header += f" {'redis bytes':>12}"
+    print(header)
+    print("-" * len(header))
+
+    for payload_name, payload in payloads.items():
+        for codec_name, codec in codecs().items():
+            encoded = codec.encode(payload)
+            assert codec.decode(encoded) == payload
+            line = (
+                f"{payload_name:<18} {codec_name:<17} {len(encoded):>8} "
+                f"{time_per_call(codec.encode, payload, args.iterations):>10.1f} "
+                f"{time_per_call(codec.decode, encoded, args.iterations):>10.1f}"
+            )
+            if redis_client:
+                key = f"benchmark:codec:{payload_name}:{codec_name}"
+                redis_client.set(key, encoded)
+                line += f" {redis_client.memory_usage(key):>12}"
+                redis_client.delete(key)
+            print(line)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Fake Ollama server for local development and testing.
+
+Implements the parts of the Ollama API the backend uses:
+POST /api/generate (streaming and non-streaming) and GET /api/tags.
+Known phrases get a canned Japanese translation; anything else is echoed
+in brackets. Streamed responses are split into small pieces with a delay,
+like a real model generating tokens.
+
+Usage:
+    python scripts/fake_ollama.py --port 11435 --delay 0.05
+    OLLAMA_BASE_URL=http://localhost:11435 uvicorn app.main:app
+
+Options:
+    --delay     Seconds between streamed pieces
+    --fail      Answer every generate request with HTTP 500
+"""
+import argparse
+import json
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+TRANSLATIONS = {
+    "hello": "こんにちは",
+    "good morning": "おはようございます",
+    "thank you": "ありがとうございます",
+    "i would like to order a coffee, please.": "コーヒーを一つお願いします。",
+    "where is the train station?": "駅はどこですか？",
+    "how much is this?": "これはいくらですか？",
+}
+
+# Characters per streamed piece (roughly one model token of Japanese)
+PIECE_SIZE = 2
+
+
+def translate(prompt: str) -> str:
+    """Translate the text after the prompt's instructions (last paragraph)."""
+    text = prompt.rsplit("\n\n", 1)[-1].strip()
+    return TRANSLATIONS.get(text.lower(), f"「{text}」")
+
+
+class FakeOllamaHandler(BaseHTTPRequestHandler):
+    """Request handler; settings are attached to the server."""
+
+    def _send_json(self, status: int, body: dict) -> None:
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/api/tags":
+            self._send_json(200, {"models": [{"name": self.server.model}]})
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        if self.path != "/api/generate":
+            self._send_json(404, {"error": "not found"})
+            return
+
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": "invalid JSON"})
+            return
+        if self.server.fail:
+            self._send_json(500, {"error": "simulated failure"})
+            return
+
+        model = request.get("model", self.server.model)
+        translated = translate(request.get("prompt", ""))
+
+        if not request.get("stream", True):
+            time.sleep(self.server.delay * len(translated) / PIECE_SIZE)
+            self._send_json(200, self._chunk(model, translated, done=True))
+            return
+
+        # Newline-delimited JSON, ended by closing the connection (HTTP/1.0)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        for start in range(0, len(translated), PIECE_SIZE):
+            time.sleep(self.server.delay)
+            piece = translated[start : start + PIECE_SIZE]
+            self._write_line(self._chunk(model, piece, done=False))
+        self._write_line(self._chunk(model, "", done=True))
+
+    def _chunk(self, model: str, response: str, done: bool) -> dict:
+        return {
+            "model": model,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "response": response,
+            "done": done,
+        }
+
+    def _write_line(self, body: dict) -> None:
+        self.wfile.write(json.dumps(body, ensure_ascii=False).encode("utf-8") + b"\n")
+        self.wfile.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--delay", type=float, default=0.05)
+    parser.add_argument("--model", default="qwen2.5:14b-instruct-q4_K_M")
+    parser.add_argument("--fail", action="store_true")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), FakeOllamaHandler)
+    server.delay = args.delay
+    server.model = args.model
+    server.fail = args.fail
+    print(f"Fake Ollama listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import select
+from app.core.cache import bump_namespace, close_redis
 from app.core.db import AsyncSessionLocal, init_db
 from app.models.word import JapaneseWord, WordExample
 
@@ -338,6 +339,15 @@ async def import_words():
         print("\n✅ Import completed successfully!")
         print(f"Total words imported: {len(SAMPLE_WORDS)}")
 
+    # Cached word info (including "not found" entries) is now stale
+    try:
+        generation = await bump_namespace("word_info")
+        print(f"Invalidated cached word info (generation {generation})")
+    except Exception as e:
+        print(f"Could not invalidate cached word info: {e}")
+    finally:
+        await close_redis()
+
 
 async def verify_import():
     """Verify the import was successful."""